@@ -0,0 +1,410 @@
+"""Persistent storage backends used by CacheManager."""
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Tuple
+
+from ..utils.logging import get_logger
+
+logger = get_logger("cache_backends")
+
+
+class CacheBackend(ABC):
+    """
+    Storage interface behind CacheManager.
+
+    Backends receive already hashed storage keys; the original key is passed
+    alongside on writes so it can be recovered by get_all_keys().
+    """
+
+    def __init__(self, cache_dir: str, expiry_days: int):
+        self.cache_dir = cache_dir
+        self.expiry_days = expiry_days
+
+    @abstractmethod
+    def get(self, cache_type: str, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored entry or None if missing/expired."""
+
+    @abstractmethod
+    def set(self, cache_type: str, cache_key: str, original_key: str, data: Dict[str, Any]) -> None:
+        """Store an entry, replacing any existing one."""
+
+    @abstractmethod
+    def delete(self, cache_type: str, cache_key: str) -> bool:
+        """Delete an entry. Returns True if something was removed."""
+
+    @abstractmethod
+    def clear(self, cache_type: str) -> int:
+        """Delete all entries of a cache type and return how many were removed."""
+
+    @abstractmethod
+    def get_all_keys(self, cache_type: str) -> List[str]:
+        """Return the original keys stored under a cache type."""
+
+    @abstractmethod
+    def get_type_stats(self, cache_type: str) -> Tuple[int, int]:
+        """Return (entry count, size in bytes) for a cache type."""
+
+    @abstractmethod
+    def purge_expired(self) -> List[Tuple[str, str]]:
+        """Delete expired entries and return their (cache_type, cache_key) pairs."""
+
+    def close(self) -> None:
+        """Release backend resources."""
+
+
+class JSONFileCacheBackend(CacheBackend):
+    """One JSON file per entry under ``<cache_dir>/<cache_type>/<key>.json``."""
+
+    def _get_cache_path(self, cache_type: str, cache_key: str) -> Path:
+        """Get cache file path."""
+        return Path(self.cache_dir, cache_type, f"{cache_key}.json")
+
+    def _is_cache_valid(self, cache_path: Path) -> bool:
+        """Check if cache file is still valid."""
+        if not cache_path.exists():
+            return False
+
+        file_time = datetime.fromtimestamp(cache_path.stat().st_mtime)
+        expiry_time = datetime.now() - timedelta(days=self.expiry_days)
+        return file_time > expiry_time
+
+    def get(self, cache_type: str, cache_key: str) -> Optional[Dict[str, Any]]:
+        cache_path = self._get_cache_path(cache_type, cache_key)
+        if not self._is_cache_valid(cache_path):
+            return None
+
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def set(self, cache_type: str, cache_key: str, original_key: str, data: Dict[str, Any]) -> None:
+        cache_path = self._get_cache_path(cache_type, cache_key)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def delete(self, cache_type: str, cache_key: str) -> bool:
+        cache_path = self._get_cache_path(cache_type, cache_key)
+        if cache_path.exists():
+            cache_path.unlink()
+            return True
+        return False
+
+    def clear(self, cache_type: str) -> int:
+        count = 0
+        cache_dir = Path(self.cache_dir, cache_type)
+        if cache_dir.exists():
+            for cache_file in cache_dir.glob("*.json"):
+                try:
+                    cache_file.unlink()
+                    count += 1
+                except Exception as e:
+                    logger.error(f"Error deleting {cache_file}: {e}")
+        return count
+
+    def get_all_keys(self, cache_type: str) -> List[str]:
+        cache_dir = Path(self.cache_dir, cache_type)
+        if not cache_dir.exists():
+            return []
+
+        keys = []
+        for cache_file in cache_dir.glob("*.json"):
+            try:
+                # Try to read the file to get the original key
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if isinstance(data, dict) and 'key' in data:
+                    keys.append(data['key'])
+                else:
+                    # If 'key' not stored, use the filename without extension
+                    keys.append(cache_file.stem)
+            except Exception as e:
+                logger.warning(f"Error reading cache file {cache_file}: {e}")
+        return keys
+
+    def get_type_stats(self, cache_type: str) -> Tuple[int, int]:
+        cache_dir = Path(self.cache_dir, cache_type)
+        if not cache_dir.exists():
+            return 0, 0
+        files = list(cache_dir.glob("*.json"))
+        return len(files), sum(f.stat().st_size for f in files)
+
+    def purge_expired(self) -> List[Tuple[str, str]]:
+        purged = []
+        root = Path(self.cache_dir)
+        if not root.exists():
+            return purged
+        for cache_file in root.glob("*/*.json"):
+            try:
+                if not self._is_cache_valid(cache_file):
+                    cache_file.unlink()
+                    purged.append((cache_file.parent.name, cache_file.stem))
+            except Exception as e:
+                logger.warning(f"Error purging {cache_file}: {e}")
+        return purged
+
+
+class _SQLiteConnections:
+    """Per-thread SQLite connections in WAL mode for one database file."""
+
+    def __init__(self, db_path: str, schema: Tuple[str, ...]):
+        self.db_path = db_path
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        # sqlite3 connections must not be shared across threads; keep one per thread
+        self._local = threading.local()
+        self._all: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+        conn = self.get()
+        with conn:
+            for statement in schema:
+                conn.execute(statement)
+
+    def get(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._all.append(conn)
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._all:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._all.clear()
+        self._local = threading.local()
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Single-file SQLite store in WAL mode.
+
+    Expiry metadata lives in indexed columns so validity checks, key listing
+    and purges are index lookups instead of directory scans.
+    """
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS cache_entries (
+            cache_type TEXT NOT NULL,
+            cache_key TEXT NOT NULL,
+            original_key TEXT,
+            data TEXT NOT NULL,
+            size_bytes INTEGER NOT NULL,
+            created_at REAL NOT NULL,
+            expires_at REAL NOT NULL,
+            PRIMARY KEY (cache_type, cache_key)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_cache_entries_expires_at ON cache_entries (expires_at)",
+        "CREATE INDEX IF NOT EXISTS idx_cache_entries_type_expires_at ON cache_entries (cache_type, expires_at)",
+    )
+
+    def __init__(self, cache_dir: str, expiry_days: int, db_path: Optional[str] = None):
+        super().__init__(cache_dir, expiry_days)
+        self.db_path = db_path or str(Path(cache_dir, "cache.sqlite3"))
+        self._connections = _SQLiteConnections(self.db_path, self._SCHEMA)
+        logger.info(f"Initialized SQLite cache backend at {self.db_path}")
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection."""
+        return self._connections.get()
+
+    def get(self, cache_type: str, cache_key: str) -> Optional[Dict[str, Any]]:
+        row = self._get_connection().execute(
+            "SELECT data FROM cache_entries WHERE cache_type = ? AND cache_key = ? AND expires_at > ?",
+            (cache_type, cache_key, time.time())
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def set(self, cache_type: str, cache_key: str, original_key: str, data: Dict[str, Any]) -> None:
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        now = time.time()
+        conn = self._get_connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(cache_type, cache_key, original_key, data, size_bytes, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (cache_type, cache_key, original_key, payload, len(payload.encode('utf-8')),
+                 now, now + self.expiry_days * 86400)
+            )
+
+    def delete(self, cache_type: str, cache_key: str) -> bool:
+        conn = self._get_connection()
+        with conn:
+            cursor = conn.execute(
+                "DELETE FROM cache_entries WHERE cache_type = ? AND cache_key = ?",
+                (cache_type, cache_key)
+            )
+        return cursor.rowcount > 0
+
+    def clear(self, cache_type: str) -> int:
+        conn = self._get_connection()
+        with conn:
+            cursor = conn.execute("DELETE FROM cache_entries WHERE cache_type = ?", (cache_type,))
+        return cursor.rowcount
+
+    def get_all_keys(self, cache_type: str) -> List[str]:
+        rows = self._get_connection().execute(
+            "SELECT COALESCE(original_key, cache_key) FROM cache_entries WHERE cache_type = ? AND expires_at > ?",
+            (cache_type, time.time())
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_type_stats(self, cache_type: str) -> Tuple[int, int]:
+        row = self._get_connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM cache_entries WHERE cache_type = ?",
+            (cache_type,)
+        ).fetchone()
+        return int(row[0]), int(row[1])
+
+    def purge_expired(self) -> List[Tuple[str, str]]:
+        now = time.time()
+        conn = self._get_connection()
+        with conn:
+            purged = conn.execute(
+                "SELECT cache_type, cache_key FROM cache_entries WHERE expires_at <= ?", (now,)
+            ).fetchall()
+            conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        return [(row[0], row[1]) for row in purged]
+
+    def close(self) -> None:
+        self._connections.close()
+
+
+class CacheKeyIndex:
+    """
+    Secondary index from original keys and video IDs to stored cache entries.
+
+    Storage keys are hashes, so neither backend can answer "which entries
+    belong to this video" or "which keys start with this prefix" without a
+    full scan. The index answers both with B-tree lookups and is shared by
+    every backend.
+    """
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS cache_key_index (
+            cache_type TEXT NOT NULL,
+            original_key TEXT NOT NULL,
+            cache_key TEXT NOT NULL,
+            video_id TEXT,
+            PRIMARY KEY (cache_type, original_key)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_cache_key_index_video_id ON cache_key_index (video_id)",
+        "CREATE INDEX IF NOT EXISTS idx_cache_key_index_cache_key ON cache_key_index (cache_type, cache_key)",
+    )
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._connections = _SQLiteConnections(db_path, self._SCHEMA)
+
+    def add(self, cache_type: str, original_key: str, cache_key: str, video_id: Optional[str] = None) -> None:
+        """Record a stored entry, keeping a previously known video_id."""
+        conn = self._connections.get()
+        with conn:
+            conn.execute(
+                "INSERT INTO cache_key_index (cache_type, original_key, cache_key, video_id) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (cache_type, original_key) DO UPDATE SET "
+                "cache_key = excluded.cache_key, video_id = COALESCE(excluded.video_id, cache_key_index.video_id)",
+                (cache_type, original_key, cache_key, video_id)
+            )
+
+    def remove(self, cache_type: str, original_key: str) -> None:
+        conn = self._connections.get()
+        with conn:
+            conn.execute(
+                "DELETE FROM cache_key_index WHERE cache_type = ? AND original_key = ?",
+                (cache_type, original_key)
+            )
+
+    def remove_cache_keys(self, entries: List[Tuple[str, str]]) -> None:
+        """Drop index rows for stored entries given as (cache_type, cache_key) pairs."""
+        conn = self._connections.get()
+        with conn:
+            conn.executemany(
+                "DELETE FROM cache_key_index WHERE cache_type = ? AND cache_key = ?",
+                entries
+            )
+
+    def clear(self, cache_type: str) -> None:
+        conn = self._connections.get()
+        with conn:
+            conn.execute("DELETE FROM cache_key_index WHERE cache_type = ?", (cache_type,))
+
+    def get_keys(self, cache_type: str) -> List[Tuple[str, str]]:
+        """Return (original_key, cache_key) pairs for a cache type."""
+        rows = self._connections.get().execute(
+            "SELECT original_key, cache_key FROM cache_key_index WHERE cache_type = ?",
+            (cache_type,)
+        ).fetchall()
+        return [(row[0], row[1]) for row in rows]
+
+    def get_keys_with_prefix(self, cache_type: str, prefix: str) -> List[str]:
+        """Return original keys of a cache type that start with prefix."""
+        # A half-open range on the primary key is an index seek, unlike LIKE
+        rows = self._connections.get().execute(
+            "SELECT original_key FROM cache_key_index "
+            "WHERE cache_type = ? AND original_key >= ? AND original_key < ?",
+            (cache_type, prefix, prefix + "\U0010ffff")
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_video_entries(self, video_id: str) -> List[Tuple[str, str]]:
+        """Return (cache_type, original_key) pairs recorded for a video."""
+        rows = self._connections.get().execute(
+            "SELECT cache_type, original_key FROM cache_key_index WHERE video_id = ?",
+            (video_id,)
+        ).fetchall()
+        return [(row[0], row[1]) for row in rows]
+
+    def remove_video(self, video_id: str) -> None:
+        conn = self._connections.get()
+        with conn:
+            conn.execute("DELETE FROM cache_key_index WHERE video_id = ?", (video_id,))
+
+    def close(self) -> None:
+        self._connections.close()
+
+
+def create_cache_backend(
+    backend: str,
+    cache_dir: str,
+    expiry_days: int,
+    sqlite_path: Optional[str] = None
+) -> CacheBackend:
+    """
+    Create a cache backend by name.
+
+    Args:
+        backend: 'json' (default) or 'sqlite'
+        cache_dir: Root cache directory
+        expiry_days: Entry lifetime in days
+        sqlite_path: Optional database file for the SQLite backend
+
+    Raises:
+        ValueError: If the backend name is not supported
+    """
+    name = (backend or "json").lower()
+    if name == "json":
+        return JSONFileCacheBackend(cache_dir, expiry_days)
+    if name == "sqlite":
+        return SQLiteCacheBackend(cache_dir, expiry_days, db_path=sqlite_path)
+    raise ValueError(f"Unsupported cache backend: {backend}")
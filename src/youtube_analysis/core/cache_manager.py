@@ -3,12 +3,12 @@
 import os
 import json
 import hashlib
-from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Union, List, Tuple
 from dataclasses import dataclass
 
 from ..utils.logging import get_logger
+from .cache_backends import CacheBackend, CacheKeyIndex, create_cache_backend
 
 logger = get_logger("cache_manager")
 
@@ -19,6 +19,8 @@ class CacheConfig:
     expiry_days: int = 7
     max_size_mb: int = 500
     hash_algorithm: str = "sha256"
+    backend: str = "json"
+    sqlite_path: Optional[str] = None
 
 class CacheManager:
     """Unified cache manager for all caching operations."""
@@ -34,9 +36,18 @@ class CacheManager:
         self.config = config or CacheConfig(
             cache_dir=default_cache_dir,
             expiry_days=int(os.environ.get("CACHE_EXPIRY_DAYS", "7")),
-            max_size_mb=int(os.environ.get("CACHE_MAX_SIZE_MB", "500"))
+            max_size_mb=int(os.environ.get("CACHE_MAX_SIZE_MB", "500")),
+            backend=os.environ.get("CACHE_BACKEND", "json"),
+            sqlite_path=os.environ.get("CACHE_SQLITE_PATH") or None
         )
         self._setup_cache_directory()
+        self.backend: CacheBackend = create_cache_backend(
+            self.config.backend,
+            self.config.cache_dir,
+            self.config.expiry_days,
+            sqlite_path=self.config.sqlite_path
+        )
+        self.key_index = CacheKeyIndex(str(Path(self.config.cache_dir, "cache_index.sqlite3")))
     
     def _setup_cache_directory(self) -> None:
         """Setup cache directories."""
@@ -56,45 +67,32 @@ class CacheManager:
         else:
             return hashlib.sha256(data.encode()).hexdigest()
     
-    def _get_cache_path(self, cache_type: str, key: str) -> Path:
-        """Get cache file path."""
-        return Path(self.config.cache_dir, cache_type, f"{key}.json")
-    
-    def _is_cache_valid(self, cache_path: Path) -> bool:
-        """Check if cache file is still valid."""
-        if not cache_path.exists():
-            return False
-        
-        file_time = datetime.fromtimestamp(cache_path.stat().st_mtime)
-        expiry_time = datetime.now() - timedelta(days=self.config.expiry_days)
-        return file_time > expiry_time
-    
     def get(self, cache_type: str, key: str) -> Optional[Dict[str, Any]]:
         """Get cached data."""
         cache_key = self._get_cache_key(key)
-        cache_path = self._get_cache_path(cache_type, cache_key)
-        
-        if not self._is_cache_valid(cache_path):
-            return None
         
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            logger.debug(f"Cache hit for {cache_type}:{key[:20]}...")
+            data = self.backend.get(cache_type, cache_key)
+            if data is not None:
+                logger.debug(f"Cache hit for {cache_type}:{key[:20]}...")
             return data
         except Exception as e:
-            logger.warning(f"Error reading cache {cache_path}: {e}")
+            logger.warning(f"Error reading cache {cache_type}:{cache_key}: {e}")
             return None
     
-    def set(self, cache_type: str, key: str, data: Any) -> bool:
-        """Set cached data."""
+    def set(self, cache_type: str, key: str, data: Any, video_id: Optional[str] = None) -> bool:
+        """
+        Set cached data.
+        
+        Args:
+            cache_type: Type of cache (e.g., "analysis")
+            key: Original (unhashed) key
+            data: Data to store
+            video_id: Optional video the entry belongs to, recorded in the key index
+        """
         cache_key = self._get_cache_key(key)
-        cache_path = self._get_cache_path(cache_type, cache_key)
         
         try:
-            # Ensure the directory exists
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            
             # Ensure data is a dictionary or convert it to one
             if isinstance(data, str):
                 try:
@@ -114,15 +112,22 @@ class CacheManager:
             # Remove non-serializable objects
             clean_data = self._clean_data_for_serialization(data)
             
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(clean_data, f, ensure_ascii=False, indent=2)
+            self.backend.set(cache_type, cache_key, key, clean_data)
+            self._index_key(cache_type, key, cache_key, video_id)
             
             logger.debug(f"Cached {cache_type}:{key[:20]}...")
             return True
         except Exception as e:
-            logger.error(f"Error writing cache {cache_path}: {e}")
+            logger.error(f"Error writing cache {cache_type}:{cache_key}: {e}")
             return False
     
+    def _index_key(self, cache_type: str, key: str, cache_key: str, video_id: Optional[str]) -> None:
+        """Record a stored entry in the key index (failures only cost lookup precision)."""
+        try:
+            self.key_index.add(cache_type, key, cache_key, video_id)
+        except Exception as e:
+            logger.warning(f"Error indexing cache key {cache_type}:{key[:20]}...: {e}")
+    
     def _clean_data_for_serialization(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Remove non-serializable objects from data."""
         clean_data = {}
@@ -139,29 +144,25 @@ class CacheManager:
     def delete(self, cache_type: str, key: str) -> bool:
         """Delete cached data."""
         cache_key = self._get_cache_key(key)
-        cache_path = self._get_cache_path(cache_type, cache_key)
         
         try:
-            if cache_path.exists():
-                cache_path.unlink()
+            if self.backend.delete(cache_type, cache_key):
                 logger.debug(f"Deleted cache {cache_type}:{key[:20]}...")
+            self.key_index.remove(cache_type, key)
             return True
         except Exception as e:
-            logger.error(f"Error deleting cache {cache_path}: {e}")
+            logger.error(f"Error deleting cache {cache_type}:{cache_key}: {e}")
             return False
     
     def clear(self, cache_type: Optional[str] = None) -> int:
-        """Clear cache files."""
+        """Clear cache entries."""
         count = 0
         if cache_type:
-            cache_dir = Path(self.config.cache_dir, cache_type)
-            if cache_dir.exists():
-                for cache_file in cache_dir.glob("*.json"):
-                    try:
-                        cache_file.unlink()
-                        count += 1
-                    except Exception as e:
-                        logger.error(f"Error deleting {cache_file}: {e}")
+            try:
+                count = self.backend.clear(cache_type)
+                self.key_index.clear(cache_type)
+            except Exception as e:
+                logger.error(f"Error clearing cache {cache_type}: {e}")
         else:
             for subdir in ["analysis", "transcripts", "highlights"]:
                 count += self.clear(subdir)
@@ -169,21 +170,70 @@ class CacheManager:
         logger.info(f"Cleared {count} cache files")
         return count
     
+    def get_keys_with_prefix(self, cache_type: str, prefix: str) -> List[str]:
+        """Get original keys in a namespace that start with prefix, via the key index."""
+        try:
+            return self.key_index.get_keys_with_prefix(cache_type, prefix)
+        except Exception as e:
+            logger.error(f"Error looking up keys {cache_type}:{prefix}*: {e}")
+            return []
+    
+    def get_video_entries(self, video_id: str) -> List[Tuple[str, str]]:
+        """Get (cache_type, key) pairs recorded for a video in the key index."""
+        try:
+            return self.key_index.get_video_entries(video_id)
+        except Exception as e:
+            logger.error(f"Error looking up cache entries for video {video_id}: {e}")
+            return []
+    
+    def delete_video(self, video_id: str) -> int:
+        """
+        Delete every indexed entry that belongs to a video.
+        
+        Args:
+            video_id: Video ID
+            
+        Returns:
+            Number of entries deleted
+        """
+        entries = self.get_video_entries(video_id)
+        for cache_type, key in entries:
+            self.delete(cache_type, key)
+        try:
+            self.key_index.remove_video(video_id)
+        except Exception as e:
+            logger.warning(f"Error removing index entries for video {video_id}: {e}")
+        logger.debug(f"Deleted {len(entries)} indexed cache entries for video {video_id}")
+        return len(entries)
+    
+    def purge_expired(self) -> int:
+        """Remove expired entries from the persistent store and the key index."""
+        try:
+            purged = self.backend.purge_expired()
+            if purged:
+                self.key_index.remove_cache_keys(purged)
+            logger.info(f"Purged {len(purged)} expired cache entries")
+            return len(purged)
+        except Exception as e:
+            logger.error(f"Error purging expired cache entries: {e}")
+            return 0
+    
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        stats = {"total_files": 0, "total_size_mb": 0, "by_type": {}}
+        stats = {"total_files": 0, "total_size_mb": 0, "by_type": {}, "backend": self.config.backend}
         
         for cache_type in ["analysis", "transcripts", "highlights"]:
-            cache_dir = Path(self.config.cache_dir, cache_type)
-            if cache_dir.exists():
-                files = list(cache_dir.glob("*.json"))
-                size_bytes = sum(f.stat().st_size for f in files)
-                stats["by_type"][cache_type] = {
-                    "files": len(files),
-                    "size_mb": round(size_bytes / (1024 * 1024), 2)
-                }
-                stats["total_files"] += len(files)
-                stats["total_size_mb"] += stats["by_type"][cache_type]["size_mb"]
+            try:
+                files, size_bytes = self.backend.get_type_stats(cache_type)
+            except Exception as e:
+                logger.warning(f"Error reading cache stats for {cache_type}: {e}")
+                continue
+            stats["by_type"][cache_type] = {
+                "files": files,
+                "size_mb": round(size_bytes / (1024 * 1024), 2)
+            }
+            stats["total_files"] += files
+            stats["total_size_mb"] += stats["by_type"][cache_type]["size_mb"]
         
         stats["total_size_mb"] = round(stats["total_size_mb"], 2)
         return stats
@@ -198,30 +248,20 @@ class CacheManager:
         Returns:
             List of keys in the namespace
         """
-        cache_dir = Path(self.config.cache_dir, cache_type)
-        if not cache_dir.exists():
-            return []
-        
         try:
-            # Get all JSON files in the cache directory
-            cache_files = list(cache_dir.glob("*.json"))
-            
-            # Extract original keys from files
-            keys = []
-            for cache_file in cache_files:
-                try:
-                    # Try to read the file to get the original key
-                    with open(cache_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        if 'key' in data:
-                            keys.append(data['key'])
-                        else:
-                            # If 'key' not stored, use the filename without extension
-                            keys.append(cache_file.stem)
-                except Exception as e:
-                    logger.warning(f"Error reading cache file {cache_file}: {e}")
-            
+            indexed = self.key_index.get_keys(cache_type)
+            known = {cache_key for _, cache_key in indexed}
+            keys = [key for key, _ in indexed]
+            # Entries written before the index existed are only visible to the backend
+            for key in self.backend.get_all_keys(cache_type):
+                if key not in known and self._get_cache_key(key) not in known:
+                    keys.append(key)
             return keys
         except Exception as e:
             logger.error(f"Error getting keys for {cache_type}: {e}")
-            return []
\ No newline at end of file
+            return []
+    
+    def close(self) -> None:
+        """Release backend resources."""
+        self.backend.close()
+        self.key_index.close()
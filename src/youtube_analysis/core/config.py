@@ -117,6 +117,10 @@ class NetworkConfig:
     # Video download timeouts
     video_download_timeout: int = field(default_factory=lambda: int(os.getenv('VIDEO_DOWNLOAD_TIMEOUT', '300')))
     
+    # Transcript fetching (blocking HTTP pipeline runs in a bounded thread pool)
+    transcript_fetch_workers: int = field(default_factory=lambda: int(os.getenv('TRANSCRIPT_FETCH_WORKERS', '8')))
+    innertube_cache_ttl_hours: float = field(default_factory=lambda: float(os.getenv('INNERTUBE_CACHE_TTL_HOURS', '24')))
+    
     # Server settings
     server_port: int = field(default_factory=lambda: int(os.getenv('STREAMLIT_SERVER_PORT', '8501')))
     server_address: str = field(default_factory=lambda: os.getenv('STREAMLIT_SERVER_ADDRESS', '0.0.0.0'))
@@ -153,6 +157,9 @@ class APIConfig:
     # OpenAI API
     openai_api_key: Optional[str] = field(default_factory=lambda: os.getenv('OPENAI_API_KEY'))
     
+    # Whisper fallback when captions are unavailable: 'openai' or 'local' (faster-whisper)
+    whisper_fallback_provider: str = field(default_factory=lambda: os.getenv('WHISPER_FALLBACK_PROVIDER', 'openai').lower())
+    
     # Anthropic API
     anthropic_api_key: Optional[str] = field(default_factory=lambda: os.getenv('ANTHROPIC_API_KEY'))
     
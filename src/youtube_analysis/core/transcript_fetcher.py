@@ -19,7 +19,11 @@ import re
 import json
 import tempfile
 import shutil
-from typing import Optional, List, Dict, Any, Tuple, Union
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Tuple, Union, Iterator, Deque, Iterable, AsyncIterator, Set
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -29,10 +33,12 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
 
-from ..transcription import WhisperTranscriber, TranscriptUnavailable
+from ..transcription import WhisperTranscriber, LocalWhisperTranscriber, TranscriptUnavailable
 from ..models import TranscriptSegment, VideoData, VideoInfo
 from ..utils.logging import get_logger
+from ..utils.single_flight import SingleFlight
 from .cache_manager import CacheManager
+from .config import config
 
 logger = get_logger("transcript_fetcher")
 
@@ -80,6 +86,7 @@ class TranscriptSource(Enum):
     AUTO_GENERATED = "auto_generated"
     WHISPER_OPENAI = "whisper_openai"
     WHISPER_GROQ = "whisper_groq"
+    WHISPER_LOCAL = "whisper_local"
 
 class TranscriptError(Exception):
     """Base class for transcript-related errors."""
@@ -111,18 +118,20 @@ class TranscriptResult:
     spoken_language: Optional[str] = None
     is_auto: bool = False
     output_language: Optional[str] = None
+    rate_limited: bool = False
+    from_cache: bool = False
 
 # Session management from test_yt.py
-def new_session() -> requests.Session:
+def new_session(user_agent: Optional[str] = None, pool_maxsize: int = 10) -> requests.Session:
     s = requests.Session()
     retries = Retry(total=5, connect=3, read=3, backoff_factor=0.8,
                     status_forcelist=[429,500,502,503,504],
                     allowed_methods=["HEAD","GET","POST","OPTIONS"],
                     raise_on_status=False)
-    s.mount("https://", HTTPAdapter(max_retries=retries))
-    s.mount("http://",  HTTPAdapter(max_retries=retries))
+    s.mount("https://", HTTPAdapter(max_retries=retries, pool_maxsize=pool_maxsize))
+    s.mount("http://",  HTTPAdapter(max_retries=retries, pool_maxsize=pool_maxsize))
     s.headers.update({
-        "User-Agent": random.choice(UA_POOL),
+        "User-Agent": user_agent or random.choice(UA_POOL),
         "Accept": "*/*",
         "Accept-Language": "en-US,en;q=0.8",
         "Origin": YOUTUBE, "Referer": f"{YOUTUBE}/", "Connection":"keep-alive",
@@ -131,6 +140,105 @@ def new_session() -> requests.Session:
     s.cookies.set("PREF","hl=en", domain=".youtube.com")
     return s
 
+@dataclass
+class _PooledSession:
+    session: requests.Session
+    created_at: float = field(default_factory=time.time)
+    uses: int = 0
+    consecutive_failures: int = 0
+
+class SessionPool:
+    """
+    Pool of long-lived sessions so consecutive fetches reuse warm TCP/TLS
+    connections and cookies.
+    
+    Each session gets the next user agent from UA_POOL. Sessions that fail
+    repeatedly or exceed max_age_seconds are closed and replaced, which also
+    rotates the user agent and cookie jar.
+    """
+    
+    def __init__(self, size: int = 8, pool_maxsize: int = 4, max_failures: int = 3, max_age_seconds: float = 1800):
+        self.size = size
+        self.pool_maxsize = pool_maxsize  # connections kept per host, per session
+        self.max_failures = max_failures
+        self.max_age_seconds = max_age_seconds
+        self._idle: Deque[_PooledSession] = deque()
+        self._lock = threading.Lock()
+        self._ua_index = random.randrange(len(UA_POOL))
+        self._closed = False
+        self._stats = {"created": 0, "reused": 0, "retired": 0, "failures": 0}
+    
+    def _create(self) -> _PooledSession:
+        with self._lock:
+            user_agent = UA_POOL[self._ua_index % len(UA_POOL)]
+            self._ua_index += 1
+            self._stats["created"] += 1
+        return _PooledSession(session=new_session(user_agent=user_agent, pool_maxsize=self.pool_maxsize))
+    
+    def _is_healthy(self, entry: _PooledSession) -> bool:
+        return (entry.consecutive_failures < self.max_failures
+                and time.time() - entry.created_at < self.max_age_seconds)
+    
+    def acquire(self) -> _PooledSession:
+        """Take the most recently used healthy session, or create one."""
+        while True:
+            with self._lock:
+                entry = self._idle.pop() if self._idle else None
+            if entry is None:
+                return self._create()
+            if self._is_healthy(entry):
+                with self._lock:
+                    self._stats["reused"] += 1
+                entry.uses += 1
+                return entry
+            self._retire(entry)
+    
+    def release(self, entry: _PooledSession, ok: bool = True) -> None:
+        """Return a session to the pool, retiring it if unhealthy or surplus."""
+        if ok:
+            entry.consecutive_failures = 0
+        else:
+            entry.consecutive_failures += 1
+            with self._lock:
+                self._stats["failures"] += 1
+        with self._lock:
+            keep = not self._closed and len(self._idle) < self.size and self._is_healthy(entry)
+            if keep:
+                self._idle.append(entry)
+        if not keep:
+            self._retire(entry)
+    
+    def _retire(self, entry: _PooledSession) -> None:
+        with self._lock:
+            self._stats["retired"] += 1
+        entry.session.close()
+    
+    @contextmanager
+    def session(self) -> Iterator[requests.Session]:
+        """Borrow a session; transport errors and 429s count against its health."""
+        entry = self.acquire()
+        ok = True
+        try:
+            yield entry.session
+        except requests.RequestException as e:
+            response = getattr(e, "response", None)
+            ok = not (response is None or response.status_code == 429 or response.status_code >= 500)
+            raise
+        finally:
+            self.release(entry, ok)
+    
+    def close(self) -> None:
+        """Close all idle sessions; sessions still in use are closed on release."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+        for entry in idle:
+            entry.session.close()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"idle": len(self._idle), "size": self.size, **self._stats}
+
 @dataclass
 class LanguagePreference:
     """Language preference configuration."""
@@ -172,6 +280,96 @@ def bootstrap_client_from_url(s: requests.Session, page_url: str) -> Tuple[str,s
 def bootstrap_client_for_video(s: requests.Session, video_id: str) -> Tuple[str,str,str]:
     return bootstrap_client_from_url(s, f"{YOUTUBE}/watch?v={video_id}&hl=en")
 
+class InnertubeClientCache:
+    """
+    TTL'd cache of the Innertube API key / client version pair.
+    
+    The pair is scraped from a watch page and changes rarely, so it is shared by
+    all fetches in the process and persisted to disk to survive restarts.
+    """
+    
+    def __init__(self, path: Optional[Union[str, Path]] = None, ttl_hours: Optional[float] = None):
+        self.path = Path(path) if path else Path(config.cache.cache_dir) / "innertube_client.json"
+        self.ttl_seconds = (ttl_hours if ttl_hours is not None else config.network.innertube_cache_ttl_hours) * 3600
+        self._lock = threading.Lock()
+        self._pair: Optional[Tuple[str, str]] = None
+        self._fetched_at = 0.0
+        self._loaded = False
+    
+    def _load(self) -> None:
+        """Load the persisted pair once; caller holds the lock."""
+        self._loaded = True
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("api_key") and data.get("client_version"):
+                self._pair = (data["api_key"], data["client_version"])
+                self._fetched_at = float(data.get("fetched_at", 0))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable Innertube client cache {self.path}: {e}")
+    
+    def get(self) -> Optional[Tuple[str, str]]:
+        """Return the cached (api_key, client_version) pair if still fresh."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            if self._pair and time.time() - self._fetched_at < self.ttl_seconds:
+                return self._pair
+            return None
+    
+    def set(self, api_key: str, client_version: str) -> None:
+        """Store a freshly bootstrapped pair in memory and on disk."""
+        with self._lock:
+            self._loaded = True
+            self._pair = (api_key, client_version)
+            self._fetched_at = time.time()
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({"api_key": api_key, "client_version": client_version, "fetched_at": self._fetched_at}, f)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                logger.warning(f"Could not persist Innertube client cache: {e}")
+    
+    def invalidate(self) -> None:
+        """Drop the cached pair (e.g. after YouTube rejected it)."""
+        with self._lock:
+            self._loaded = True
+            self._pair = None
+            self._fetched_at = 0.0
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Could not remove Innertube client cache: {e}")
+
+innertube_cache = InnertubeClientCache()
+
+def _is_stale_client_error(e: Exception) -> bool:
+    """True if a player failure looks like a rejected/outdated key or client version."""
+    if isinstance(e, requests.HTTPError):
+        return e.response is not None and e.response.status_code in (400, 401, 403)
+    return isinstance(e, ValueError)  # non-JSON response body
+
+def fetch_player_with_cached_client(s: requests.Session, video_id: str) -> Dict[str,Any]:
+    """Fetch the player response, bootstrapping the Innertube client only when the cache is cold or stale."""
+    cached = innertube_cache.get()
+    if cached:
+        try:
+            return fetch_player(s, video_id, *cached)
+        except Exception as e:
+            if not _is_stale_client_error(e):
+                raise
+            log(f"Cached Innertube client rejected ({e}); re-bootstrapping")
+            innertube_cache.invalidate()
+    api_key, client_version, _ = bootstrap_client_for_video(s, video_id)
+    innertube_cache.set(api_key, client_version)
+    return fetch_player(s, video_id, api_key, client_version)
+
 # Player & captions from test_yt.py
 def fetch_player(s: requests.Session, video_id: str, api_key: str, client_version: str) -> Dict[str,Any]:
     endpoint=f"{YOUTUBE}/youtubei/v1/player"
@@ -350,8 +548,7 @@ def get_clean_vtt_for_video(
     desired_lang: Optional[str], output_lang: Optional[str],
     min_coverage: float = 0.70, enable_asr_fallback: bool = True
 ) -> Tuple[str, Dict[str,Any]]:
-    api_key, client_version, _ = bootstrap_client_for_video(s, video_id)
-    player = fetch_player(s, video_id, api_key, client_version)
+    player = fetch_player_with_cached_client(s, video_id)
 
     # Choose initial track (manual preferred)
     track, spoken, all_tracks = choose_track(player, video_id, desired_lang)
@@ -395,6 +592,53 @@ def get_clean_vtt_for_video(
         "outputLanguage": normalize_lang(output_lang) if output_lang else None
     }
 
+# Playlist / channel listing
+def parse_playlist_id(url_or_id: str) -> Optional[str]:
+    s = (url_or_id or "").strip()
+    if re.fullmatch(r"(PL|UU|LL|FL|OL|RD)[A-Za-z0-9_-]{10,}", s): return s
+    qs = parse_qs(urlparse(s).query)
+    if "list" in qs and qs["list"]: return qs["list"][0]
+    return None
+
+def resolve_playlist_id(s: requests.Session, url_or_id: str) -> str:
+    """Resolve a playlist URL/ID, or a channel URL to its uploads playlist."""
+    playlist_id = parse_playlist_id(url_or_id)
+    if playlist_id: return playlist_id
+    m = re.search(r"/channel/(UC[A-Za-z0-9_-]{22})", url_or_id)
+    if m: return "UU" + m.group(1)[2:]
+    if re.search(r"youtube\.com/(@|c/|user/)", url_or_id):
+        r = s.get(url_or_id, timeout=25); r.raise_for_status()
+        m = re.search(r'"(?:externalId|channelId)"\s*:\s*"(UC[A-Za-z0-9_-]{22})"', r.text)
+        if m: return "UU" + m.group(1)[2:]
+    raise ValueError(f"Could not resolve a playlist or channel from: {url_or_id}")
+
+_PLAYLIST_VIDEO_RE = re.compile(r'"playlistVideoRenderer"\s*:\s*\{\s*"videoId"\s*:\s*"([A-Za-z0-9_-]{11})"')
+_CONTINUATION_RE = re.compile(r'"continuationCommand"\s*:\s*\{\s*"token"\s*:\s*"([^"]+)"')
+
+def list_playlist_video_ids(s: requests.Session, playlist_id: str, limit: Optional[int] = None) -> List[str]:
+    """List video IDs of a playlist in order, following browse continuations."""
+    r = s.get(f"{YOUTUBE}/playlist?list={playlist_id}&hl=en", timeout=25); r.raise_for_status()
+    text = r.text
+    pair = innertube_cache.get() or extract_innertube_from_html(text)
+    ids: List[str] = []
+    seen: Set[str] = set()
+    while True:
+        for vid in _PLAYLIST_VIDEO_RE.findall(text):
+            if vid not in seen:
+                seen.add(vid); ids.append(vid)
+        if limit and len(ids) >= limit: return ids[:limit]
+        m = _CONTINUATION_RE.search(text)
+        if not m or not pair: return ids
+        api_key, client_version = pair
+        jitter_sleep(0.25)
+        r = s.post(f"{YOUTUBE}/youtubei/v1/browse", params={"key": api_key, "prettyPrint": "false"},
+                   json={"context": {"client": {"clientName": "WEB", "clientVersion": client_version}},
+                         "continuation": m.group(1)},
+                   headers={"X-YouTube-Client-Name": "1", "X-YouTube-Client-Version": client_version},
+                   timeout=25)
+        r.raise_for_status()
+        text = r.text
+
 def vtt_to_segments(vtt_content: str) -> List[Dict[str, Any]]:
     """Convert VTT content to segments list."""
     segments = []
@@ -462,6 +706,52 @@ def _parse_timestamp(timestamp: str) -> int:
     total_ms = (int(hours) * 3600 + int(minutes) * 60 + int(seconds)) * 1000 + int(milliseconds.ljust(3, '0')[:3])
     return total_ms
 
+def _is_rate_limit_error(e: Exception) -> bool:
+    if isinstance(e, TranscriptRateLimitError): return True
+    if isinstance(e, requests.HTTPError):
+        return e.response is not None and e.response.status_code == 429
+    return False
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limit for batch fetches.
+    
+    The limit is halved and new work pauses (with growing backoff) whenever a
+    fetch is rate limited. It grows by one after a run of clean successes, up
+    to max_limit.
+    """
+    
+    def __init__(self, max_limit: int, min_limit: int = 1, increase_after: int = 10, base_backoff: float = 15.0, max_backoff: float = 300.0):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = self.max_limit
+        self.increase_after = increase_after
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._successes = 0
+        self._strikes = 0
+        self._resume_at = 0.0
+    
+    def record(self, rate_limited: bool) -> None:
+        if rate_limited:
+            self._strikes += 1
+            self._successes = 0
+            self.limit = max(self.min_limit, self.limit // 2)
+            backoff = min(self.max_backoff, self.base_backoff * (2 ** (self._strikes - 1)))
+            self._resume_at = max(self._resume_at, time.monotonic() + backoff)
+            logger.warning(f"Rate limited; concurrency -> {self.limit}, pausing {backoff:.0f}s")
+        else:
+            self._strikes = 0
+            self._successes += 1
+            if self._successes >= self.increase_after and self.limit < self.max_limit:
+                self.limit += 1
+                self._successes = 0
+    
+    async def wait_if_paused(self) -> None:
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
 class RobustTranscriptFetcher:
     """
     Robust transcript fetching engine based on test_yt.py logic.
@@ -474,7 +764,8 @@ class RobustTranscriptFetcher:
         max_retries: int = 3,
         base_retry_delay: float = 1.0,
         max_retry_delay: float = 30.0,
-        enable_circuit_breaker: bool = True
+        enable_circuit_breaker: bool = True,
+        max_workers: Optional[int] = None
     ):
         self.cache = cache_manager or CacheManager()
         self.language_prefs = language_preferences or LanguagePreference()
@@ -485,6 +776,21 @@ class RobustTranscriptFetcher:
         # Whisper transcribers for fallback
         self._whisper_openai = None
         self._whisper_groq = None
+        self._whisper_local = None
+        
+        # Concurrent fetches of the same transcript share one upstream request
+        self._inflight = SingleFlight("transcript_fetcher")
+        
+        # The requests-based pipeline blocks (HTTP + jitter sleeps), so it runs
+        # in a bounded pool to keep the event loop free and let fetches overlap
+        workers = max_workers or config.network.transcript_fetch_workers
+        self._max_workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transcript")
+        # One warm session per worker
+        self._session_pool = SessionPool(size=workers)
+        
+        self._metrics_lock = threading.Lock()
+        self._metrics = {"total_requests": 0, "cache_hits": 0, "network_fetches": 0, "successes": 0, "total_fetch_ms": 0}
         
         logger.info("Initialized RobustTranscriptFetcher with test_yt.py logic")
     
@@ -502,6 +808,13 @@ class RobustTranscriptFetcher:
             self._whisper_groq = WhisperTranscriber(provider="groq")
         return self._whisper_groq
     
+    @property
+    def whisper_local(self) -> LocalWhisperTranscriber:
+        """Lazy initialization of the local faster-whisper transcriber."""
+        if self._whisper_local is None:
+            self._whisper_local = LocalWhisperTranscriber()
+        return self._whisper_local
+    
     async def fetch_transcript(
         self,
         video_id: str,
@@ -526,19 +839,44 @@ class RobustTranscriptFetcher:
             TranscriptResult with success status and data
         """
         start_time = time.time()
+        self._record_metrics(total_requests=1)
         
         # Check cache first
         if use_cache:
             cached_result = await self._get_cached_transcript(video_id, preferred_language, output_language)
             if cached_result:
                 logger.debug(f"Using cached transcript for {video_id}")
+                self._record_metrics(cache_hits=1)
                 return cached_result
         
+        flight_key = (
+            f"{video_id}:{preferred_language or 'auto'}:{output_language or 'none'}:"
+            f"{int(use_cache)}:{int(fallback_to_whisper)}"
+        )
+        return await self._inflight.do(
+            flight_key,
+            lambda: self._fetch_transcript_uncached(
+                video_id, use_cache, preferred_language, output_language, fallback_to_whisper, start_time
+            )
+        )
+    
+    async def _fetch_transcript_uncached(
+        self,
+        video_id: str,
+        use_cache: bool,
+        preferred_language: Optional[str],
+        output_language: Optional[str],
+        fallback_to_whisper: bool,
+        start_time: float
+    ) -> TranscriptResult:
+        """Fetch a transcript from YouTube (or Whisper) without consulting the cache."""
+        self._record_metrics(network_fetches=1)
+        
         # Try main robust approach
         try:
-            s = new_session()
-            vtt_content, metadata = get_clean_vtt_for_video(
-                s, video_id, preferred_language, output_language
+            loop = asyncio.get_running_loop()
+            vtt_content, metadata = await loop.run_in_executor(
+                self._executor, self._get_clean_vtt, video_id, preferred_language, output_language
             )
             
             # Convert VTT to segments
@@ -562,6 +900,7 @@ class RobustTranscriptFetcher:
                 await self._cache_transcript_result(video_id, result, preferred_language, output_language)
             
             logger.info(f"Successfully fetched transcript for {video_id} using robust YouTube method")
+            self._record_metrics(successes=1, total_fetch_ms=result.fetch_time_ms)
             return result
             
         except Exception as e:
@@ -569,19 +908,178 @@ class RobustTranscriptFetcher:
             
             # Fallback to Whisper if enabled
             if fallback_to_whisper:
-                return await self._fetch_with_whisper(video_id, preferred_language or "en", start_time)
+                result = await self._fetch_with_whisper(video_id, preferred_language or "en", start_time)
+                if result.success:
+                    self._record_metrics(successes=1, total_fetch_ms=result.fetch_time_ms)
+                return result
             
             return TranscriptResult(
                 success=False,
                 error=f"Failed to fetch transcript: {e}",
-                fetch_time_ms=int((time.time() - start_time) * 1000)
+                fetch_time_ms=int((time.time() - start_time) * 1000),
+                rate_limited=_is_rate_limit_error(e)
             )
     
+    def _get_clean_vtt(
+        self,
+        video_id: str,
+        preferred_language: Optional[str],
+        output_language: Optional[str]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Run the blocking caption pipeline; called from the executor."""
+        with self._session_pool.session() as s:
+            return get_clean_vtt_for_video(s, video_id, preferred_language, output_language)
+    
+    async def fetch_transcripts_batch(
+        self,
+        video_ids: Iterable[str],
+        use_cache: bool = True,
+        preferred_language: Optional[str] = None,
+        output_language: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        max_rate_limit_retries: int = 3
+    ) -> AsyncIterator[Tuple[str, TranscriptResult]]:
+        """
+        Fetch many transcripts, yielding (video_id, result) as each completes.
+        
+        Concurrency adapts to rate limiting: 429s shrink the limit and pause new
+        work, and the affected videos are requeued. Other failures are yielded as
+        unsuccessful results instead of aborting the batch. With a checkpoint
+        file, every outcome is appended as a JSON line, and videos that already
+        succeeded are skipped when the batch is rerun.
+        
+        Args:
+            video_ids: Video IDs or URLs
+            use_cache: Whether to use cached results
+            preferred_language: Preferred language code
+            output_language: Target language for translation
+            max_concurrency: Upper bound on concurrent fetches (defaults to the worker pool size)
+            checkpoint_path: Optional JSONL checkpoint for resuming interrupted runs
+            max_rate_limit_retries: How often a rate-limited video is requeued
+        """
+        checkpoint = Path(checkpoint_path) if checkpoint_path else None
+        done = self._load_checkpoint(checkpoint) if checkpoint else set()
+        
+        pending: Deque[str] = deque()
+        seen: Set[str] = set()
+        for item in video_ids:
+            try:
+                vid = parse_video_id(item)
+            except ValueError:
+                yield item, TranscriptResult(success=False, error="Invalid video ID or URL")
+                continue
+            if vid not in seen and vid not in done:
+                seen.add(vid); pending.append(vid)
+        
+        if done:
+            logger.info(f"Resuming batch from checkpoint: {len(done)} done, {len(pending)} remaining")
+        
+        limiter = AdaptiveConcurrencyLimiter(max_concurrency or self._max_workers)
+        retries: Dict[str, int] = {}
+        running: Dict[asyncio.Task, str] = {}
+        
+        async def fetch_one(vid: str) -> TranscriptResult:
+            try:
+                return await self.fetch_transcript(
+                    video_id=vid,
+                    youtube_url=f"{YOUTUBE}/watch?v={vid}",
+                    use_cache=use_cache,
+                    preferred_language=preferred_language,
+                    output_language=output_language
+                )
+            except Exception as e:
+                return TranscriptResult(success=False, error=str(e), rate_limited=_is_rate_limit_error(e))
+        
+        try:
+            while pending or running:
+                while pending and len(running) < limiter.limit:
+                    await limiter.wait_if_paused()
+                    vid = pending.popleft()
+                    running[asyncio.create_task(fetch_one(vid))] = vid
+                
+                finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    vid = running.pop(task)
+                    result = task.result()
+                    limiter.record(result.rate_limited)
+                    
+                    if result.rate_limited and retries.get(vid, 0) < max_rate_limit_retries:
+                        retries[vid] = retries.get(vid, 0) + 1
+                        pending.append(vid)
+                        continue
+                    
+                    if checkpoint:
+                        self._append_checkpoint(checkpoint, vid, result)
+                    yield vid, result
+        finally:
+            for task in running:
+                task.cancel()
+    
+    async def fetch_playlist_transcripts(
+        self,
+        playlist_url: str,
+        limit: Optional[int] = None,
+        **batch_kwargs
+    ) -> AsyncIterator[Tuple[str, TranscriptResult]]:
+        """
+        Fetch transcripts for every video of a playlist or channel (uploads).
+        
+        Args:
+            playlist_url: Playlist URL/ID or channel URL
+            limit: Optional maximum number of videos
+            **batch_kwargs: Forwarded to fetch_transcripts_batch
+        """
+        def list_ids() -> List[str]:
+            with self._session_pool.session() as s:
+                return list_playlist_video_ids(s, resolve_playlist_id(s, playlist_url), limit)
+        
+        loop = asyncio.get_running_loop()
+        video_ids = await loop.run_in_executor(self._executor, list_ids)
+        logger.info(f"Found {len(video_ids)} videos in {playlist_url}")
+        
+        async for item in self.fetch_transcripts_batch(video_ids, **batch_kwargs):
+            yield item
+    
+    @staticmethod
+    def _load_checkpoint(path: Path) -> Set[str]:
+        """Read video IDs that already succeeded from a JSONL checkpoint."""
+        done: Set[str] = set()
+        if not path.exists():
+            return done
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # partially written last line
+                if entry.get("success"):
+                    done.add(entry.get("video_id"))
+        return done
+    
+    @staticmethod
+    def _append_checkpoint(path: Path, video_id: str, result: TranscriptResult) -> None:
+        """Append one batch outcome to the JSONL checkpoint."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({
+                    "video_id": video_id,
+                    "success": result.success,
+                    "error": result.error,
+                    "rate_limited": result.rate_limited,
+                    "completed_at": time.time()
+                }) + "\n")
+        except Exception as e:
+            logger.error(f"Error writing batch checkpoint {path}: {e}")
+    
     async def _fetch_with_whisper(self, video_id: str, language: str, start_time: float) -> TranscriptResult:
         """Fallback to Whisper transcription."""
         try:
-            logger.info(f"Falling back to Whisper for {video_id}")
-            transcript_obj = await self.whisper_openai.get(
+            use_local = config.api.whisper_fallback_provider == "local"
+            logger.info(f"Falling back to {'local ' if use_local else ''}Whisper for {video_id}")
+            transcriber = self.whisper_local if use_local else self.whisper_openai
+            transcript_obj = await transcriber.get(
                 video_id=video_id, 
                 language=language
             )
@@ -600,7 +1098,7 @@ class RobustTranscriptFetcher:
                     success=True,
                     transcript=transcript_obj.text,
                     segments=segments,
-                    source=TranscriptSource.WHISPER_OPENAI,
+                    source=TranscriptSource.WHISPER_LOCAL if use_local else TranscriptSource.WHISPER_OPENAI,
                     language=language,
                     fetch_time_ms=int((time.time() - start_time) * 1000)
                 )
@@ -628,7 +1126,8 @@ class RobustTranscriptFetcher:
                 language=cached.get("language"),
                 spoken_language=cached.get("spoken_language"),
                 is_auto=cached.get("is_auto", False),
-                output_language=cached.get("output_language")
+                output_language=cached.get("output_language"),
+                from_cache=True
             )
         
         return None
@@ -647,17 +1146,36 @@ class RobustTranscriptFetcher:
                 "output_language": result.output_language,
                 "cached_at": time.time()
             }
-            self.cache.set("transcripts", cache_key, cache_data)
+            self.cache.set("transcripts", cache_key, cache_data, video_id=video_id)
+    
+    def _record_metrics(self, **deltas: int) -> None:
+        with self._metrics_lock:
+            for name, value in deltas.items():
+                self._metrics[name] += value
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get performance metrics."""
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+        network_fetches = metrics["network_fetches"]
         return {
             'implementation': 'robust_youtube',
-            'total_requests': 0,
-            'success_rate': 0.0,
-            'avg_response_time': 0.0
+            'total_requests': metrics["total_requests"],
+            'cache_hits': metrics["cache_hits"],
+            'network_fetches': network_fetches,
+            'success_rate': (metrics["successes"] / network_fetches) if network_fetches else 0.0,
+            'avg_response_time': (metrics["total_fetch_ms"] / metrics["successes"] / 1000) if metrics["successes"] else 0.0,
+            'in_flight': self._inflight.get_stats(),
+            'session_pool': self._session_pool.get_stats()
         }
     
+    def close(self) -> None:
+        """Release the fetch worker pool, pooled HTTP sessions and local Whisper workers."""
+        self._executor.shutdown(wait=False)
+        self._session_pool.close()
+        if self._whisper_local is not None:
+            self._whisper_local.close()
+    
     def reset_circuit_breakers(self):
         """Reset circuit breakers (placeholder for compatibility)."""
         logger.info("Circuit breakers reset (not applicable to robust implementation)")
\ No newline at end of file
@@ -100,7 +100,7 @@ class YouTubeClient:
             
             # Cache the result
             if use_cache:
-                self.cache.set("analysis", cache_key, video_info.__dict__)
+                self.cache.set("analysis", cache_key, video_info.__dict__, video_id=video_id)
             
             logger.info(f"Retrieved video info: {video_info.title}")
             return video_info
@@ -189,15 +189,7 @@ class YouTubeClient:
             )
             
             if result.success and result.segments:
-                # Format with timestamps
-                formatted_transcript = []
-                for segment in result.segments:
-                    seconds = int(segment['start'])
-                    minutes, seconds = divmod(seconds, 60)
-                    timestamp = f"{minutes:02d}:{seconds:02d}"
-                    formatted_transcript.append(f"[{timestamp}] {segment['text']}")
-                
-                formatted_text = "\n".join(formatted_transcript)
+                formatted_text = self.format_timestamped_transcript(result.segments)
                 
                 logger.info(f"Retrieved timestamped transcript for {video_id} from {result.source.value}")
                 return formatted_text, result.segments
@@ -209,6 +201,18 @@ class YouTubeClient:
             logger.error(f"Error getting timestamped transcript for {video_id}: {e}")
             return None, None
     
+    @staticmethod
+    def format_timestamped_transcript(segments: List[Dict[str, Any]]) -> str:
+        """Format raw transcript segments as "[MM:SS] text" lines."""
+        formatted_transcript = []
+        for segment in segments:
+            seconds = int(segment['start'])
+            minutes, seconds = divmod(seconds, 60)
+            timestamp = f"{minutes:02d}:{seconds:02d}"
+            formatted_transcript.append(f"[{timestamp}] {segment['text']}")
+        
+        return "\n".join(formatted_transcript)
+    
     async def get_transcript_result(
         self,
         url: str,
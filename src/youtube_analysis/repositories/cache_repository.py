@@ -1,8 +1,10 @@
 """Repository for cache operations with advanced features."""
 
 import asyncio
+import sys
 import weakref
-from typing import Dict, Any, Optional, List, Callable, TypeVar, Generic
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Callable, TypeVar, Generic, Set, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from concurrent.futures import ThreadPoolExecutor
@@ -13,6 +15,8 @@ import hashlib
 from ..core import CacheManager
 from ..models import VideoData, AnalysisResult, ChatSession, TokenUsageCache, TokenUsage
 from ..utils.logging import get_logger
+from ..utils.single_flight import SingleFlight
+from ..utils.vectorstore_cache import get_vectorstore_cache
 
 logger = get_logger("cache_repository")
 
@@ -62,11 +66,19 @@ class SmartCacheRepository:
     def __init__(self, cache_manager: CacheManager, max_memory_mb: int = 500):
         self.cache_manager = cache_manager
         self.max_memory_bytes = max_memory_mb * 1024 * 1024
-        self._memory_cache: Dict[str, CacheEntry] = {}
+        # Insertion/access ordered: least recently used entries sit at the front
+        self._memory_cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._memory_bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "accesses": 0}
+        # Reverse index: video_id -> memory keys, and memory key -> video_id
+        self._video_index: Dict[str, Set[str]] = {}
+        self._key_video: Dict[str, str] = {}
         self._weak_refs: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
         self._background_tasks: Dict[str, asyncio.Task] = {}
         self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache")
         self._refresh_callbacks: Dict[str, Callable] = {}
+        # Concurrent misses/refreshes for the same full key share one fetch
+        self._inflight = SingleFlight("smart_cache")
         
         # Initialize cleanup task as None, will be started when needed
         self._cleanup_task = None
@@ -87,7 +99,8 @@ class SmartCacheRepository:
         key: str, 
         fetch_fn: Callable[[], Any],
         ttl_hours: int = 24,
-        refresh_threshold: float = 0.8
+        refresh_threshold: float = 0.8,
+        video_id: Optional[str] = None
     ) -> Optional[Any]:
         """
         Get value with automatic fallback and background refresh.
@@ -98,6 +111,7 @@ class SmartCacheRepository:
             fetch_fn: Function to fetch fresh data
             ttl_hours: Time to live in hours
             refresh_threshold: When to trigger background refresh (0.8 = 80% of TTL)
+            video_id: Optional video the entry belongs to, used for per-video invalidation
         """
         # Ensure cleanup task is running
         self._ensure_cleanup_task()
@@ -105,25 +119,30 @@ class SmartCacheRepository:
         full_key = f"{cache_type}:{key}"
         
         # Check memory cache first
-        if full_key in self._memory_cache:
-            entry = self._memory_cache[full_key]
+        entry = self._memory_cache.get(full_key)
+        if entry is not None:
             entry.access_count += 1
             entry.last_accessed = datetime.now()
+            self._stats["accesses"] += 1
             
             # Check if the cached value is a coroutine (corrupted cache)
             if asyncio.iscoroutine(entry.value):
                 logger.warning(f"Found corrupted cache entry (coroutine) for {full_key}, removing")
-                del self._memory_cache[full_key]
+                self._remove_from_memory(full_key)
             elif not entry.is_expired:
                 # Check if needs background refresh
                 if entry.ttl_seconds and entry.ttl_seconds < (ttl_hours * 3600 * (1 - refresh_threshold)):
                     await self._schedule_background_refresh(full_key, fetch_fn, ttl_hours)
                 
+                self._memory_cache.move_to_end(full_key)
+                self._stats["hits"] += 1
                 logger.debug(f"Memory cache hit for {full_key}")
                 return entry.value
             else:
                 # Remove expired entry
-                del self._memory_cache[full_key]
+                self._remove_from_memory(full_key)
+        
+        self._stats["misses"] += 1
         
         # Check persistent cache
         cached_value = self.cache_manager.get(cache_type, key)
@@ -134,37 +153,54 @@ class SmartCacheRepository:
                 cached_value = None
             else:
                 # Add to memory cache
-                await self._store_in_memory(full_key, cached_value, ttl_hours)
+                await self._store_in_memory(full_key, cached_value, ttl_hours, video_id)
                 logger.debug(f"Persistent cache hit for {full_key}")
                 return cached_value
         
-        # Cache miss - fetch fresh data
-        logger.info(f"Cache miss for {full_key}, fetching fresh data")
+        # Cache miss - fetch fresh data, sharing the fetch with concurrent misses
         try:
-            # Check if fetch_fn is a coroutine function
-            if asyncio.iscoroutinefunction(fetch_fn):
-                fresh_value = await fetch_fn()
-            else:
-                fresh_value = await self._run_in_executor(fetch_fn)
-            
-            # Validate that fresh_value is not a coroutine before caching
-            if asyncio.iscoroutine(fresh_value):
-                logger.error(f"fetch_fn returned a coroutine instead of data for {full_key}, not caching")
-                return None
-                
-            if fresh_value:
-                await self.set_with_ttl(cache_type, key, fresh_value, ttl_hours)
-            return fresh_value
+            return await self._inflight.do(
+                full_key,
+                lambda: self._fetch_and_store(cache_type, key, fetch_fn, ttl_hours, video_id)
+            )
         except Exception as e:
             logger.error(f"Error fetching fresh data for {full_key}: {str(e)}")
             return None
     
+    async def _fetch_and_store(
+        self,
+        cache_type: str,
+        key: str,
+        fetch_fn: Callable[[], Any],
+        ttl_hours: int,
+        video_id: Optional[str] = None
+    ) -> Optional[Any]:
+        """Fetch fresh data and store it in memory and persistent cache."""
+        full_key = f"{cache_type}:{key}"
+        logger.info(f"Cache miss for {full_key}, fetching fresh data")
+        
+        # Check if fetch_fn is a coroutine function
+        if asyncio.iscoroutinefunction(fetch_fn):
+            fresh_value = await fetch_fn()
+        else:
+            fresh_value = await self._run_in_executor(fetch_fn)
+        
+        # Validate that fresh_value is not a coroutine before caching
+        if asyncio.iscoroutine(fresh_value):
+            logger.error(f"fetch_fn returned a coroutine instead of data for {full_key}, not caching")
+            return None
+            
+        if fresh_value:
+            await self.set_with_ttl(cache_type, key, fresh_value, ttl_hours, video_id=video_id)
+        return fresh_value
+    
     async def set_with_ttl(
         self, 
         cache_type: str, 
         key: str, 
         value: Any, 
-        ttl_hours: int = 24
+        ttl_hours: int = 24,
+        video_id: Optional[str] = None
     ) -> None:
         """Set value with TTL in both memory and persistent cache."""
         full_key = f"{cache_type}:{key}"
@@ -176,15 +212,21 @@ class SmartCacheRepository:
         
         # Store in persistent cache
         try:
-            self.cache_manager.set(cache_type, key, value)
+            self.cache_manager.set(cache_type, key, value, video_id=video_id)
             logger.debug(f"Stored in persistent cache: {full_key}")
         except Exception as e:
             logger.error(f"Error storing in persistent cache {full_key}: {str(e)}")
         
         # Store in memory cache
-        await self._store_in_memory(full_key, value, ttl_hours)
+        await self._store_in_memory(full_key, value, ttl_hours, video_id)
     
-    async def _store_in_memory(self, full_key: str, value: Any, ttl_hours: int) -> None:
+    async def _store_in_memory(
+        self, 
+        full_key: str, 
+        value: Any, 
+        ttl_hours: int, 
+        video_id: Optional[str] = None
+    ) -> None:
         """Store value in memory cache with size tracking."""
         try:
             # Validate value is not a coroutine
@@ -192,9 +234,16 @@ class SmartCacheRepository:
                 logger.error(f"Cannot store coroutine in memory cache for {full_key}")
                 return
             
-            # Calculate size
-            size_bytes = len(json.dumps(value, default=str).encode('utf-8'))
+            # Estimate size without serializing the value
+            size_bytes = self._estimate_size(value)
             
+            # Drop any previous version first so its bytes are not counted twice
+            self._remove_from_memory(full_key)
+
+            if size_bytes > self.max_memory_bytes:
+                logger.debug(f"Skipping memory cache for {full_key}: {size_bytes} bytes exceeds limit")
+                return
+
             # Check memory limit
             await self._ensure_memory_limit(size_bytes)
             
@@ -209,42 +258,101 @@ class SmartCacheRepository:
             )
             
             self._memory_cache[full_key] = entry
+            self._memory_bytes += size_bytes
+            if video_id:
+                self._video_index.setdefault(video_id, set()).add(full_key)
+                self._key_video[full_key] = video_id
             logger.debug(f"Stored in memory cache: {full_key} ({size_bytes} bytes)")
             
         except Exception as e:
             logger.error(f"Error storing in memory cache {full_key}: {str(e)}")
     
+    @staticmethod
+    def _estimate_size(value: Any, _depth: int = 0) -> int:
+        """
+        Cheaply estimate the in-memory footprint of a cached value.
+        
+        Strings and bytes are counted by length; containers and objects are walked
+        (to a bounded depth) instead of being serialized to JSON.
+        """
+        if value is None or isinstance(value, (bool, int, float)):
+            return 8
+        if isinstance(value, str):
+            return len(value) + 49
+        if isinstance(value, (bytes, bytearray)):
+            return len(value) + 33
+        if _depth >= 8:
+            return sys.getsizeof(value)
+        if isinstance(value, dict):
+            return 64 + sum(
+                SmartCacheRepository._estimate_size(k, _depth + 1)
+                + SmartCacheRepository._estimate_size(v, _depth + 1)
+                for k, v in value.items()
+            )
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return 56 + sum(SmartCacheRepository._estimate_size(v, _depth + 1) for v in value)
+        attrs = getattr(value, "__dict__", None)
+        if attrs is not None:
+            return 48 + SmartCacheRepository._estimate_size(attrs, _depth + 1)
+        return sys.getsizeof(value)
+    
     async def _ensure_memory_limit(self, new_size: int) -> None:
         """Ensure memory usage stays within limits."""
-        current_size = sum(
-            entry.size_bytes or 0 
-            for entry in self._memory_cache.values()
-        )
-        
-        if current_size + new_size > self.max_memory_bytes:
+        if self._memory_bytes + new_size > self.max_memory_bytes:
             logger.info(f"Memory limit exceeded, cleaning up cache")
-            await self._cleanup_memory_cache(target_size=self.max_memory_bytes * 0.7)
+            await self._cleanup_memory_cache(target_size=self.max_memory_bytes * 0.7 - new_size)
     
     async def _cleanup_memory_cache(self, target_size: float) -> None:
-        """Clean up memory cache to target size."""
-        entries = list(self._memory_cache.items())
-        
-        # Sort by access pattern (LRU + access count)
-        entries.sort(key=lambda x: (
-            x[1].last_accessed.timestamp(),
-            x[1].access_count
-        ))
+        """Evict least recently used entries until usage is at or below target size."""
+        evicted = 0
+        while self._memory_cache and self._memory_bytes > target_size:
+            key = next(iter(self._memory_cache))
+            self._remove_from_memory(key)
+            evicted += 1
+            logger.debug(f"Evicted from memory cache: {key}")
         
-        current_size = sum(entry.size_bytes or 0 for _, entry in entries)
+        if evicted:
+            self._stats["evictions"] += evicted
+            logger.info(f"Evicted {evicted} entries from memory cache")
+    
+    def _remove_from_memory(self, full_key: str) -> bool:
+        """Remove a memory entry, its byte accounting and its reverse-index references."""
+        entry = self._memory_cache.pop(full_key, None)
+        if entry is not None:
+            self._memory_bytes -= entry.size_bytes or 0
+        video_id = self._key_video.pop(full_key, None)
+        if video_id is not None:
+            keys = self._video_index.get(video_id)
+            if keys is not None:
+                keys.discard(full_key)
+                if not keys:
+                    del self._video_index[video_id]
+        return entry is not None
+    
+    def invalidate(self, cache_type: str, key: str) -> None:
+        """Remove a single entry from both memory and persistent cache."""
+        if self._remove_from_memory(f"{cache_type}:{key}"):
+            logger.debug(f"Removed from memory cache: {cache_type}:{key}")
+        self.cache_manager.delete(cache_type, key)
+    
+    def invalidate_video(self, video_id: str) -> int:
+        """
+        Remove every memory and indexed persistent entry for a video.
         
-        # Remove entries until we reach target size
-        for key, entry in entries:
-            if current_size <= target_size:
-                break
+        Args:
+            video_id: Video ID
             
-            current_size -= (entry.size_bytes or 0)
-            del self._memory_cache[key]
-            logger.debug(f"Evicted from memory cache: {key}")
+        Returns:
+            Number of entries removed
+        """
+        memory_keys = list(self._video_index.get(video_id, ()))
+        for full_key in memory_keys:
+            self._remove_from_memory(full_key)
+        persistent_count = self.cache_manager.delete_video(video_id)
+        logger.debug(
+            f"Invalidated video {video_id}: {len(memory_keys)} memory, {persistent_count} persistent entries"
+        )
+        return len(memory_keys) + persistent_count
     
     async def _schedule_background_refresh(
         self, 
@@ -253,20 +361,20 @@ class SmartCacheRepository:
         ttl_hours: int
     ) -> None:
         """Schedule background refresh for near-expiry items."""
-        if full_key in self._background_tasks:
-            return  # Already scheduled
+        if full_key in self._background_tasks or self._inflight.in_flight(full_key):
+            return  # Already scheduled or being fetched
         
         async def refresh_task():
             try:
                 logger.info(f"Background refresh for {full_key}")
-                # Check if fetch_fn is a coroutine function
-                if asyncio.iscoroutinefunction(fetch_fn):
-                    fresh_value = await fetch_fn()
-                else:
-                    fresh_value = await self._run_in_executor(fetch_fn)
+                cache_type, key = full_key.split(':', 1)
+                fresh_value = await self._inflight.do(
+                    full_key,
+                    lambda: self._fetch_and_store(
+                        cache_type, key, fetch_fn, ttl_hours, self._key_video.get(full_key)
+                    )
+                )
                 if fresh_value:
-                    cache_type, key = full_key.split(':', 1)
-                    await self.set_with_ttl(cache_type, key, fresh_value, ttl_hours)
                     logger.info(f"Background refresh completed for {full_key}")
             except Exception as e:
                 logger.error(f"Background refresh failed for {full_key}: {str(e)}")
@@ -296,7 +404,7 @@ class SmartCacheRepository:
                 ]
                 
                 for key in expired_keys:
-                    del self._memory_cache[key]
+                    self._remove_from_memory(key)
                     logger.debug(f"Cleaned expired entry: {key}")
                 
                 if expired_keys:
@@ -307,22 +415,20 @@ class SmartCacheRepository:
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        total_size = sum(
-            entry.size_bytes or 0 
-            for entry in self._memory_cache.values()
-        )
-        
-        total_accesses = sum(
-            entry.access_count 
-            for entry in self._memory_cache.values()
-        )
+        total_size = self._memory_bytes
+        lookups = self._stats["hits"] + self._stats["misses"]
         
         return {
             "memory_entries": len(self._memory_cache),
             "memory_size_mb": total_size / (1024 * 1024),
             "memory_limit_mb": self.max_memory_bytes / (1024 * 1024),
             "memory_utilization": total_size / self.max_memory_bytes,
-            "total_accesses": total_accesses,
+            "total_accesses": self._stats["accesses"],
+            "memory_hits": self._stats["hits"],
+            "memory_misses": self._stats["misses"],
+            "memory_hit_rate": (self._stats["hits"] / lookups) if lookups else 0,
+            "evictions": self._stats["evictions"],
+            "coalesced_fetches": self._inflight.get_stats()["coalesced"],
             "background_tasks": len(self._background_tasks),
             "avg_entry_size_kb": (total_size / len(self._memory_cache) / 1024) if self._memory_cache else 0
         }
@@ -360,7 +466,8 @@ class CacheRepository:
                 "video_data", 
                 video_id, 
                 fetch_fresh,
-                ttl_hours=168  # 1 week
+                ttl_hours=168,  # 1 week
+                video_id=video_id
             )
             
             if cached_data and isinstance(cached_data, dict):
@@ -448,7 +555,7 @@ class CacheRepository:
                 
             # Store in cache with TTL
             await self.smart_cache.set_with_ttl(
-                "video_data", video_id, video_data_dict, ttl_hours=24
+                "video_data", video_id, video_data_dict, ttl_hours=24, video_id=video_id
             )
             logger.info(f"Stored video data in cache for {video_id}")
             
@@ -487,7 +594,8 @@ class CacheRepository:
             return None  # Will be handled by service layer
         
         data = await self.smart_cache.get_with_fallback(
-            "analysis", f"analysis_{video_id}", fetch_fresh, ttl_hours=168  # 1 week
+            "analysis", f"analysis_{video_id}", fetch_fresh, ttl_hours=168,  # 1 week
+            video_id=video_id
         )
         
         if data is None:
@@ -523,7 +631,8 @@ class CacheRepository:
     async def store_analysis_result(self, result: AnalysisResult) -> None:
         """Store analysis result."""
         await self.smart_cache.set_with_ttl(
-            "analysis", f"analysis_{result.video_id}", result.to_dict(), ttl_hours=168
+            "analysis", f"analysis_{result.video_id}", result.to_dict(), ttl_hours=168,
+            video_id=result.video_id
         )
     
     async def save_analysis_result(self, video_id: str, result: AnalysisResult) -> None:
@@ -543,7 +652,7 @@ class CacheRepository:
                     logger.warning(f"Found corrupted memory cache entry: {key}")
             
             for key in keys_to_remove:
-                del self.smart_cache._memory_cache[key]
+                self.smart_cache._remove_from_memory(key)
                 logger.info(f"Removed corrupted memory cache entry: {key}")
             
             # Clear corrupted persistent cache entries
@@ -558,47 +667,46 @@ class CacheRepository:
         except Exception as e:
             logger.error(f"Error clearing corrupted cache entries: {str(e)}")
 
+    @staticmethod
+    def _video_cache_keys(video_id: str) -> List[Tuple[str, str]]:
+        """Fixed (cache_type, key) pairs a video may have, including legacy formats."""
+        return [
+            ("video_data", video_id),
+            ("analysis", f"analysis_{video_id}"),
+            ("chat", f"chat_{video_id}"),  # old chat format
+            ("chat_session", f"chat_{video_id}"),
+            ("token_usage", video_id),
+        ]
+    
     async def clear_video_cache(self, video_id: str) -> None:
         """
         Clear all cached data for a specific video.
         
+        Uses the memory and persistent key indexes, so the cost does not
+        depend on how many other videos are cached.
+        
         Args:
             video_id: Video ID to clear cache for
         """
         try:
             logger.info(f"Clearing cache for video {video_id}")
             
-            # Clear from memory cache
-            keys_to_remove = []
-            for key in self.smart_cache._memory_cache.keys():
-                if video_id in key:
-                    keys_to_remove.append(key)
-            
-            for key in keys_to_remove:
-                del self.smart_cache._memory_cache[key]
-                logger.debug(f"Removed from memory cache: {key}")
-            
-            # Clear from persistent cache using the cache manager
-            # Clear video data
-            self.smart_cache.cache_manager.delete("video_data", video_id)
+            removed = self.smart_cache.invalidate_video(video_id)
             
-            # Clear analysis result
-            self.smart_cache.cache_manager.delete("analysis", f"analysis_{video_id}")
+            # Entries written before the key index existed are only reachable by their fixed keys
+            for cache_type, key in self._video_cache_keys(video_id):
+                self.smart_cache.invalidate(cache_type, key)
             
-            # Clear any chat sessions (old format)
-            self.smart_cache.cache_manager.delete("chat", f"chat_{video_id}")
-            
-            # Clear new chat sessions
-            self.smart_cache.cache_manager.delete("chat_session", f"chat_{video_id}")
-            
-            # Clear translations
+            # Clear translations stored without a video_id
             await self.delete_custom_data("translations", f"translated_transcript_{video_id}_*")
             
-            logger.info(f"Successfully cleared cache for video {video_id}")
+            # Drop the loaded FAISS index and chat agent kept in process memory
+            get_vectorstore_cache().invalidate(video_id)
+            
+            logger.info(f"Successfully cleared cache for video {video_id} ({removed} indexed entries)")
             
         except Exception as e:
             logger.error(f"Error clearing cache for video {video_id}: {str(e)}")
-    
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         return self.smart_cache.get_cache_stats()
@@ -614,7 +722,8 @@ class CacheRepository:
             return None  # Chat sessions are created on-demand
         
         data = await self.smart_cache.get_with_fallback(
-            "chat_session", f"chat_{video_id}", fetch_fresh, ttl_hours=168  # 1 week
+            "chat_session", f"chat_{video_id}", fetch_fresh, ttl_hours=168,  # 1 week
+            video_id=video_id
         )
         
         if data is None:
@@ -654,7 +763,8 @@ class CacheRepository:
             
             # Store in cache with TTL (1 week)
             await self.smart_cache.set_with_ttl(
-                "chat_session", f"chat_{chat_session.video_id}", chat_data, ttl_hours=168
+                "chat_session", f"chat_{chat_session.video_id}", chat_data, ttl_hours=168,
+                video_id=chat_session.video_id
             )
             logger.info(f"Stored chat session in cache for video {chat_session.video_id} with {len(chat_session.messages)} messages")
             
@@ -707,14 +817,8 @@ class CacheRepository:
     async def clear_chat_session(self, video_id: str) -> None:
         """Clear chat session for a specific video."""
         try:
-            # Clear from memory cache
-            chat_key = f"chat_session:chat_{video_id}"
-            if chat_key in self.smart_cache._memory_cache:
-                del self.smart_cache._memory_cache[chat_key]
-                logger.debug(f"Removed chat session from memory cache: {chat_key}")
-            
-            # Clear from persistent cache
-            self.smart_cache.cache_manager.delete("chat_session", f"chat_{video_id}")
+            # Clear from memory and persistent cache
+            self.smart_cache.invalidate("chat_session", f"chat_{video_id}")
             
             logger.info(f"Successfully cleared chat session for video {video_id}")
             
@@ -737,7 +841,8 @@ class CacheRepository:
                 "token_usage",
                 video_id,
                 lambda: None,  # No fallback for token usage
-                ttl_hours=168  # 1 week
+                ttl_hours=168,  # 1 week
+                video_id=video_id
             )
             
             if cached_data and isinstance(cached_data, dict):
@@ -764,7 +869,8 @@ class CacheRepository:
                 "token_usage",
                 token_usage_cache.video_id,
                 token_usage_cache.to_dict(),
-                ttl_hours=168  # 1 week
+                ttl_hours=168,  # 1 week
+                video_id=token_usage_cache.video_id
             )
             logger.info(f"Stored token usage cache for video {token_usage_cache.video_id}")
             
@@ -820,7 +926,7 @@ class CacheRepository:
             video_id: Video ID
         """
         try:
-            self.cache_manager.delete("token_usage", video_id)
+            self.smart_cache.invalidate("token_usage", video_id)
             logger.info(f"Cleared token usage cache for video {video_id}")
             
         except Exception as e:
@@ -846,13 +952,19 @@ class CacheRepository:
             logger.error(f"Error getting token usage for session manager: {str(e)}")
             return None
 
-    async def get_custom_data(self, category: str, key: str) -> Optional[Dict[str, Any]]:
+    async def get_custom_data(
+        self, 
+        category: str, 
+        key: str, 
+        video_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Get custom data from cache by category and key.
         
         Args:
             category: Data category (e.g., 'transcripts', 'whisper')
             key: Unique identifier for the data
+            video_id: Optional video the data belongs to
             
         Returns:
             Cached data or None if not found/expired
@@ -863,7 +975,8 @@ class CacheRepository:
         try:
             cache_key = f"{category}_{key}"
             data = await self.smart_cache.get_with_fallback(
-                category, cache_key, fetch_fresh, ttl_hours=168  # 1 week
+                category, cache_key, fetch_fresh, ttl_hours=168,  # 1 week
+                video_id=video_id
             )
             
             return data
@@ -871,7 +984,14 @@ class CacheRepository:
             logger.error(f"Error getting custom data for {category}/{key}: {str(e)}")
             return None
             
-    async def store_custom_data(self, category: str, key: str, data: Dict[str, Any], ttl_hours: int = 168) -> None:
+    async def store_custom_data(
+        self, 
+        category: str, 
+        key: str, 
+        data: Dict[str, Any], 
+        ttl_hours: int = 168,
+        video_id: Optional[str] = None
+    ) -> None:
         """
         Store custom data in cache.
         
@@ -880,6 +1000,7 @@ class CacheRepository:
             key: Unique identifier for the data
             data: Data to store
             ttl_hours: Cache TTL in hours (default: 1 week)
+            video_id: Optional video the data belongs to, so clear_video_cache can find it
         """
         try:
             # Validate data
@@ -898,7 +1019,7 @@ class CacheRepository:
             # Store in cache with TTL
             cache_key = f"{category}_{key}"
             await self.smart_cache.set_with_ttl(
-                category, cache_key, data, ttl_hours=ttl_hours
+                category, cache_key, data, ttl_hours=ttl_hours, video_id=video_id
             )
             logger.info(f"Stored custom data in cache for {category}/{key}")
         except Exception as e:
@@ -913,15 +1034,8 @@ class CacheRepository:
             key: Unique identifier for the data
         """
         try:
-            cache_key = f"{category}_{key}"
-            
-            # Remove from memory cache in smart repository
-            memory_key = f"{category}:{cache_key}"
-            if hasattr(self.smart_cache, '_memory_cache') and memory_key in self.smart_cache._memory_cache:
-                del self.smart_cache._memory_cache[memory_key]
-                
-            # Remove from persistent cache
-            self.cache_manager.delete(category, cache_key)
+            # Remove from memory and persistent cache
+            self.smart_cache.invalidate(category, f"{category}_{key}")
             
             logger.info(f"Cleared custom data from cache for {category}/{key}")
         except Exception as e:
@@ -933,51 +1047,30 @@ class CacheRepository:
         
         Args:
             data_type: Type of custom data (e.g., "translations")
-            key_pattern: Key pattern with optional wildcard (*) 
-                        e.g., "translated_transcript_abc123_*" to match all languages
+            key_pattern: Custom data key (as passed to store_custom_data) with an optional
+                        trailing wildcard (*), e.g. "translated_transcript_abc123_*" to match all languages
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            is_wildcard = "*" in key_pattern
-            if is_wildcard:
-                # Handle wildcard pattern
-                base_pattern = key_pattern.replace("*", "")
-                
-                # First clear from memory cache
-                keys_to_remove = []
-                for cache_key in self.smart_cache._memory_cache.keys():
-                    if cache_key.startswith(f"{data_type}:{base_pattern}"):
-                        keys_to_remove.append(cache_key)
+            if "*" in key_pattern:
+                # Prefix lookup in the key index instead of scanning the namespace.
+                # Custom data is stored under "<category>_<key>"; also match raw keys.
+                base_pattern = key_pattern.split("*", 1)[0]
+                matched_keys = set(self.cache_manager.get_keys_with_prefix(data_type, f"{data_type}_{base_pattern}"))
+                matched_keys.update(self.cache_manager.get_keys_with_prefix(data_type, base_pattern))
                 
-                for key in keys_to_remove:
-                    del self.smart_cache._memory_cache[key]
-                    logger.debug(f"Removed from memory cache: {key}")
-                
-                # Then clear from persistent cache
-                # Get all keys in the namespace
-                all_keys = self.cache_manager.get_all_keys(data_type)
-                if all_keys:
-                    for key in all_keys:
-                        if key.startswith(base_pattern):
-                            self.cache_manager.delete(data_type, key)
-                            logger.debug(f"Removed from persistent cache: {data_type}:{key}")
+                for key in matched_keys:
+                    self.smart_cache.invalidate(data_type, key)
+                    logger.debug(f"Removed custom data: {data_type}:{key}")
             else:
                 # Direct key deletion
-                cache_key = f"{data_type}:{key_pattern}"
-                
-                # Clear from memory cache
-                if cache_key in self.smart_cache._memory_cache:
-                    del self.smart_cache._memory_cache[cache_key]
-                    logger.debug(f"Removed from memory cache: {cache_key}")
-                
-                # Clear from persistent cache
-                self.cache_manager.delete(data_type, key_pattern)
+                self.smart_cache.invalidate(data_type, f"{data_type}_{key_pattern}")
                 
             logger.info(f"Successfully deleted custom data matching {data_type}:{key_pattern}")
             return True
             
         except Exception as e:
             logger.error(f"Error deleting custom data {data_type}:{key_pattern}: {str(e)}")
-            return False
\ No newline at end of file
+            return False
@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 from ..models import VideoData, VideoInfo, TranscriptSegment
 from ..core import YouTubeClient, CacheManager
 from ..utils.logging import get_logger
+from ..utils.single_flight import SingleFlight
 from ..core.config import config
 
 logger = get_logger("youtube_repository")
@@ -30,6 +31,11 @@ class YouTubeRepository:
         self._session: Optional[aiohttp.ClientSession] = None
         self._rate_limiter = asyncio.Semaphore(10)  # 10 concurrent requests
         self._request_times: List[datetime] = []
+        # Concurrent requests for the same video share one fetch
+        self._inflight = SingleFlight("youtube_repository")
+        # Transcript fetches made vs. duplicate fetches avoided by deriving all
+        # representations from one result
+        self._transcript_stats = {"fetches": 0, "duplicate_fetches_saved": 0}
         
         logger.info(f"Initialized YouTubeRepository with max_connections={self.max_connections}")
     
@@ -91,15 +97,19 @@ class YouTubeRepository:
         Returns:
             VideoData object or None if failed
         """
+        video_id = self.extract_video_id(youtube_url)
+        if not video_id:
+            logger.error(f"Invalid YouTube URL: {youtube_url}")
+            return None
+        
+        return await self._inflight.do(video_id, lambda: self._fetch_video_data(youtube_url, video_id))
+    
+    async def _fetch_video_data(self, youtube_url: str, video_id: str) -> Optional[VideoData]:
+        """Fetch metadata and transcript for a single video."""
         async with self._rate_limiter:
             await self._rate_limit()
             
             try:
-                video_id = self.extract_video_id(youtube_url)
-                if not video_id:
-                    logger.error(f"Invalid YouTube URL: {youtube_url}")
-                    return None
-                
                 logger.info(f"Fetching video data for {video_id}")
                 
                 # Fetch video info and transcript concurrently
@@ -165,27 +175,35 @@ class YouTubeRepository:
         return await self.youtube_client.get_video_info(youtube_url)
     
     async def _get_transcript_data(self, youtube_url: str) -> tuple:
-        """Get transcript data using YouTube client."""
+        """Get plain, timestamped and segmented transcript from a single fetch."""
         try:
-            # Get basic transcript
-            transcript = await self.youtube_client.get_transcript(youtube_url)
+            result = await self.youtube_client.get_transcript_result(youtube_url)
+            self._transcript_stats["fetches"] += 1
+            
+            if not result.success:
+                logger.warning(f"Failed to get transcript for {youtube_url}: {result.error}")
+                return None, None, None
+            
+            if not result.from_cache:
+                # Plain and timestamped transcripts used to be fetched separately;
+                # only a real network fetch means a second one was avoided
+                self._transcript_stats["duplicate_fetches_saved"] += 1
             
-            # Get transcript with timestamps
-            timestamped_result = await self.youtube_client.get_transcript_with_timestamps(youtube_url)
+            transcript = result.transcript
+            transcript_list = result.segments
             
-            if timestamped_result and len(timestamped_result) == 2:
-                timestamped_transcript, transcript_list = timestamped_result
+            if transcript_list:
+                timestamped_transcript = self.youtube_client.format_timestamped_transcript(transcript_list)
                 
                 # Convert to TranscriptSegment objects
-                transcript_segments = []
-                if transcript_list:
-                    for item in transcript_list:
-                        segment = TranscriptSegment(
-                            text=item.get('text', ''),
-                            start=item.get('start', 0),
-                            duration=item.get('duration')
-                        )
-                        transcript_segments.append(segment)
+                transcript_segments = [
+                    TranscriptSegment(
+                        text=item.get('text', ''),
+                        start=item.get('start', 0),
+                        duration=item.get('duration')
+                    )
+                    for item in transcript_list
+                ]
                 
                 return transcript, timestamped_transcript, transcript_segments
             else:
@@ -228,26 +246,18 @@ class YouTubeRepository:
             video_data = await self.get_video_data(url)
             return video_data.video_info if video_data else None
         
-        # Process in batches to avoid overwhelming the API
-        batch_size = 5
-        results = []
+        # get_video_data already bounds concurrency (semaphore) and request rate,
+        # so all URLs are submitted at once instead of in fixed, sleep-separated batches
+        results = await asyncio.gather(
+            *(get_single_metadata(url) for url in video_urls),
+            return_exceptions=True
+        )
         
-        for i in range(0, len(video_urls), batch_size):
-            batch = video_urls[i:i + batch_size]
-            batch_tasks = [get_single_metadata(url) for url in batch]
-            batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-            
-            # Handle exceptions
-            batch_results = [
-                result if not isinstance(result, Exception) else None
-                for result in batch_results
-            ]
-            
-            results.extend(batch_results)
-            
-            # Small delay between batches
-            if i + batch_size < len(video_urls):
-                await asyncio.sleep(1)
+        # Handle exceptions
+        results = [
+            result if not isinstance(result, Exception) else None
+            for result in results
+        ]
         
         logger.info(f"Processed {len(video_urls)} videos, {sum(1 for r in results if r)} successful")
         return results
@@ -268,12 +278,18 @@ class YouTubeRepository:
                 "total_connections": total_connections,
                 "max_connections": self.max_connections,
                 "session_closed": self._session.closed if self._session else True,
-                "recent_requests": len(self._request_times)
+                "recent_requests": len(self._request_times),
+                "coalesced_requests": self._inflight.get_stats()["coalesced"],
+                "transcript_fetches": self._transcript_stats["fetches"],
+                "duplicate_transcript_fetches_saved": self._transcript_stats["duplicate_fetches_saved"]
             }
         
         return {
             "total_connections": 0,
             "max_connections": self.max_connections,
             "session_closed": True,
-            "recent_requests": len(self._request_times)
+            "recent_requests": len(self._request_times),
+            "coalesced_requests": self._inflight.get_stats()["coalesced"],
+            "transcript_fetches": self._transcript_stats["fetches"],
+            "duplicate_transcript_fetches_saved": self._transcript_stats["duplicate_fetches_saved"]
         }
\ No newline at end of file
@@ -1,6 +1,8 @@
 """Factory for creating and configuring services."""
 
-from .core import CacheManager, YouTubeClient, LLMManager
+import threading
+
+from .core import CacheManager, YouTubeClient, LLMManager, RobustTranscriptFetcher
 from .repositories import CacheRepository, YouTubeRepository
 from .services import AnalysisService, TranscriptService, ChatService, ContentService
 from .services.translation_service import TranslationService
@@ -11,9 +13,17 @@ logger = get_logger("service_factory")
 
 
 class ServiceFactory:
-    """Factory for creating and managing service dependencies."""
+    """
+    Factory for creating and managing service dependencies.
+    
+    The global instance returned by get_service_factory() is the single owner of
+    the cache, client and service objects, so every module and session shares one
+    memory cache tier instead of building its own.
+    """
     
     def __init__(self):
+        # Re-entrant: getters resolve their dependencies through other getters
+        self._lock = threading.RLock()
         self._cache_manager = None
         self._youtube_client = None
         self._llm_manager = None
@@ -30,95 +40,114 @@ class ServiceFactory:
     
     def get_cache_manager(self) -> CacheManager:
         """Get or create cache manager."""
-        if self._cache_manager is None:
-            self._cache_manager = CacheManager()
-        return self._cache_manager
+        with self._lock:
+            if self._cache_manager is None:
+                self._cache_manager = CacheManager()
+            return self._cache_manager
     
     def get_youtube_client(self) -> YouTubeClient:
         """Get or create YouTube client."""
-        if self._youtube_client is None:
-            cache_manager = self.get_cache_manager()
-            self._youtube_client = YouTubeClient(cache_manager)
-        return self._youtube_client
+        with self._lock:
+            if self._youtube_client is None:
+                cache_manager = self.get_cache_manager()
+                self._youtube_client = YouTubeClient(cache_manager)
+            return self._youtube_client
+    
+    def get_transcript_fetcher(self) -> RobustTranscriptFetcher:
+        """Get the shared transcript fetcher (owned by the YouTube client)."""
+        return self.get_youtube_client().transcript_fetcher
     
     def get_llm_manager(self) -> LLMManager:
         """Get or create LLM manager."""
-        if self._llm_manager is None:
-            self._llm_manager = LLMManager()
-        return self._llm_manager
+        with self._lock:
+            if self._llm_manager is None:
+                self._llm_manager = LLMManager()
+            return self._llm_manager
     
     def get_cache_repository(self) -> CacheRepository:
         """Get or create cache repository."""
-        if self._cache_repository is None:
-            cache_manager = self.get_cache_manager()
-            self._cache_repository = CacheRepository(cache_manager)
-        return self._cache_repository
+        with self._lock:
+            if self._cache_repository is None:
+                cache_manager = self.get_cache_manager()
+                self._cache_repository = CacheRepository(cache_manager)
+            return self._cache_repository
     
     def get_youtube_repository(self) -> YouTubeRepository:
         """Get or create YouTube repository."""
-        if self._youtube_repository is None:
-            youtube_client = self.get_youtube_client()
-            self._youtube_repository = YouTubeRepository(youtube_client)
-        return self._youtube_repository
+        with self._lock:
+            if self._youtube_repository is None:
+                youtube_client = self.get_youtube_client()
+                self._youtube_repository = YouTubeRepository(youtube_client)
+            return self._youtube_repository
     
     def get_analysis_service(self) -> AnalysisService:
         """Get or create analysis service."""
-        if self._analysis_service is None:
-            cache_repo = self.get_cache_repository()
-            youtube_repo = self.get_youtube_repository()
-            llm_manager = self.get_llm_manager()
-            self._analysis_service = AnalysisService(cache_repo, youtube_repo, llm_manager)
-        return self._analysis_service
+        with self._lock:
+            if self._analysis_service is None:
+                cache_repo = self.get_cache_repository()
+                youtube_repo = self.get_youtube_repository()
+                llm_manager = self.get_llm_manager()
+                self._analysis_service = AnalysisService(cache_repo, youtube_repo, llm_manager)
+            return self._analysis_service
     
     def get_transcript_service(self) -> TranscriptService:
         """Get or create transcript service."""
-        if self._transcript_service is None:
-            cache_repo = self.get_cache_repository()
-            youtube_repo = self.get_youtube_repository()
-            self._transcript_service = TranscriptService(cache_repo, youtube_repo)
-        return self._transcript_service
+        with self._lock:
+            if self._transcript_service is None:
+                cache_repo = self.get_cache_repository()
+                youtube_repo = self.get_youtube_repository()
+                self._transcript_service = TranscriptService(
+                    cache_repo, youtube_repo, robust_fetcher=self.get_transcript_fetcher()
+                )
+            return self._transcript_service
     
     def get_chat_service(self) -> ChatService:
         """Get or create chat service."""
-        if self._chat_service is None:
-            cache_repo = self.get_cache_repository()
-            youtube_repo = self.get_youtube_repository()
-            self._chat_service = ChatService(cache_repo, youtube_repo)
-        return self._chat_service
+        with self._lock:
+            if self._chat_service is None:
+                cache_repo = self.get_cache_repository()
+                youtube_repo = self.get_youtube_repository()
+                llm_manager = self.get_llm_manager()
+                self._chat_service = ChatService(cache_repo, youtube_repo, llm_manager)
+            return self._chat_service
     
     def get_content_service(self) -> ContentService:
         """Get or create content service."""
-        if self._content_service is None:
-            cache_repo = self.get_cache_repository()
-            self._content_service = ContentService(cache_repo)
-        return self._content_service
+        with self._lock:
+            if self._content_service is None:
+                cache_repo = self.get_cache_repository()
+                llm_manager = self.get_llm_manager()
+                self._content_service = ContentService(cache_repo, llm_manager)
+            return self._content_service
     
     def get_translation_service(self) -> TranslationService:
         """Get or create translation service."""
-        if self._translation_service is None:
-            cache_repo = self.get_cache_repository()
-            youtube_repo = self.get_youtube_repository()
-            llm_manager = self.get_llm_manager()
-            self._translation_service = TranslationService(cache_repo, youtube_repo, llm_manager)
-        return self._translation_service
+        with self._lock:
+            if self._translation_service is None:
+                cache_repo = self.get_cache_repository()
+                youtube_repo = self.get_youtube_repository()
+                llm_manager = self.get_llm_manager()
+                self._translation_service = TranslationService(cache_repo, youtube_repo, llm_manager)
+            return self._translation_service
     
     # Removed unused subtitle generation service
     
     def get_video_analysis_workflow(self) -> VideoAnalysisWorkflow:
         """Get or create video analysis workflow."""
-        if self._workflow is None:
-            analysis_service = self.get_analysis_service()
-            transcript_service = self.get_transcript_service()
-            chat_service = self.get_chat_service()
-            content_service = self.get_content_service()
+        with self._lock:
+            if self._workflow is None:
+                analysis_service = self.get_analysis_service()
+                transcript_service = self.get_transcript_service()
+                chat_service = self.get_chat_service()
+                content_service = self.get_content_service()
             
-            self._workflow = VideoAnalysisWorkflow(
-                analysis_service,
-                transcript_service,
-                chat_service,
-                content_service
-            )
-        return self._workflow
+                self._workflow = VideoAnalysisWorkflow(
+                    analysis_service,
+                    transcript_service,
+                    chat_service,
+                    content_service
+                )
+            return self._workflow
     
     async def cleanup(self):
         """Cleanup all services."""
@@ -128,18 +157,27 @@ class ServiceFactory:
         if self._youtube_repository:
             await self._youtube_repository.cleanup()
         
+        if self._youtube_client:
+            self._youtube_client.transcript_fetcher.close()
+        
+        if self._cache_manager:
+            self._cache_manager.close()
+        
         logger.info("ServiceFactory cleanup completed")
 
 
-# Global service factory instance
+# Global service factory instance (process-wide registry)
 _service_factory = None
+_service_factory_lock = threading.Lock()
 
 
 def get_service_factory() -> ServiceFactory:
     """Get the global service factory instance."""
     global _service_factory
     if _service_factory is None:
-        _service_factory = ServiceFactory()
+        with _service_factory_lock:
+            if _service_factory is None:
+                _service_factory = ServiceFactory()
     return _service_factory
 
 
@@ -175,6 +213,7 @@ def get_translation_service() -> TranslationService:
 async def cleanup_services():
     """Cleanup all services."""
     global _service_factory
-    if _service_factory:
-        await _service_factory.cleanup()
-        _service_factory = None
\ No newline at end of file
+    with _service_factory_lock:
+        factory, _service_factory = _service_factory, None
+    if factory:
+        await factory.cleanup()
\ No newline at end of file
@@ -7,6 +7,7 @@ from datetime import datetime
 from ..models import ChatSession, ChatMessage, MessageRole, VideoData, AnalysisResult
 from ..repositories import CacheRepository, YouTubeRepository
 from ..utils.chat_utils import setup_chat_for_video_async
+from ..utils.vectorstore_cache import get_vectorstore_cache
 from ..utils.logging import get_logger
 from ..core import LLMManager
 from ..core.config import CHAT_WELCOME_TEMPLATE, config
@@ -17,11 +18,17 @@ logger = get_logger("chat_service")
 class ChatService:
     """Service for chat operations with video context."""
     
-    def __init__(self, cache_repository: CacheRepository, youtube_repository: YouTubeRepository):
+    def __init__(
+        self,
+        cache_repository: CacheRepository,
+        youtube_repository: YouTubeRepository,
+        llm_manager: Optional[LLMManager] = None
+    ):
         self.cache_repo = cache_repository
         self.youtube_repo = youtube_repository
-        self.llm_manager = LLMManager()
-        self._chat_agents = {}  # Cache for chat agents by video_id
+        self.llm_manager = llm_manager or LLMManager()
+        # Agents live alongside their loaded FAISS index in the shared, byte-bounded LRU
+        self._index_cache = get_vectorstore_cache()
         logger.info("Initialized ChatService")
     
     def _estimate_tokens(self, text: str) -> int:
@@ -177,8 +184,9 @@ class ChatService:
     async def _get_or_create_chat_agent(self, video_id: str):
         """Get existing or create new chat agent for a video."""
         # Check cache
-        if video_id in self._chat_agents:
-            return self._chat_agents[video_id]
+        agent = self._index_cache.get_agent(video_id)
+        if agent is not None:
+            return agent
         
         # Try to get video data from cache first
         video_data = await self.cache_repo.get_video_data(video_id)
@@ -193,7 +201,7 @@ class ChatService:
                 return None
             
             # Cache the agent
-            self._chat_agents[video_id] = chat_details["agent"]
+            self._index_cache.set_agent(video_id, chat_details["agent"])
             return chat_details["agent"]
         
         # Fallback: derive YouTube URL and build context even if video_data isn't cached
@@ -212,7 +220,7 @@ class ChatService:
             return None
         
         # Cache the agent
-        self._chat_agents[video_id] = chat_details["agent"]
+        self._index_cache.set_agent(video_id, chat_details["agent"])
         return chat_details["agent"]
     
     def _format_chat_history(self, chat_history: List[Dict[str, str]]) -> str:
@@ -482,8 +490,7 @@ class ChatService:
             await self.cache_repo.clear_chat_session(video_id)
             
             # Also clear from in-memory agent cache
-            if video_id in self._chat_agents:
-                del self._chat_agents[video_id]
+            self._index_cache.discard_agent(video_id)
             
             logger.info(f"Cleared chat session for video {video_id}")
             return True
@@ -492,6 +499,10 @@ class ChatService:
             logger.error(f"Error clearing chat session for video {video_id}: {str(e)}")
             return False
     
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get statistics for the in-memory cache of loaded FAISS indexes and chat agents."""
+        return self._index_cache.get_stats()
+    
     async def initialize_chat_session_with_welcome(
         self, 
         video_id: str, 
@@ -14,9 +14,9 @@ logger = get_logger("content_service")
 class ContentService:
     """Service for content generation and formatting."""
     
-    def __init__(self, cache_repository: CacheRepository):
+    def __init__(self, cache_repository: CacheRepository, llm_manager: Optional[LLMManager] = None):
         self.cache_repo = cache_repository
-        self.llm_manager = LLMManager()
+        self.llm_manager = llm_manager or LLMManager()
         logger.info("Initialized ContentService")
     
     async def generate_single_content(
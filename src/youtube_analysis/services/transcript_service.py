@@ -16,14 +16,31 @@ logger = get_logger("transcript_service")
 class TranscriptService:
     """Service for transcript-related operations."""
     
-    def __init__(self, cache_repository: CacheRepository, youtube_repository: YouTubeRepository):
+    def __init__(
+        self,
+        cache_repository: CacheRepository,
+        youtube_repository: YouTubeRepository,
+        robust_fetcher: Optional[RobustTranscriptFetcher] = None
+    ):
         self.cache_repo = cache_repository
         self.youtube_repo = youtube_repository
-        self.whisper_transcriber = WhisperTranscriber()
-        # Use the repository's CacheManager instance
-        self.robust_fetcher = RobustTranscriptFetcher(cache_manager=cache_repository.cache_manager)
+        # Prefer the shared fetcher; otherwise build one on the repository's CacheManager instance
+        self.robust_fetcher = robust_fetcher or RobustTranscriptFetcher(cache_manager=cache_repository.cache_manager)
         logger.info("Initialized TranscriptService with robust transcript fetching")
     
+    @property
+    def whisper_transcriber(self) -> WhisperTranscriber:
+        """Default (OpenAI) Whisper transcriber, shared with the robust fetcher."""
+        return self.robust_fetcher.whisper_openai
+    
+    def _get_whisper_transcriber(self, provider: str) -> WhisperTranscriber:
+        """Get the shared Whisper transcriber for a provider."""
+        if provider == "groq":
+            return self.robust_fetcher.whisper_groq
+        if provider == "local":
+            return self.robust_fetcher.whisper_local
+        return self.robust_fetcher.whisper_openai
+    
     async def get_transcript(self, youtube_url: str, use_cache: bool = True, preferred_language: Optional[str] = None) -> Optional[str]:
         """Get plain transcript for a video using robust fetching."""
         try:
@@ -229,7 +246,7 @@ class TranscriptService:
             language: ISO-639-1 language code
             model_name: Whisper model to use (whisper-1, gpt-4o-transcribe, gpt-4o-mini-transcribe)
             use_cache: Whether to use cached transcript
-            transcription_model: 'openai' or 'groq'
+            transcription_model: 'openai', 'groq' or 'local'
         Returns:
             Tuple of (transcript text, segment list) or None if error
         """
@@ -239,13 +256,13 @@ class TranscriptService:
             return None
         cache_key = f"whisper_transcript_{video_id}_{language}_{model_name or 'default'}_{transcription_model}"
         if use_cache:
-            cached_data = await self.cache_repo.get_custom_data("transcripts", cache_key)
+            cached_data = await self.cache_repo.get_custom_data("transcripts", cache_key, video_id=video_id)
             if cached_data:
                 logger.info(f"Using cached Whisper transcript for {video_id}")
                 return cached_data.get("text"), cached_data.get("segments")
         try:
             logger.info(f"Transcribing {video_id} with Whisper API ({transcription_model})")
-            whisper_transcriber = WhisperTranscriber(provider=transcription_model, default_model=model_name)
+            whisper_transcriber = self._get_whisper_transcriber(transcription_model)
             transcript_obj = await whisper_transcriber.get(
                 video_id=video_id, 
                 language=language,
@@ -270,7 +287,8 @@ class TranscriptService:
                     {
                         "text": transcript_text,
                         "segments": segments_list
-                    }
+                    },
+                    video_id=video_id
                 )
             logger.info(f"Successfully transcribed {video_id} with Whisper ({transcription_model})")
             return transcript_text, segments_list
@@ -296,7 +314,7 @@ class TranscriptService:
             language: ISO-639-1 language code
             model_name: Whisper model to use
             use_cache: Whether to use cached transcript
-            transcription_model: 'openai' or 'groq'
+            transcription_model: 'openai', 'groq' or 'local'
         Returns:
             Tuple of (transcript text, segment list) or None if error
         """
@@ -373,7 +391,7 @@ class TranscriptService:
         Args:
             youtube_url: YouTube URL
             use_cache: Whether to use cached data
-            transcription_model: 'openai' or 'groq'
+            transcription_model: 'openai', 'groq' or 'local'
         Returns:
             List of transcript segments
         """
@@ -462,7 +480,7 @@ class TranscriptService:
         
         # Try to get from cache first
         if use_cache:
-            cached_data = await self.cache_repo.get_custom_data("translations", cache_key)
+            cached_data = await self.cache_repo.get_custom_data("translations", cache_key, video_id=video_id)
             if cached_data:
                 logger.info(f"Using cached translation for {video_id} to {target_language}")
                 return cached_data.get("text"), cached_data.get("segments")
@@ -491,7 +509,8 @@ class TranscriptService:
                     {
                         "text": translated_text,
                         "segments": translated_segments
-                    }
+                    },
+                    video_id=video_id
                 )
             
             logger.info(f"Successfully translated transcript for {video_id} to {target_language}")
@@ -74,7 +74,7 @@ class TranslationService:
         
         # Try to get from cache first
         if use_cache and video_id:
-            cached_data = await self.cache_repo.get_custom_data("translations", cache_key)
+            cached_data = await self.cache_repo.get_custom_data("translations", cache_key, video_id=video_id)
             if cached_data:
                 logger.info(f"Using cached translation for {video_id} to {target_language}")
                 return cached_data.get("text"), cached_data.get("segments")
@@ -95,7 +95,8 @@ class TranslationService:
                     {
                         "text": translated_text,
                         "segments": translated_segments
-                    }
+                    },
+                    video_id=video_id
                 )
             
             logger.info(f"Successfully translated transcript to {target_language}")
@@ -1,15 +1,24 @@
 """Transcription functionality for YouTube videos."""
 
-from .models import Transcript, TranscriptSegment
+from .models import Transcript, TranscriptSegment, AudioChunk
 from .base import BaseTranscriber, TranscriptUnavailable
+from .audio_cache import AudioArtifactCache, get_audio_cache
+from .piped import PipedInstanceRegistry, get_piped_registry
 from .whisper import WhisperTranscriber
+from .local_whisper import LocalWhisperTranscriber
 from .factory import TranscriberFactory
 
 __all__ = [
     "Transcript",
     "TranscriptSegment",
+    "AudioChunk",
     "BaseTranscriber",
     "WhisperTranscriber",
+    "LocalWhisperTranscriber",
     "TranscriptUnavailable",
+    "AudioArtifactCache",
+    "get_audio_cache",
+    "PipedInstanceRegistry",
+    "get_piped_registry",
     "TranscriberFactory"
 ] 
\ No newline at end of file
@@ -0,0 +1,301 @@
+"""On-disk LRU cache for downloaded, transcoded and split Whisper audio and per-chunk results."""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .models import AudioChunk
+
+logger = logging.getLogger("youtube_analysis.transcription")
+
+_MANIFEST = "manifest.json"
+_STAGING = ".staging"
+
+
+class AudioArtifactCache:
+    """
+    Size-bounded cache of audio artifacts keyed by (video_id, kind).
+
+    Each entry lives under a name derived from the SHA-256 of its key, either as
+    a single file (source download, speech transcode) or a directory holding a
+    chunk set plus manifest. The directory is scanned once at startup into an
+    in-memory index of digest -> (path, size, last use), so lookups never list
+    the cache and eviction works from a running byte total. Recency is also
+    written to the entry's mtime so it survives restarts, and the least recently
+    used entries are evicted once the byte budget is exceeded. Entries for
+    videos currently being processed are pinned and never evicted.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._staging_dir = self.cache_dir / _STAGING
+        self._staging_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._pinned = Counter()
+        self._owners: Dict[str, str] = {}  # entry digest -> video_id
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._index: Dict[str, Dict[str, Any]] = {}  # digest -> {"path", "size", "used"}
+        self._total_bytes = 0
+        self._scan()
+
+    @staticmethod
+    def _digest(video_id: str, kind: str) -> str:
+        return hashlib.sha256(f"{video_id}:{kind}".encode("utf-8")).hexdigest()[:32]
+
+    def _scan(self) -> None:
+        """Build the in-memory index from what is already on disk."""
+        for path in self.cache_dir.iterdir():
+            if path.name == _STAGING:
+                continue
+            try:
+                size = self._entry_size(path)
+                used = path.stat().st_mtime
+            except OSError:
+                continue
+            self._index[path.name.split(".", 1)[0]] = {"path": path, "size": size, "used": used, "is_dir": path.is_dir()}
+            self._total_bytes += size
+
+    def _lookup(self, digest: str, is_dir: bool) -> Optional[Path]:
+        """Return the indexed path for digest and mark it used; drop it if it vanished from disk."""
+        entry = self._index.get(digest)
+        if entry is None or entry["is_dir"] != is_dir:
+            return None
+        try:
+            os.utime(entry["path"])
+        except OSError:
+            self._forget(digest)
+            return None
+        entry["used"] = time.time()
+        return entry["path"]
+
+    def _register(self, digest: str, path: Path, size: int, is_dir: bool = False) -> None:
+        self._forget(digest)
+        self._index[digest] = {"path": path, "size": size, "used": time.time(), "is_dir": is_dir}
+        self._total_bytes += size
+
+    def _forget(self, digest: str) -> None:
+        entry = self._index.pop(digest, None)
+        if entry is not None:
+            self._total_bytes -= entry["size"]
+
+    @staticmethod
+    def _entry_size(path: Path) -> int:
+        if path.is_dir():
+            return sum(f.stat().st_size for f in path.iterdir() if f.is_file())
+        return path.stat().st_size
+
+    def get(self, video_id: str, kind: str) -> Optional[Path]:
+        """Return the cached file for (video_id, kind) and mark it recently used."""
+        digest = self._digest(video_id, kind)
+        with self._lock:
+            path = self._lookup(digest, is_dir=False)
+            if path is None:
+                self._stats["misses"] += 1
+                return None
+            self._owners[digest] = video_id
+            self._stats["hits"] += 1
+        logger.debug(f"Audio cache hit for {video_id} ({kind})")
+        return path
+
+    def staging_path(self, suffix: str = "") -> Path:
+        """Return a fresh path on the cache filesystem for writing an artifact before put()."""
+        return self._staging_dir / f"{uuid.uuid4().hex}{suffix}"
+
+    def put(self, video_id: str, kind: str, src_path: Path) -> Path:
+        """Move src_path into the cache as (video_id, kind) and return the cached path."""
+        digest = self._digest(video_id, kind)
+        dest = self.cache_dir / f"{digest}{Path(src_path).suffix}"
+        if Path(src_path).parent != self._staging_dir:
+            # Cross-filesystem moves copy, so do that outside the lock
+            staged = self.staging_path(Path(src_path).suffix)
+            shutil.move(str(src_path), str(staged))
+            src_path = staged
+        size = os.path.getsize(src_path)
+        with self._lock:
+            existing = self._index.get(digest)
+            if existing is not None and existing["path"] != dest:
+                self._delete(existing["path"])
+            os.replace(src_path, dest)
+            self._register(digest, dest, size)
+            self._owners[digest] = video_id
+            self._stats["stores"] += 1
+        self._evict()
+        return dest
+
+    def get_chunks(self, video_id: str, kind: str) -> Optional[List[AudioChunk]]:
+        """Return a cached chunk set for (video_id, kind), if complete."""
+        digest = self._digest(video_id, kind)
+        with self._lock:
+            entry = self._lookup(digest, is_dir=True)
+            try:
+                if entry is None:
+                    raise FileNotFoundError(digest)
+                with open(entry / _MANIFEST, "r", encoding="utf-8") as f:
+                    manifest = json.load(f)
+                chunks = [
+                    AudioChunk(path=entry / c["file"], start_ms=c["start_ms"], end_ms=c["end_ms"], overlap_ms=c["overlap_ms"])
+                    for c in manifest
+                ]
+            except (OSError, ValueError, KeyError):
+                self._stats["misses"] += 1
+                return None
+            self._owners[digest] = video_id
+            self._stats["hits"] += 1
+        logger.debug(f"Audio cache hit for {video_id} ({kind}, {len(chunks)} chunks)")
+        return chunks
+
+    def put_chunks(self, video_id: str, kind: str, chunks: List[AudioChunk]) -> List[AudioChunk]:
+        """Move chunk files into the cache as one entry and return chunks pointing at the cached files."""
+        digest = self._digest(video_id, kind)
+        staging = self._staging_dir / uuid.uuid4().hex
+        staging.mkdir()
+        cached = []
+        manifest = []
+        size = 0
+        for chunk in chunks:
+            size += chunk.path.stat().st_size
+            shutil.move(str(chunk.path), str(staging / chunk.path.name))
+            manifest.append({
+                "file": chunk.path.name,
+                "start_ms": chunk.start_ms,
+                "end_ms": chunk.end_ms,
+                "overlap_ms": chunk.overlap_ms
+            })
+        if chunks:
+            try:
+                chunks[0].path.parent.rmdir()  # drop the splitter's now-empty temp dir
+            except OSError:
+                pass
+        # Manifest is written last so a partially moved set is never treated as complete
+        with open(staging / _MANIFEST, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        size += (staging / _MANIFEST).stat().st_size
+
+        dest = self.cache_dir / digest
+        with self._lock:
+            if dest.exists():
+                self._delete(dest)
+            os.replace(staging, dest)
+            self._register(digest, dest, size, is_dir=True)
+            self._owners[digest] = video_id
+            self._stats["stores"] += 1
+        for chunk, entry in zip(chunks, manifest):
+            cached.append(AudioChunk(path=dest / entry["file"], start_ms=chunk.start_ms, end_ms=chunk.end_ms, overlap_ms=chunk.overlap_ms))
+        self._evict()
+        return cached
+
+    def get_json(self, video_id: str, kind: str) -> Optional[Any]:
+        """Return a cached JSON artifact (e.g. a chunk's transcript segments) for (video_id, kind)."""
+        path = self.get(video_id, kind)
+        if path is None:
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable audio cache entry {path}: {e}")
+            return None
+
+    def put_json(self, video_id: str, kind: str, data: Any) -> Path:
+        """Store a JSON-serialisable artifact for (video_id, kind)."""
+        staged = self.staging_path(".json")
+        with open(staged, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        return self.put(video_id, kind, staged)
+
+    @contextmanager
+    def pin(self, video_id: str):
+        """Protect every entry of video_id from eviction while the block runs."""
+        with self._lock:
+            self._pinned[video_id] += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._pinned[video_id] -= 1
+                if self._pinned[video_id] <= 0:
+                    del self._pinned[video_id]
+
+    def _delete(self, path: Path) -> None:
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            path.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        with self._lock:
+            if self._total_bytes <= self.max_bytes:
+                return
+            for digest, entry in sorted(self._index.items(), key=lambda item: item[1]["used"]):
+                if self._total_bytes <= self.max_bytes:
+                    break
+                if self._owners.get(digest) in self._pinned:
+                    continue
+                self._delete(entry["path"])
+                self._forget(digest)
+                self._owners.pop(digest, None)
+                self._stats["evictions"] += 1
+                logger.debug(f"Evicted audio cache entry {entry['path'].name} ({entry['size']} bytes)")
+
+    def clear(self) -> None:
+        """Remove all cached audio."""
+        with self._lock:
+            for entry in self._index.values():
+                self._delete(entry["path"])
+            self._index.clear()
+            self._total_bytes = 0
+            self._owners.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+                "entries": len(self._index),
+                "size_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "pinned_videos": len(self._pinned)
+            }
+
+
+_shared_cache: Optional[AudioArtifactCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_audio_cache() -> Optional[AudioArtifactCache]:
+    """
+    Get the process-wide audio cache, or None when disabled.
+
+    Configured by WHISPER_AUDIO_CACHE_ENABLED, WHISPER_AUDIO_CACHE_DIR (default
+    <CACHE_DIR>/audio) and WHISPER_AUDIO_CACHE_MAX_MB. Shared so that
+    transcribers for different providers reuse the same downloads.
+    """
+    global _shared_cache
+    if os.environ.get("WHISPER_AUDIO_CACHE_ENABLED", "true").lower() != "true":
+        return None
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                # Imported lazily: core imports this package at module load
+                from ..core.config import config
+                cache_dir = Path(os.environ.get("WHISPER_AUDIO_CACHE_DIR", str(Path(config.cache.cache_dir) / "audio")))
+                max_bytes = int(float(os.environ.get("WHISPER_AUDIO_CACHE_MAX_MB", "2048")) * 1024 * 1024)
+                try:
+                    _shared_cache = AudioArtifactCache(cache_dir, max_bytes)
+                except OSError as e:
+                    logger.warning(f"Audio cache disabled, cannot use {cache_dir}: {e}")
+                    return None
+    return _shared_cache
@@ -3,6 +3,7 @@
 from typing import Optional
 from .base import BaseTranscriber
 from .whisper import WhisperTranscriber
+from .local_whisper import LocalWhisperTranscriber
 
 class TranscriberFactory:
     """Factory for creating transcribers."""
@@ -13,7 +14,7 @@ class TranscriberFactory:
         Create a transcriber instance based on type.
         
         Args:
-            transcriber_type: Type of transcriber ('whisper' currently the only supported type)
+            transcriber_type: 'whisper' (OpenAI/Groq API) or 'local' (faster-whisper on CPU)
             **kwargs: Additional arguments to pass to the transcriber constructor
             
         Returns:
@@ -26,5 +27,7 @@ class TranscriberFactory:
             # Extract model_name if provided
             model_name = kwargs.get("model_name")
             return WhisperTranscriber(default_model=model_name)
+        elif transcriber_type.lower() in ("local", "faster-whisper"):
+            return LocalWhisperTranscriber(model_size=kwargs.get("model_name"))
         else:
             raise ValueError(f"Unsupported transcriber type: {transcriber_type}") 
\ No newline at end of file
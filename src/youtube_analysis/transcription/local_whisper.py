@@ -0,0 +1,156 @@
+"""Local CPU transcription with faster-whisper (CTranslate2)."""
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from faster_whisper import WhisperModel, BatchedInferencePipeline
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+from .base import TranscriptUnavailable
+from .models import Transcript, TranscriptSegment
+from .whisper import WhisperTranscriber
+
+logger = logging.getLogger("youtube_analysis.transcription")
+
+
+class LocalWhisperTranscriber(WhisperTranscriber):
+    """
+    Transcribe downloaded audio on the local CPU with faster-whisper.
+
+    Reuses WhisperTranscriber's download pipeline and audio cache, but runs
+    inference in-process instead of calling a remote API, so there is no upload
+    size limit and no chunk splitting. Loaded models are shared process-wide and
+    stay warm between calls.
+    """
+
+    # API model names that callers may pass through; they map to the local default
+    _API_MODEL_NAMES = set(WhisperTranscriber._SUPPORTED_MODELS)
+
+    _models: Dict[Tuple[Any, ...], Any] = {}
+    _models_lock = threading.Lock()
+
+    def __init__(
+        self,
+        model_size: Optional[str] = None,
+        compute_type: Optional[str] = None,
+        cpu_threads: Optional[int] = None,
+        num_workers: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        vad_filter: bool = True,
+        **kwargs
+    ):
+        """
+        Args:
+            model_size: faster-whisper model size or path (env LOCAL_WHISPER_MODEL, default 'small')
+            compute_type: CTranslate2 compute type (env LOCAL_WHISPER_COMPUTE_TYPE, default 'int8')
+            cpu_threads: Threads per inference (env LOCAL_WHISPER_CPU_THREADS, 0 = library default)
+            num_workers: Concurrent transcriptions sharing the model (env LOCAL_WHISPER_NUM_WORKERS)
+            batch_size: Batch size for VAD-segmented batched inference, <= 1 disables it (env LOCAL_WHISPER_BATCH_SIZE)
+            vad_filter: Skip non-speech with Silero VAD in unbatched mode
+            **kwargs: Passed to WhisperTranscriber (download, cache and post-processing options)
+        """
+        kwargs.setdefault("provider", "local")
+        super().__init__(**kwargs)
+        self.model_size = model_size or os.environ.get("LOCAL_WHISPER_MODEL", "small")
+        self.compute_type = compute_type or os.environ.get("LOCAL_WHISPER_COMPUTE_TYPE", "int8")
+        self.cpu_threads = cpu_threads if cpu_threads is not None else int(os.environ.get("LOCAL_WHISPER_CPU_THREADS", "0"))
+        self.num_workers = max(1, num_workers or int(os.environ.get("LOCAL_WHISPER_NUM_WORKERS", "1")))
+        self.batch_size = batch_size if batch_size is not None else int(os.environ.get("LOCAL_WHISPER_BATCH_SIZE", "8"))
+        self.vad_filter = vad_filter
+        self.default_model = self.model_size
+        self._executor = ThreadPoolExecutor(max_workers=self.num_workers, thread_name_prefix="local-whisper")
+
+    def _resolve_model_size(self, model_name: Optional[str]) -> str:
+        if not model_name or model_name in self._API_MODEL_NAMES:
+            return self.model_size
+        return model_name
+
+    def _load_model(self, model_size: str):
+        """Return a warm model for model_size, loading it once per process."""
+        if not FASTER_WHISPER_AVAILABLE:
+            raise TranscriptUnavailable("faster-whisper is not installed (pip install faster-whisper)")
+        key = (model_size, self.compute_type, self.cpu_threads, self.num_workers)
+        with self._models_lock:
+            model = self._models.get(key)
+            if model is None:
+                logger.info(f"Loading faster-whisper model {model_size} ({self.compute_type}, cpu)")
+                model = WhisperModel(
+                    model_size,
+                    device="cpu",
+                    compute_type=self.compute_type,
+                    cpu_threads=self.cpu_threads,
+                    num_workers=self.num_workers
+                )
+                self._models[key] = model
+            return model
+
+    def _transcribe_sync(self, audio_path: Path, language: Optional[str], model_size: str, prompt: Optional[str]) -> List[Dict[str, Any]]:
+        model = self._load_model(model_size)
+        options = {"language": language or None, "initial_prompt": prompt}
+        if self.batch_size > 1:
+            # Batched mode splits on VAD speech segments and decodes them together
+            segments, info = BatchedInferencePipeline(model=model).transcribe(
+                str(audio_path), batch_size=self.batch_size, **options
+            )
+        else:
+            segments, info = model.transcribe(str(audio_path), vad_filter=self.vad_filter, beam_size=5, **options)
+        # segments is a lazy generator; decoding happens while iterating
+        cues = [
+            {"text": seg.text.strip(), "start": seg.start, "duration": seg.end - seg.start}
+            for seg in segments
+            if seg.text.strip()
+        ]
+        logger.debug(f"Local transcription of {audio_path} done ({info.language}, {info.duration:.0f}s audio)")
+        return cues
+
+    async def _call_whisper(
+        self,
+        audio_path: Path,
+        language: str,
+        model: str,
+        prompt: str = None
+    ) -> List[Dict[str, Any]]:
+        """Run local inference in the worker pool without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._transcribe_sync, audio_path, language, self._resolve_model_size(model), prompt
+        )
+
+    async def get(
+        self,
+        *,
+        video_id: str,
+        language: str,
+        model_name: str = None,
+        prompt: str = None
+    ) -> Transcript:
+        """
+        Get transcript by transcribing the video's audio locally.
+        Args:
+            video_id: YouTube video ID
+            language: ISO-639-1 language code (empty for auto-detection)
+            model_name: faster-whisper model size; API model names fall back to the configured size
+            prompt: Optional initial prompt
+        Returns:
+            Transcript object
+        """
+        model_size = self._resolve_model_size(model_name)
+        logger.debug(f"Local Whisper transcription for {video_id} (model={model_size})")
+        async with self._download_audio(video_id) as audio_path:
+            cues = await self._call_whisper(audio_path, language, model_size, prompt or self.prompt)
+        segments = [TranscriptSegment(text=c["text"], start=c["start"], duration=c["duration"]) for c in cues]
+        if self.use_post_processing:
+            segments = await self._post_process_transcript(segments, language)
+        return Transcript(video_id=video_id, language=language, source=self.provider, segments=segments)
+
+    def close(self) -> None:
+        """Shut down the inference worker pool (loaded models stay cached)."""
+        self._executor.shutdown(wait=False)
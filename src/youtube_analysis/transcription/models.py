@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from pathlib import Path
 from typing import List, Optional
 
 @dataclass
@@ -56,4 +57,22 @@ class Transcript:
             "language": self.language,
             "source": self.source,
             "segments": [segment.to_dict() for segment in self.segments]
-        } 
\ No newline at end of file
+        } 
+
+@dataclass
+class AudioChunk:
+    """A slice of a longer audio file, with its exact position in the original."""
+    path: Path
+    start_ms: int
+    end_ms: int
+    overlap_ms: int = 0  # leading audio that duplicates the end of the previous chunk
+    
+    @property
+    def start_sec(self) -> float:
+        """Offset of the chunk's first sample in the original audio, in seconds."""
+        return self.start_ms / 1000.0
+    
+    @property
+    def duration_ms(self) -> int:
+        """Length of the chunk in milliseconds."""
+        return self.end_ms - self.start_ms
@@ -0,0 +1,118 @@
+"""Health tracking for public Piped instances used as an audio download fallback."""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("youtube_analysis.transcription")
+
+DEFAULT_PIPED_INSTANCES = [
+    "https://piped.video",
+    "https://piped.projectsegfau.lt",
+    "https://piped.in.projectsegfau.lt",
+    "https://watch.leptons.xyz",
+    "https://piped.privacydev.net",
+    "https://piped.mha.fi",
+]
+
+
+class PipedInstanceRegistry:
+    """
+    Per-instance latency and failure record for Piped API hosts.
+
+    Latency is an exponentially weighted moving average of successful probes.
+    Each failure puts the instance in a cooldown that doubles with consecutive
+    failures, so dead hosts stop being probed first but are retried eventually.
+    """
+
+    _EWMA_ALPHA = 0.3
+    _UNKNOWN_LATENCY_SEC = 2.0  # prior for instances without measurements
+    _MAX_COOLDOWN_SEC = 3600
+
+    def __init__(self, instances: List[str], failure_cooldown_sec: float = 120):
+        self.failure_cooldown_sec = failure_cooldown_sec
+        self._lock = threading.Lock()
+        self._order = list(dict.fromkeys(i.rstrip("/") for i in instances if i))
+        self._health: Dict[str, Dict[str, Any]] = {
+            base: {"latency_sec": None, "successes": 0, "failures": 0, "consecutive_failures": 0, "cooldown_until": 0.0}
+            for base in self._order
+        }
+
+    def record_success(self, base: str, latency_sec: float) -> None:
+        """Record a successful request to base that took latency_sec."""
+        with self._lock:
+            health = self._health.get(base)
+            if health is None:
+                return
+            previous = health["latency_sec"]
+            health["latency_sec"] = latency_sec if previous is None else (
+                self._EWMA_ALPHA * latency_sec + (1 - self._EWMA_ALPHA) * previous
+            )
+            health["successes"] += 1
+            health["consecutive_failures"] = 0
+            health["cooldown_until"] = 0.0
+
+    def record_failure(self, base: str) -> None:
+        """Record a failed request to base and start its cooldown."""
+        with self._lock:
+            health = self._health.get(base)
+            if health is None:
+                return
+            health["failures"] += 1
+            health["consecutive_failures"] += 1
+            cooldown = min(
+                self._MAX_COOLDOWN_SEC,
+                self.failure_cooldown_sec * 2 ** (health["consecutive_failures"] - 1)
+            )
+            health["cooldown_until"] = time.monotonic() + cooldown
+
+    def ranked(self) -> List[str]:
+        """Return instances fastest-first, with those in cooldown moved to the end."""
+        now = time.monotonic()
+        with self._lock:
+            def key(base: str):
+                health = self._health[base]
+                cooling = health["cooldown_until"] > now
+                latency = health["latency_sec"] if health["latency_sec"] is not None else self._UNKNOWN_LATENCY_SEC
+                return (cooling, health["cooldown_until"] if cooling else latency)
+            return sorted(self._order, key=key)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-instance health statistics."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                base: {
+                    "latency_ms": round(h["latency_sec"] * 1000) if h["latency_sec"] is not None else None,
+                    "successes": h["successes"],
+                    "failures": h["failures"],
+                    "healthy": h["cooldown_until"] <= now
+                }
+                for base, h in self._health.items()
+            }
+
+
+_registry: Optional[PipedInstanceRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_piped_registry() -> PipedInstanceRegistry:
+    """
+    Get the process-wide Piped registry.
+
+    PIPED_BASE_URL is tried alongside PIPED_INSTANCES (comma-separated), which
+    defaults to a list of public instances.
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                configured = os.environ.get("PIPED_INSTANCES")
+                instances = [i.strip() for i in configured.split(",")] if configured else list(DEFAULT_PIPED_INSTANCES)
+                preferred = os.environ.get("PIPED_BASE_URL")
+                if preferred:
+                    instances.insert(0, preferred)
+                _registry = PipedInstanceRegistry(instances)
+    return _registry
@@ -1,24 +1,31 @@
 import asyncio
+import bisect
 import json
 import logging
 import tempfile
-import subprocess
+import threading
+import time
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Tuple
 import requests
 import random
 import re
 import math
+import shutil
 
 import yt_dlp
 from groq import Groq
 from pydub import AudioSegment
 
 from .base import BaseTranscriber, TranscriptUnavailable
-from .models import Transcript, TranscriptSegment
+from .models import Transcript, TranscriptSegment, AudioChunk
+from .audio_cache import get_audio_cache
+from .piped import get_piped_registry
 from ..utils.subtitle_utils import chunk_words_to_cues
+from ..utils.ssl_config import get_ssl_config
 
 logger = logging.getLogger("youtube_analysis.transcription")
 
@@ -30,6 +37,36 @@ class WhisperTranscriber(BaseTranscriber):
     _SUPPORTED_MODELS = ["whisper-1", "gpt-4o-transcribe", "gpt-4o-mini-transcribe"]
     _MAX_WHISPER_FILESIZE = 25 * 1024 * 1024  # 25MB
     _CHUNK_DURATION_SEC = 600  # 10 minutes, will adjust dynamically if needed
+    _SILENCE_THRESH_DB = -40  # silencedetect noise floor
+    _MIN_SILENCE_SEC = 0.5  # shortest pause considered a split candidate
+    _MEDIA_TIMEOUT_SEC = 900  # default upper bound for a single ffmpeg/ffprobe run
+    _MAX_CONCURRENT_CUTS = 4
+    _DOWNLOAD_STALL_TIMEOUT_SEC = 25  # an attempt with no new bytes for this long is abandoned
+    _DOWNLOAD_ATTEMPT_CEILING_SEC = 1800  # overall bound, even while bytes keep arriving
+    _PIPED_PROBE_FANOUT = 3
+    _PIPED_PROBE_TIMEOUT_SEC = 10
+    _PIPED_RANGE_PARTS = 4
+    _PIPED_MIN_RANGED_BYTES = 4 * 1024 * 1024
+    _DOWNLOAD_BUFFER_BYTES = 1024 * 1024
+    _STRATEGY_STATS_DECAY = 0.9  # older outcomes fade so ranking tracks current blocking
+
+    # Process-wide yt-dlp strategy outcomes, shared by all transcriber instances
+    _strategy_stats: Dict[str, Dict[str, float]] = {}
+    _strategy_stats_lock = threading.Lock()
+    # yt-dlp attempts run on their own pool: abandoned attempts can linger until
+    # their network calls return and must not starve the default executor
+    _DOWNLOAD_WORKERS = 8
+    _download_executor: Optional[ThreadPoolExecutor] = None
+    _download_executor_lock = threading.Lock()
+    # Containers both OpenAI and Groq accept directly
+    _API_AUDIO_EXTS = {".flac", ".m4a", ".mp3", ".mp4", ".mpeg", ".mpga", ".ogg", ".wav", ".webm"}
+    _SPEECH_SAMPLE_RATE = 16000
+    _SPEECH_PROFILES = {
+        "opus": {"codec": "libopus", "ext": ".ogg", "min_kbps": 12, "max_kbps": 32,
+                 "extra_args": ["-application", "voip"]},
+        "mp3": {"codec": "libmp3lame", "ext": ".mp3", "min_kbps": 16, "max_kbps": 64,
+                "extra_args": []},
+    }
 
     def __init__(
         self, 
@@ -38,7 +75,13 @@ class WhisperTranscriber(BaseTranscriber):
         use_timestamps: bool = True,
         use_post_processing: bool = False,
         post_processing_model: str = "gpt-4.1-mini",
-        prompt: str = None
+        prompt: str = None,
+        parallel_chunks: Optional[bool] = None,
+        max_concurrent_chunks: Optional[int] = None,
+        chunk_overlap_sec: Optional[float] = None,
+        media_timeout_sec: Optional[float] = None,
+        speech_codec: Optional[str] = None,
+        hedged_download: Optional[bool] = None
     ):
         """
         Args:
@@ -48,6 +91,12 @@ class WhisperTranscriber(BaseTranscriber):
             use_post_processing: Whether to use GPT for post-processing correction
             post_processing_model: Model to use for post-processing
             prompt: Optional prompt to improve transcription quality
+            parallel_chunks: Transcribe chunks of long audio concurrently (env WHISPER_PARALLEL_CHUNKS)
+            max_concurrent_chunks: Max chunks in flight in parallel mode (env WHISPER_MAX_CONCURRENT_CHUNKS)
+            chunk_overlap_sec: Audio overlap prepended to each chunk in parallel mode (env WHISPER_CHUNK_OVERLAP_SEC)
+            media_timeout_sec: Timeout for each ffmpeg/ffprobe process (env WHISPER_MEDIA_TIMEOUT_SEC)
+            speech_codec: 'opus' or 'mp3' for transcoded uploads (env WHISPER_SPEECH_CODEC)
+            hedged_download: Start the next yt-dlp strategy when running ones stall (env WHISPER_HEDGED_DOWNLOAD)
         """
         self.provider = provider or "openai"
         self.default_model = default_model or "whisper-1"
@@ -55,6 +104,24 @@ class WhisperTranscriber(BaseTranscriber):
         self.use_post_processing = use_post_processing
         self.post_processing_model = post_processing_model
         self.prompt = prompt
+        if parallel_chunks is None:
+            parallel_chunks = os.environ.get("WHISPER_PARALLEL_CHUNKS", "false").lower() == "true"
+        self.parallel_chunks = parallel_chunks
+        self.max_concurrent_chunks = max_concurrent_chunks or int(os.environ.get("WHISPER_MAX_CONCURRENT_CHUNKS", "4"))
+        if chunk_overlap_sec is None:
+            chunk_overlap_sec = float(os.environ.get("WHISPER_CHUNK_OVERLAP_SEC", "2.0"))
+        self.chunk_overlap_sec = chunk_overlap_sec
+        self.media_timeout_sec = media_timeout_sec or float(
+            os.environ.get("WHISPER_MEDIA_TIMEOUT_SEC", str(self._MEDIA_TIMEOUT_SEC))
+        )
+        self.speech_codec = (speech_codec or os.environ.get("WHISPER_SPEECH_CODEC", "opus")).lower()
+        self._audio_cache = get_audio_cache()
+        if hedged_download is None:
+            hedged_download = os.environ.get("WHISPER_HEDGED_DOWNLOAD", "true").lower() == "true"
+        self.hedged_download = hedged_download
+        # Seconds without download progress (or without a first byte) before hedging
+        self.hedge_delay_sec = float(os.environ.get("WHISPER_HEDGE_DELAY_SEC", "8"))
+        self.hedge_max_parallel = int(os.environ.get("WHISPER_HEDGE_MAX_PARALLEL", "3"))
         super().__init__()
 
     async def get(
@@ -79,40 +146,36 @@ class WhisperTranscriber(BaseTranscriber):
         model = model_name or self.default_model
         active_prompt = prompt or self.prompt
         async with self._download_audio(video_id) as audio_path:
-            mp3_path = await self._convert_to_mp3(audio_path)
-            audio_file = mp3_path or audio_path
+            speech_path = await self._prepare_audio_for_upload(audio_path, video_id=video_id)
+            audio_file = speech_path or audio_path
             file_size = os.path.getsize(audio_file)
             if file_size > self._MAX_WHISPER_FILESIZE:
                 logger.warning(f"Audio file {audio_file} is {file_size} bytes (>25MB). Splitting into chunks.")
-                chunk_paths = await self._split_audio_intelligently(audio_file)
-                all_segments = []
-                previous_transcript_text = ""
-                for idx, chunk_path in enumerate(chunk_paths):
-                    logger.info(f"Transcribing chunk {idx+1}/{len(chunk_paths)}: {chunk_path}")
-                    chunk_prompt = active_prompt
-                    if previous_transcript_text and idx > 0:
-                        if chunk_prompt:
-                            chunk_prompt = f"{chunk_prompt} {previous_transcript_text[-1000:]}"
-                        else:
-                            chunk_prompt = previous_transcript_text[-1000:]
-                    if self.provider == "groq":
-                        segments = await self._call_groq_whisper(chunk_path, language, model, chunk_prompt)
-                    else:
-                        segments = await self._call_openai_whisper(chunk_path, language, model, chunk_prompt)
-                    previous_transcript_text = " ".join([seg["text"] for seg in segments])
-                    if idx > 0:
-                        time_offset = sum(os.path.getsize(chunk_paths[i]) / file_size * 
-                                         (await self._get_audio_duration(audio_file)) 
-                                         for i in range(idx))
+                if self.parallel_chunks:
+                    overlap_ms = int(self.chunk_overlap_sec * 1000)
+                    chunks = await self._split_audio_intelligently(audio_file, overlap_ms=overlap_ms, video_id=video_id)
+                    cues = await self._transcribe_chunks_parallel(chunks, language, model, active_prompt, video_id)
+                else:
+                    chunks = await self._split_audio_intelligently(audio_file, video_id=video_id)
+                    all_segments = []
+                    previous_transcript_text = ""
+                    for idx, chunk in enumerate(chunks):
+                        logger.info(f"Transcribing chunk {idx+1}/{len(chunks)}: {chunk.path}")
+                        chunk_prompt = active_prompt
+                        if previous_transcript_text and idx > 0:
+                            if chunk_prompt:
+                                chunk_prompt = f"{chunk_prompt} {previous_transcript_text[-1000:]}"
+                            else:
+                                chunk_prompt = previous_transcript_text[-1000:]
+                        segments = await self._transcribe_chunk(chunk, language, model, chunk_prompt, video_id)
+                        previous_transcript_text = " ".join([seg["text"] for seg in segments])
+                        # Chunk boundaries are exact, so offsets need no duration probing
                         for seg in segments:
-                            seg["start"] += time_offset
-                    all_segments.extend(segments)
-                cues = all_segments
+                            seg["start"] += chunk.start_sec
+                        all_segments.extend(segments)
+                    cues = all_segments
             else:
-                if self.provider == "groq":
-                    cues = await self._call_groq_whisper(audio_file, language, model, active_prompt)
-                else:
-                    cues = await self._call_openai_whisper(audio_file, language, model, active_prompt)
+                cues = self._to_cue_dicts(await self._call_whisper(audio_file, language, model, active_prompt))
             # Convert cues (dicts) to TranscriptSegment objects for compatibility
             transcript_segments = [TranscriptSegment(
                 text=cue["text"],
@@ -124,6 +187,94 @@ class WhisperTranscriber(BaseTranscriber):
                 transcript_segments = await self._post_process_transcript(transcript_segments, language)
         return Transcript(video_id=video_id, language=language, source=self.provider, segments=transcript_segments)
 
+    async def _call_whisper(
+        self,
+        audio_path: Path,
+        language: str,
+        model: str,
+        prompt: str = None
+    ) -> List[Union[Dict[str, Any], TranscriptSegment]]:
+        """Dispatch a transcription request to the configured provider."""
+        if self.provider == "groq":
+            return await self._call_groq_whisper(audio_path, language, model, prompt)
+        return await self._call_openai_whisper(audio_path, language, model, prompt)
+
+    @staticmethod
+    def _to_cue_dicts(segments: List[Union[Dict[str, Any], TranscriptSegment]]) -> List[Dict[str, Any]]:
+        """Normalize provider output (dict cues or TranscriptSegment objects) to cue dicts."""
+        return [seg.to_dict() if isinstance(seg, TranscriptSegment) else seg for seg in segments]
+
+    async def _transcribe_chunk(
+        self,
+        chunk: AudioChunk,
+        language: str,
+        model: str,
+        prompt: Optional[str],
+        video_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Transcribe one chunk, returning chunk-relative cues.
+
+        With a video_id, results are persisted in the audio cache as soon as
+        they arrive, keyed by provider, model, language and the chunk's exact
+        boundaries, so a retried job only calls the API for missing chunks.
+        """
+        cache = self._audio_cache if video_id else None
+        kind = f"segments-{self.provider}-{model}-{language}-{chunk.start_ms}-{chunk.end_ms}"
+        if cache is not None:
+            cached = cache.get_json(video_id, kind)
+            if cached is not None:
+                logger.info(f"Reusing cached transcription for {video_id} chunk {chunk.start_ms}-{chunk.end_ms}ms")
+                return cached
+
+        segments = self._to_cue_dicts(await self._call_whisper(chunk.path, language, model, prompt))
+        if cache is not None:
+            try:
+                await asyncio.to_thread(cache.put_json, video_id, kind, segments)
+            except Exception as e:
+                logger.warning(f"Failed to cache chunk transcription: {e}")
+        return segments
+
+    async def _transcribe_chunks_parallel(
+        self,
+        chunks: List[AudioChunk],
+        language: str,
+        model: str,
+        prompt: Optional[str],
+        video_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Transcribe chunks concurrently (bounded by max_concurrent_chunks) and
+        reassemble the cues in order.
+
+        Every chunk after the first starts with an overlap window, so context
+        comes from that audio rather than from the previous chunk's text. Cues
+        centred inside the overlap window are dropped because the previous chunk
+        already covers them. If any chunk fails, the others still run to
+        completion (and are cached) before the first error is raised.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrent_chunks))
+
+        async def transcribe(idx: int, chunk: AudioChunk) -> List[Dict[str, Any]]:
+            async with semaphore:
+                logger.info(f"Transcribing chunk {idx+1}/{len(chunks)} (parallel): {chunk.path}")
+                return await self._transcribe_chunk(chunk, language, model, prompt, video_id)
+
+        chunk_cues = await asyncio.gather(*(transcribe(i, c) for i, c in enumerate(chunks)), return_exceptions=True)
+        for result in chunk_cues:
+            if isinstance(result, BaseException):
+                raise result
+
+        all_cues = []
+        for chunk, cues in zip(chunks, chunk_cues):
+            lead = chunk.overlap_ms / 1000.0
+            for cue in cues:
+                if cue["start"] + (cue.get("duration") or 0) / 2 < lead:
+                    continue
+                cue["start"] += chunk.start_sec
+                all_cues.append(cue)
+        return all_cues
+
     async def _transcribe_audio_to_srt(
         self,
         *,
@@ -139,13 +290,10 @@ class WhisperTranscriber(BaseTranscriber):
             tmp_video_id = "local_audio"
             # Create faux transcript by calling provider on direct file
             # We call the lower-level helpers directly for efficiency
-            if self.provider == "groq":
-                segments = await self._call_groq_whisper(Path(audio_file_path), language, model_name, prompt)
-            else:
-                segments = await self._call_openai_whisper(Path(audio_file_path), language, model_name, prompt)
+            segments = await self._call_whisper(Path(audio_file_path), language, model_name, prompt)
 
             # Build cues and write SRT
-            cues = segments
+            cues = self._to_cue_dicts(segments)
             from ..utils.subtitle_utils import generate_srt_content
             srt_text = generate_srt_content(cues)
             out_path = Path(output_subtitle_path)
@@ -228,120 +376,324 @@ class WhisperTranscriber(BaseTranscriber):
 
     @asynccontextmanager
     async def _download_audio(self, video_id: str):
+        """Yield a local path to the video's audio, served from the audio cache when possible."""
+        cache = self._audio_cache
+        if cache is None:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                yield await self._fetch_audio(video_id, tmpdir)
+            return
+        # Pin so later stages storing transcodes/chunks cannot evict audio still in use
+        with cache.pin(video_id):
+            audio_path = cache.get(video_id, "source")
+            if audio_path is None:
+                with tempfile.TemporaryDirectory() as tmpdir:
+                    downloaded = await self._fetch_audio(video_id, tmpdir)
+                    audio_path = await asyncio.to_thread(cache.put, video_id, "source", downloaded)
+            yield audio_path
+
+    async def _fetch_audio(self, video_id: str, tmpdir: str) -> Path:
+        """Download the video's audio into tmpdir with yt-dlp, falling back to Piped."""
         url = f"https://www.youtube.com/watch?v={video_id}"
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Base options
-            base_opts = {
-                "format": f"{self._AUDIO_FMT}/{self._AUDIO_FMT_FALLBACK}",
-                "quiet": True,
-                "noprogress": True,
-                "outtmpl": f"{tmpdir}/%(id)s.%(ext)s",
-                "noplaylist": True,
-                "ignoreerrors": False,
-                "retries": 3,
-                "socket_timeout": 15,
-                "sleep_requests": 0.5,
-                "max_sleep_requests": 2,
-                "geo_bypass": True,
-            }
+        # Base options
+        base_opts = {
+            "format": f"{self._AUDIO_FMT}/{self._AUDIO_FMT_FALLBACK}",
+            "quiet": True,
+            "noprogress": True,
+            "outtmpl": f"{tmpdir}/%(id)s.%(ext)s",
+            "noplaylist": True,
+            "ignoreerrors": False,
+            "retries": 3,
+            "socket_timeout": 15,
+            "sleep_requests": 0.5,
+            "max_sleep_requests": 2,
+            "geo_bypass": True,
+        }
 
-            # No custom SSL tweaks
-
-            # Try multiple player clients and user agents to bypass SABR/app restrictions
-            attempts = [
-                # Prefer web clients first to avoid GVS PO token requirements
-                {
-                    "ua": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-                    "player_client": ["web"],
-                },
-                {
-                    "ua": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15",
-                    "player_client": ["web_safari"],
-                },
-                {
-                    "ua": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-                    "player_client": ["web_embedded"],
-                },
-                {
-                    "ua": "Mozilla/5.0 (CrKey armv7l 1.36.159268) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/36.0.1985.67 Safari/537.36",
-                    "player_client": ["tv_embedded"],
-                },
-                {
-                    "ua": "Mozilla/5.0 (Chromium OS 14541.0.0) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/94.0.4606.114 Safari/537.36",
-                    "player_client": ["tv"],
-                },
-                {
-                    "ua": "Mozilla/5.0 (iPhone; CPU iPhone OS 16_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.6 Mobile/15E148 Safari/604.1",
-                    "player_client": ["ios"],
-                },
-                # Keep android attempts last; often require PO token
-                {
-                    "ua": "Mozilla/5.0 (Linux; Android 12; Pixel 5) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Mobile Safari/537.36",
-                    "player_client": ["android_embedded"],
-                },
-            ]
+        # No custom SSL tweaks
 
-            loop = asyncio.get_running_loop()
-            last_error: Optional[Exception] = None
-            for attempt in attempts:
-                ytdlp_opts = dict(base_opts)
-                # Ensure hostile extractor_args are removed
-                extractor_args = ytdlp_opts.get("extractor_args") or {}
-                yt_args = extractor_args.get("youtube") or {}
-                yt_args.pop("player_skip", None)  # allow js signature
-                yt_args.pop("skip", None)          # don't skip dash/hls
-                yt_args["player_client"] = attempt["player_client"]
-                extractor_args["youtube"] = yt_args
-                ytdlp_opts["extractor_args"] = extractor_args
-                # Set UA
-                headers = ytdlp_opts.get("http_headers") or {}
-                headers["User-Agent"] = attempt["ua"]
-                headers.setdefault("Referer", "https://www.youtube.com/")
-                headers.setdefault("Accept-Language", os.environ.get("YTDLP_ACCEPT_LANGUAGE", "en-US,en;q=0.9"))
-                ytdlp_opts["http_headers"] = headers
+        # Try multiple player clients and user agents to bypass SABR/app restrictions
+        attempts = [
+            # Prefer web clients first to avoid GVS PO token requirements
+            {
+                "ua": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+                "player_client": ["web"],
+            },
+            {
+                "ua": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15",
+                "player_client": ["web_safari"],
+            },
+            {
+                "ua": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+                "player_client": ["web_embedded"],
+            },
+            {
+                "ua": "Mozilla/5.0 (CrKey armv7l 1.36.159268) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/36.0.1985.67 Safari/537.36",
+                "player_client": ["tv_embedded"],
+            },
+            {
+                "ua": "Mozilla/5.0 (Chromium OS 14541.0.0) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/94.0.4606.114 Safari/537.36",
+                "player_client": ["tv"],
+            },
+            {
+                "ua": "Mozilla/5.0 (iPhone; CPU iPhone OS 16_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.6 Mobile/15E148 Safari/604.1",
+                "player_client": ["ios"],
+            },
+            # Keep android attempts last; often require PO token
+            {
+                "ua": "Mozilla/5.0 (Linux; Android 12; Pixel 5) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Mobile Safari/537.36",
+                "player_client": ["android_embedded"],
+            },
+        ]
 
-                try:
-                    logger.debug("Attempting yt-dlp audio download with player_client=%s", attempt["player_client"]) 
-                    # Hard timeout per attempt to avoid getting stuck
-                    await asyncio.wait_for(
-                        loop.run_in_executor(None, yt_dlp.YoutubeDL(ytdlp_opts).download, [url]),
-                        timeout=25,
+        loop = asyncio.get_running_loop()
+        last_error: Optional[Exception] = None
+        downloaded: Optional[Path] = None
+        try:
+            downloaded = await self._download_with_strategies(video_id, url, base_opts, attempts, tmpdir)
+        except Exception as e:
+            last_error = e
+
+        if last_error:
+            # As a last resort, always try Piped (independent of SSL verify)
+            try:
+                await loop.run_in_executor(None, self._download_audio_via_piped, video_id, tmpdir)
+            except Exception as piped_e:
+                raise TranscriptUnavailable(
+                    f"Failed to download audio with yt-dlp and Piped. yt-dlp error: {last_error}; Piped error: {piped_e}"
+                ) from piped_e
+            
+        if downloaded is not None:
+            return downloaded
+
+        # locate downloaded file
+        audio_files = list(Path(tmpdir).glob(f"{video_id}.*"))
+        if not audio_files:
+            raise TranscriptUnavailable("yt-dlp failed to download audio")
+        return audio_files[0]
+
+    @staticmethod
+    def _strategy_key(attempt: Dict[str, Any]) -> str:
+        return ",".join(attempt["player_client"])
+
+    @classmethod
+    def _record_strategy_outcome(cls, attempt: Dict[str, Any], success: bool, elapsed: float) -> None:
+        with cls._strategy_stats_lock:
+            stats = cls._strategy_stats.setdefault(
+                cls._strategy_key(attempt),
+                {"successes": 0.0, "failures": 0.0, "attempts": 0, "wins": 0, "total_success_sec": 0.0}
+            )
+            stats["successes"] *= cls._STRATEGY_STATS_DECAY
+            stats["failures"] *= cls._STRATEGY_STATS_DECAY
+            stats["successes" if success else "failures"] += 1
+            stats["attempts"] += 1
+            if success:
+                stats["wins"] += 1
+                stats["total_success_sec"] += elapsed
+
+    @classmethod
+    def _rank_strategies(cls, attempts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Order attempts by smoothed recent success rate; unseen strategies keep their default order."""
+        with cls._strategy_stats_lock:
+            def score(attempt: Dict[str, Any]) -> float:
+                stats = cls._strategy_stats.get(cls._strategy_key(attempt))
+                if not stats:
+                    return 0.5
+                return (stats["successes"] + 1) / (stats["successes"] + stats["failures"] + 2)
+            return sorted(attempts, key=score, reverse=True)
+
+    @classmethod
+    def get_download_strategy_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """Get per-player_client download statistics."""
+        with cls._strategy_stats_lock:
+            return {
+                key: {
+                    "attempts": stats["attempts"],
+                    "successes": stats["wins"],
+                    "recent_success_rate": round(
+                        (stats["successes"] + 1) / (stats["successes"] + stats["failures"] + 2), 3
+                    ),
+                    "avg_success_sec": round(
+                        stats["total_success_sec"] / stats["wins"], 2
+                    ) if stats["wins"] else 0.0
+                }
+                for key, stats in cls._strategy_stats.items()
+            }
+
+    @staticmethod
+    def _build_ytdlp_opts(base_opts: Dict[str, Any], attempt: Dict[str, Any]) -> Dict[str, Any]:
+        ytdlp_opts = dict(base_opts)
+        # Ensure hostile extractor_args are removed
+        extractor_args = ytdlp_opts.get("extractor_args") or {}
+        yt_args = extractor_args.get("youtube") or {}
+        yt_args.pop("player_skip", None)  # allow js signature
+        yt_args.pop("skip", None)          # don't skip dash/hls
+        yt_args["player_client"] = attempt["player_client"]
+        extractor_args["youtube"] = yt_args
+        ytdlp_opts["extractor_args"] = extractor_args
+        # Set UA
+        headers = ytdlp_opts.get("http_headers") or {}
+        headers["User-Agent"] = attempt["ua"]
+        headers.setdefault("Referer", "https://www.youtube.com/")
+        headers.setdefault("Accept-Language", os.environ.get("YTDLP_ACCEPT_LANGUAGE", "en-US,en;q=0.9"))
+        ytdlp_opts["http_headers"] = headers
+        return ytdlp_opts
+
+    @classmethod
+    def _get_download_executor(cls) -> ThreadPoolExecutor:
+        if cls._download_executor is None:
+            with cls._download_executor_lock:
+                if cls._download_executor is None:
+                    cls._download_executor = ThreadPoolExecutor(
+                        max_workers=cls._DOWNLOAD_WORKERS, thread_name_prefix="ytdlp"
                     )
-                    last_error = None
-                    break
-                except Exception as e:
-                    last_error = e
-                    continue
+        return cls._download_executor
 
-            if last_error:
-                # As a last resort, always try Piped (independent of SSL verify)
-                try:
-                    await loop.run_in_executor(None, self._download_audio_via_piped, video_id, tmpdir)
-                except Exception as piped_e:
+    @staticmethod
+    def _ytdlp_download(
+        opts: Dict[str, Any], url: str, cancel_event: threading.Event, progress: Dict[str, float]
+    ) -> None:
+        """
+        Run a blocking yt-dlp download.
+
+        Aborts at the next progress tick once cancel_event is set, and stamps
+        progress["last_progress"] whenever new bytes arrive.
+        """
+        def on_progress(status):
+            if cancel_event.is_set():
+                raise yt_dlp.utils.DownloadCancelled("Superseded by another download strategy")
+            downloaded = status.get("downloaded_bytes") or 0
+            if downloaded > progress["bytes"]:
+                progress["bytes"] = downloaded
+                progress["last_progress"] = time.monotonic()
+
+        opts = dict(opts, progress_hooks=[on_progress])
+        yt_dlp.YoutubeDL(opts).download([url])
+
+    async def _run_download_attempt(
+        self,
+        video_id: str,
+        url: str,
+        opts: Dict[str, Any],
+        attempt: Dict[str, Any],
+        workdir: Path,
+        dest_dir: str,
+        progress: Dict[str, float]
+    ) -> Path:
+        """
+        Run one yt-dlp strategy into its own directory and record its outcome.
+
+        workdir lives outside dest_dir: the winner's file is moved into dest_dir,
+        while an abandoned attempt's directory is removed only once its worker
+        thread has actually stopped writing to it.
+        """
+        cancel_event = threading.Event()
+        started = time.monotonic()
+        count_failure = True
+        logger.debug("Attempting yt-dlp audio download with player_client=%s", attempt["player_client"])
+        worker = self._get_download_executor().submit(self._ytdlp_download, opts, url, cancel_event, progress)
+        watched = asyncio.wrap_future(worker)
+        try:
+            # Watchdog: give up on stalls, never on a download that is still receiving bytes
+            while True:
+                now = time.monotonic()
+                stall_at = progress["last_progress"] + self._DOWNLOAD_STALL_TIMEOUT_SEC
+                ceiling_at = started + self._DOWNLOAD_ATTEMPT_CEILING_SEC
+                if now >= stall_at:
+                    watched.cancel()
                     raise TranscriptUnavailable(
-                        f"Failed to download audio with yt-dlp and Piped. yt-dlp error: {last_error}; Piped error: {piped_e}"
-                    ) from piped_e
-            
-            # locate downloaded file
-            audio_files = list(Path(tmpdir).glob(f"{video_id}.*"))
+                        f"yt-dlp made no progress for {self._DOWNLOAD_STALL_TIMEOUT_SEC}s"
+                    )
+                if now >= ceiling_at:
+                    watched.cancel()
+                    # Still progressing, so this says nothing about the strategy itself
+                    count_failure = False
+                    raise TranscriptUnavailable(
+                        f"yt-dlp download exceeded {self._DOWNLOAD_ATTEMPT_CEILING_SEC}s"
+                    )
+                done, _ = await asyncio.wait({watched}, timeout=min(stall_at, ceiling_at) - now)
+                if done:
+                    watched.result()
+                    break
+            audio_files = [p for p in workdir.glob(f"{video_id}.*") if p.suffix != ".part"]
             if not audio_files:
-                raise TranscriptUnavailable("yt-dlp failed to download audio")
-            yield audio_files[0]
+                raise TranscriptUnavailable("yt-dlp finished without producing an audio file")
+            dest = Path(dest_dir) / audio_files[0].name
+            shutil.move(str(audio_files[0]), str(dest))
+        except BaseException as e:
+            cancel_event.set()
+            worker.add_done_callback(lambda _: shutil.rmtree(workdir, ignore_errors=True))
+            # Losing the race (cancellation) doesn't count against the strategy
+            if isinstance(e, asyncio.CancelledError):
+                watched.cancel()
+            elif isinstance(e, Exception) and count_failure:
+                self._record_strategy_outcome(attempt, False, time.monotonic() - started)
+            raise
+        shutil.rmtree(workdir, ignore_errors=True)
+        self._record_strategy_outcome(attempt, True, time.monotonic() - started)
+        return dest
 
-    def _download_audio_via_piped(self, video_id: str, tmpdir: str) -> None:
-        # Try multiple public Piped instances
-        candidates = [
-            os.environ.get("PIPED_BASE_URL"),
-            "https://piped.video",
-            "https://piped.projectsegfau.lt",
-            "https://piped.in.projectsegfau.lt",
-            "https://watch.leptons.xyz",
-            "https://piped.privacydev.net",
-            "https://piped.mha.fi",
-        ]
-        candidates = [c for c in candidates if c]
+    async def _download_with_strategies(
+        self,
+        video_id: str,
+        url: str,
+        base_opts: Dict[str, Any],
+        attempts: List[Dict[str, Any]],
+        tmpdir: str
+    ) -> Path:
+        """
+        Download with yt-dlp, trying player_client strategies best-ranked first.
 
-        last_exc = None
+        In hedged mode the next strategy starts only when every running attempt
+        has stalled, i.e. received no new bytes (or no first byte) for
+        hedge_delay_sec, or as soon as one fails, with at most hedge_max_parallel
+        running; the first success cancels the rest. A download that keeps
+        making progress is never duplicated. Without hedging the strategies run
+        strictly one after another.
+        """
+        max_parallel = max(1, self.hedge_max_parallel) if self.hedged_download else 1
+        queue = list(self._rank_strategies(attempts))
+        running: Dict[asyncio.Task, Tuple[Dict[str, Any], Dict[str, float]]] = {}
+        last_error: Optional[Exception] = None
+
+        def launch() -> None:
+            attempt = queue.pop(0)
+            workdir = Path(tempfile.mkdtemp(prefix=f"ytdlp_{video_id}_"))
+            opts = self._build_ytdlp_opts(base_opts, attempt)
+            opts["outtmpl"] = f"{workdir}/%(id)s.%(ext)s"
+            progress = {"bytes": 0, "last_progress": time.monotonic()}
+            task = asyncio.create_task(
+                self._run_download_attempt(video_id, url, opts, attempt, workdir, tmpdir, progress)
+            )
+            running[task] = (attempt, progress)
+
+        def stall_deadline() -> float:
+            return max(progress["last_progress"] for _, progress in running.values()) + self.hedge_delay_sec
+
+        try:
+            while queue or running:
+                can_hedge = bool(queue) and len(running) < max_parallel
+                if can_hedge and (not running or time.monotonic() >= stall_deadline()):
+                    launch()
+                    can_hedge = bool(queue) and len(running) < max_parallel
+                # Wake up when an attempt finishes or when all running ones would count as stalled
+                timeout = max(0.0, stall_deadline() - time.monotonic()) if can_hedge else None
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    attempt, _ = running.pop(task)
+                    if task.exception() is None:
+                        logger.debug("yt-dlp strategy %s succeeded", attempt["player_client"])
+                        return task.result()
+                    last_error = task.exception()
+                    logger.debug("yt-dlp strategy %s failed: %s", attempt["player_client"], last_error)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+        raise last_error or TranscriptUnavailable("No yt-dlp download strategy succeeded")
+
+    @staticmethod
+    def _new_piped_session() -> requests.Session:
         session = requests.Session()
         get_ssl_config().configure_requests_session(session)
         # Apply proxies to Piped fallback as well
@@ -357,89 +709,240 @@ class WhisperTranscriber(BaseTranscriber):
                 session.proxies.update(proxies)
         except Exception:
             pass
-        for base in candidates:
+        return session
+
+    @staticmethod
+    def _pick_piped_audio_stream(data: Dict[str, Any]) -> Dict[str, Any]:
+        audio_streams = data.get("audioStreams") or []
+        if not audio_streams:
+            raise RuntimeError("No audio streams listed by Piped")
+        preferred = None
+        for s in audio_streams:
+            mime = (s.get("mimeType") or "").lower()
+            if "mp4" in mime or "m4a" in mime:
+                preferred = s
+                break
+        if preferred is None:
+            preferred = audio_streams[0]
+        if not preferred.get("url"):
+            raise RuntimeError("Audio stream missing URL")
+        return preferred
+
+    def _probe_piped_instance(self, session: requests.Session, base: str, video_id: str) -> Dict[str, Any]:
+        """Fetch /api/v1/streams from one instance and record its health."""
+        registry = get_piped_registry()
+        streams_url = f"{base}/api/v1/streams/{video_id}"
+        started = time.monotonic()
+        try:
+            resp = session.get(streams_url, timeout=self._PIPED_PROBE_TIMEOUT_SEC)
+            resp.raise_for_status()
             try:
-                streams_url = f"{base}/api/v1/streams/{video_id}"
-                resp = session.get(streams_url, timeout=20)
-                resp.raise_for_status()
+                data = resp.json()
+            except Exception:
+                raise RuntimeError(
+                    f"Piped returned non-JSON (status {resp.status_code}) from {streams_url}: {(resp.text or '').strip()[:200]}"
+                )
+            stream = self._pick_piped_audio_stream(data)
+        except Exception:
+            registry.record_failure(base)
+            raise
+        registry.record_success(base, time.monotonic() - started)
+        return stream
+
+    def _probe_piped_instances(self, session: requests.Session, bases: List[str], video_id: str) -> Tuple[str, Dict[str, Any]]:
+        """Probe bases concurrently and return the first instance to list a usable audio stream."""
+        executor = ThreadPoolExecutor(max_workers=len(bases), thread_name_prefix="piped-probe")
+        futures = {executor.submit(self._probe_piped_instance, session, base, video_id): base for base in bases}
+        last_exc: Optional[Exception] = None
+        try:
+            for future in as_completed(futures):
                 try:
-                    data = resp.json()
+                    return futures[future], future.result()
                 except Exception as e:
-                    # Not JSON, try next instance
-                    last_exc = RuntimeError(
-                        f"Piped returned non-JSON (status {resp.status_code}) from {streams_url}: {(resp.text or '').strip()[:200]}"
-                    )
-                    continue
-                audio_streams = data.get("audioStreams") or []
-                if not audio_streams:
-                    last_exc = RuntimeError("No audio streams listed by Piped")
-                    continue
-                preferred = None
-                for s in audio_streams:
-                    mime = (s.get("mimeType") or "").lower()
-                    if "mp4" in mime or "m4a" in mime:
-                        preferred = s
-                        break
-                if preferred is None:
-                    preferred = audio_streams[0]
-                stream_url = preferred.get("url")
-                if not stream_url:
-                    last_exc = RuntimeError("Audio stream missing URL")
-                    continue
-                ext = "m4a" if "mp4" in (preferred.get("mimeType") or "").lower() else "webm"
-                out_path = Path(tmpdir) / f"{video_id}.{ext}"
-                with session.get(stream_url, stream=True, timeout=90) as r:
-                    r.raise_for_status()
-                    with open(out_path, "wb") as f:
-                        for chunk in r.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
+                    last_exc = e
+        finally:
+            # Slower probes finish in the background and still update the registry
+            executor.shutdown(wait=False)
+        raise last_exc or RuntimeError("No Piped instance responded")
+
+    def _download_stream_to_file(self, session: requests.Session, stream_url: str, content_length: int, out_path: Path) -> None:
+        """
+        Download stream_url into out_path.
+
+        Large streams are fetched as parallel byte ranges written at their offsets,
+        since googlevideo throttles single long-running responses; otherwise (or if
+        the server ignores Range) the body is streamed with 1 MB reads and writes.
+        """
+        if content_length >= self._PIPED_MIN_RANGED_BYTES:
+            try:
+                self._download_ranges(session, stream_url, content_length, out_path)
                 return
             except Exception as e:
-                last_exc = e
-                continue
+                logger.debug("Ranged download failed (%s); retrying as a single stream", str(e))
+
+        with session.get(stream_url, stream=True, timeout=90) as r:
+            r.raise_for_status()
+            with open(out_path, "wb", buffering=self._DOWNLOAD_BUFFER_BYTES) as f:
+                for chunk in r.iter_content(chunk_size=self._DOWNLOAD_BUFFER_BYTES):
+                    if chunk:
+                        f.write(chunk)
+
+    def _download_ranges(self, session: requests.Session, stream_url: str, content_length: int, out_path: Path) -> None:
+        part_size = math.ceil(content_length / self._PIPED_RANGE_PARTS)
+        ranges = [
+            (start, min(start + part_size, content_length) - 1)
+            for start in range(0, content_length, part_size)
+        ]
+        with open(out_path, "wb") as f:
+            f.truncate(content_length)
+
+        def fetch(byte_range: Tuple[int, int]) -> None:
+            start, end = byte_range
+            headers = {"Range": f"bytes={start}-{end}"}
+            with session.get(stream_url, headers=headers, stream=True, timeout=90) as r:
+                r.raise_for_status()
+                if r.status_code != 206:
+                    raise RuntimeError(f"Range request not honoured (status {r.status_code})")
+                written = 0
+                with open(out_path, "r+b", buffering=0) as f:
+                    f.seek(start)
+                    for chunk in r.iter_content(chunk_size=self._DOWNLOAD_BUFFER_BYTES):
+                        if chunk:
+                            f.write(chunk)
+                            written += len(chunk)
+            if written != end - start + 1:
+                raise RuntimeError(f"Short read for bytes {start}-{end}: got {written}")
+
+        with ThreadPoolExecutor(max_workers=len(ranges), thread_name_prefix="piped-range") as executor:
+            list(executor.map(fetch, ranges))
+
+    def _download_audio_via_piped(self, video_id: str, tmpdir: str) -> None:
+        """Download audio via the fastest healthy Piped instances, probing a few at a time."""
+        registry = get_piped_registry()
+        candidates = registry.ranked()
+        session = self._new_piped_session()
+        last_exc = None
+        try:
+            for i in range(0, len(candidates), self._PIPED_PROBE_FANOUT):
+                batch = candidates[i:i + self._PIPED_PROBE_FANOUT]
+                try:
+                    base, stream = self._probe_piped_instances(session, batch, video_id)
+                except Exception as e:
+                    last_exc = e
+                    continue
+                ext = "m4a" if "mp4" in (stream.get("mimeType") or "").lower() else "webm"
+                out_path = Path(tmpdir) / f"{video_id}.{ext}"
+                try:
+                    self._download_stream_to_file(session, stream["url"], int(stream.get("contentLength") or 0), out_path)
+                    return
+                except Exception as e:
+                    registry.record_failure(base)
+                    out_path.unlink(missing_ok=True)
+                    last_exc = e
+        finally:
+            session.close()
         if last_exc:
             raise last_exc
         raise RuntimeError("All Piped instances failed without an explicit error")
 
-    async def _convert_to_mp3(self, input_path: Path) -> Optional[Path]:
-        """Convert the input file to MP3 format using FFmpeg."""
-        # Create output path with .mp3 extension in the same directory
-        output_path = input_path.with_suffix('.mp3')
-        
+    async def _prepare_audio_for_upload(self, input_path: Path, video_id: Optional[str] = None) -> Optional[Path]:
+        """
+        Return a speech-encoded copy of input_path, or None to upload the original.
+
+        Downloads already in a container the Whisper APIs accept (webm/m4a/mp3/...)
+        and under the size limit are sent as-is; anything else is transcoded once
+        with the speech profile. With a video_id the transcode is kept in the
+        audio cache.
+        """
+        if (input_path.suffix.lower() in self._API_AUDIO_EXTS
+                and os.path.getsize(input_path) <= self._MAX_WHISPER_FILESIZE):
+            logger.debug("Uploading %s as-is (accepted container, within size limit)", input_path)
+            return None
+
+        cache = self._audio_cache if video_id else None
+        if cache is None:
+            return await self._transcode_for_speech(input_path)
+
+        kind = f"speech-{self.speech_codec}"
+        cached = cache.get(video_id, kind)
+        if cached is not None:
+            return cached
+        speech_path = await self._transcode_for_speech(
+            input_path, output_path=cache.staging_path(self._speech_profile()["ext"])
+        )
+        if speech_path is None:
+            return None
+        return await asyncio.to_thread(cache.put, video_id, kind, speech_path)
+
+    def _speech_profile(self) -> Dict[str, Any]:
+        return self._SPEECH_PROFILES.get(self.speech_codec, self._SPEECH_PROFILES["opus"])
+
+    @classmethod
+    def _select_speech_bitrate(cls, duration_sec: Optional[float], profile: Dict[str, Any]) -> int:
+        """Pick the highest bitrate (kbps) in the profile's range that fits the API limit in one file."""
+        if not duration_sec or duration_sec <= 0:
+            return profile["max_kbps"]
+        # 10% headroom for container overhead
+        budget_kbps = int(cls._MAX_WHISPER_FILESIZE * 0.9 * 8 / duration_sec / 1000)
+        return max(profile["min_kbps"], min(profile["max_kbps"], budget_kbps))
+
+    async def _transcode_for_speech(self, input_path: Path, output_path: Optional[Path] = None) -> Optional[Path]:
+        """
+        Transcode to mono 16 kHz low-bitrate audio using FFmpeg.
+
+        The bitrate is derived from the measured duration so most videos fit in a
+        single request; very long inputs are encoded at the profile minimum and
+        split afterwards.
+        """
+        profile = self._speech_profile()
+        output_path = output_path or input_path.with_name(f"{input_path.stem}.speech{profile['ext']}")
+
         if output_path.exists():
             # If the file already exists (somehow), don't recreate it
             return output_path
-            
-        # If input is already an MP3, no need to convert
-        if input_path.suffix.lower() == '.mp3':
-            return None
-            
-        # Run FFmpeg to convert to MP3
+
+        try:
+            duration_sec = await self._get_audio_duration(input_path)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug("Could not probe duration of %s: %s", input_path, str(e))
+            duration_sec = None
+        bitrate_kbps = self._select_speech_bitrate(duration_sec, profile)
+
         cmd = [
-            'ffmpeg', 
-            '-i', str(input_path),  # Input file
-            '-vn',                  # Disable video
-            '-acodec', 'libmp3lame', # Use MP3 codec
-            '-q:a', '2',            # Quality setting
-            '-y',                   # Overwrite output
-            str(output_path)        # Output file
+            'ffmpeg', '-hide_banner', '-loglevel', 'error',
+            '-i', str(input_path),
+            '-vn',                              # Disable video
+            '-ac', '1',                         # Mono
+            '-ar', str(self._SPEECH_SAMPLE_RATE),
+            '-c:a', profile['codec'],
+            '-b:a', f'{bitrate_kbps}k',
+            *profile['extra_args'],
+            '-y',                               # Overwrite output
+            str(output_path)
         ]
-        
-        logger.debug("Converting %s to MP3 using FFmpeg", input_path)
+
+        logger.debug("Transcoding %s for speech (%s, %dkbps)", input_path, profile['codec'], bitrate_kbps)
         try:
-            # Run FFmpeg synchronously (it's typically fast for audio)
-            subprocess.run(cmd, check=True, capture_output=True)
-            logger.debug("Successfully converted to %s", output_path)
-            return output_path
-        except subprocess.CalledProcessError as e:
-            # Log error but continue with original file
-            logger.warning("FFmpeg conversion failed: %s", 
-                          e.stderr.decode() if e.stderr else str(e))
+            returncode, _, stderr = await self._run_media_command(cmd)
+        except asyncio.CancelledError:
+            output_path.unlink(missing_ok=True)
+            raise
+        except asyncio.TimeoutError:
+            logger.warning("FFmpeg transcode timed out after %ss", self.media_timeout_sec)
+            output_path.unlink(missing_ok=True)
             return None
         except Exception as e:
-            logger.warning("Unexpected error during conversion: %s", str(e))
+            logger.warning("Unexpected error during transcode: %s", str(e))
             return None
+        if returncode != 0:
+            # Log error but continue with original file
+            logger.warning("FFmpeg transcode failed: %s", stderr.decode(errors='ignore'))
+            output_path.unlink(missing_ok=True)
+            return None
+        logger.debug("Successfully transcoded to %s", output_path)
+        return output_path
 
     async def _call_openai_whisper(
         self, 
@@ -470,7 +973,7 @@ class WhisperTranscriber(BaseTranscriber):
                 # Add prompt if provided
                 if prompt:
                     params["prompt"] = prompt
-                resp = client.audio.transcriptions.create(**params)
+                resp = await asyncio.to_thread(client.audio.transcriptions.create, **params)
                 # OpenAI returns segments as a list of objects, not dicts
                 raw_segments = getattr(resp, "segments", None) or []
                 if not raw_segments:
@@ -542,7 +1045,7 @@ class WhisperTranscriber(BaseTranscriber):
                 if prompt:
                     params["prompt"] = prompt
                 
-                resp = client.audio.transcriptions.create(**params)
+                resp = await asyncio.to_thread(client.audio.transcriptions.create, **params)
                 
                 raw_segments = getattr(resp, "segments", None) or []
                 if not raw_segments:
@@ -591,13 +1094,174 @@ class WhisperTranscriber(BaseTranscriber):
             'ffprobe', '-v', 'error', '-show_entries', 'format=duration',
             '-of', 'default=noprint_wrappers=1:nokey=1', str(audio_path)
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return float(result.stdout.strip())
+        returncode, stdout, stderr = await self._run_media_command(cmd)
+        if returncode != 0:
+            raise RuntimeError(f"ffprobe failed for {audio_path}: {stderr.decode(errors='ignore')[:300]}")
+        return float(stdout.decode().strip())
+
+    async def _run_media_command(self, cmd: List[str], timeout: Optional[float] = None) -> Tuple[int, bytes, bytes]:
+        """
+        Run ffmpeg/ffprobe without blocking the event loop.
+
+        The process is killed and reaped if the timeout expires (asyncio.TimeoutError)
+        or the calling task is cancelled, so no orphaned encoders are left behind.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout or self.media_timeout_sec)
+        except BaseException:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            raise
+        return proc.returncode, stdout, stderr
+
+    async def _detect_silences(self, audio_path: Path) -> List[Tuple[float, float]]:
+        """
+        Find silent intervals (seconds) with ffmpeg silencedetect.
 
-    async def _split_audio_intelligently(self, audio_path: Path) -> List[Path]:
+        ffmpeg decodes in a streaming pass and only the silence log lines are read
+        back, so memory stays constant regardless of audio length.
+        """
+        cmd = [
+            'ffmpeg', '-hide_banner', '-nostats', '-i', str(audio_path), '-vn',
+            '-af', f'silencedetect=noise={self._SILENCE_THRESH_DB}dB:d={self._MIN_SILENCE_SEC}',
+            '-f', 'null', '-'
+        ]
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        silences = []
+        pending_start = None
+
+        async def read_log():
+            nonlocal pending_start
+            async for raw_line in proc.stderr:
+                line = raw_line.decode('utf-8', errors='ignore')
+                m_start = re.search(r'silence_start:\s*(-?[\d.]+)', line)
+                if m_start:
+                    pending_start = max(0.0, float(m_start.group(1)))
+                    continue
+                m_end = re.search(r'silence_end:\s*([\d.]+)', line)
+                if m_end and pending_start is not None:
+                    silences.append((pending_start, float(m_end.group(1))))
+                    pending_start = None
+
+        try:
+            await asyncio.wait_for(read_log(), self.media_timeout_sec)
+            await proc.wait()
+        except BaseException:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            raise
+        if proc.returncode != 0:
+            raise RuntimeError(f"ffmpeg silencedetect exited with code {proc.returncode}")
+        return silences
+
+    @staticmethod
+    def _choose_split_points(silences: List[Tuple[float, float]], duration_ms: int, max_chunk_ms: int) -> List[int]:
+        """
+        Greedily place split points at the latest silence midpoint that keeps each
+        chunk within max_chunk_ms (but at least half of it), or cut hard if none.
+        """
+        midpoints = sorted(int((start + end) / 2 * 1000) for start, end in silences)
+        split_points = []
+        last = 0
+        while duration_ms - last > max_chunk_ms:
+            limit = last + max_chunk_ms
+            idx = bisect.bisect_right(midpoints, limit) - 1
+            if idx >= 0 and midpoints[idx] >= last + max_chunk_ms // 2:
+                point = midpoints[idx]
+            else:
+                point = limit
+            split_points.append(point)
+            last = point
+        return split_points
+
+    async def _cut_chunks(self, audio_path: Path, boundaries: List[int], overlap_ms: int = 0) -> List[AudioChunk]:
+        """Cut [boundaries[i], boundaries[i+1]) ranges with ffmpeg stream copy (no re-encode)."""
+        tmpdir = tempfile.mkdtemp(prefix="whisper_chunks_")
+        suffix = audio_path.suffix or '.mp3'
+        semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_CUTS)
+
+        async def cut(i: int) -> AudioChunk:
+            start_ms = max(0, boundaries[i] - overlap_ms) if i > 0 else 0
+            end_ms = boundaries[i + 1]
+            chunk_path = Path(tmpdir) / f"chunk_{i:03d}{suffix}"
+            cmd = [
+                'ffmpeg', '-hide_banner', '-loglevel', 'error',
+                '-ss', f"{start_ms / 1000:.3f}", '-i', str(audio_path),
+                '-t', f"{(end_ms - start_ms) / 1000:.3f}",
+                '-map', '0:a:0', '-c', 'copy', '-y', str(chunk_path)
+            ]
+            async with semaphore:
+                returncode, _, stderr = await self._run_media_command(cmd)
+            if returncode != 0:
+                raise RuntimeError(f"ffmpeg cut failed: {stderr.decode(errors='ignore')[:300]}")
+            return AudioChunk(path=chunk_path, start_ms=start_ms, end_ms=end_ms, overlap_ms=boundaries[i] - start_ms)
+
+        return list(await asyncio.gather(*(cut(i) for i in range(len(boundaries) - 1))))
+
+    async def _split_audio_streaming(self, audio_path: Path, overlap_ms: int = 0) -> List[AudioChunk]:
+        """Split at silences using ffmpeg only; peak memory is independent of audio length."""
+        file_size = os.path.getsize(audio_path)
+        duration_ms = int(await self._get_audio_duration(audio_path) * 1000)
+        bytes_per_ms = file_size / max(duration_ms, 1)
+        # Leave headroom for container overhead and the overlap prepended to each chunk
+        max_chunk_ms = max(10_000, int(self._MAX_WHISPER_FILESIZE * 0.9 / bytes_per_ms) - overlap_ms)
+
+        logger.info(f"Detecting silence (streaming) in {audio_path} ({duration_ms / 1000:.0f}s)")
+        silences = await self._detect_silences(audio_path)
+        split_points = self._choose_split_points(silences, duration_ms, max_chunk_ms)
+
+        chunks = await self._cut_chunks(audio_path, [0] + split_points + [duration_ms], overlap_ms)
+        logger.info(f"Split audio into {len(chunks)} chunks at {len(silences)} detected silences")
+        return chunks
+
+    async def _split_audio_intelligently(
+        self, audio_path: Path, overlap_ms: int = 0, video_id: Optional[str] = None
+    ) -> List[AudioChunk]:
+        """
+        Split audio at natural pauses to avoid cutting mid-sentence.
+        With overlap_ms, every chunk after the first starts that much earlier.
+        Uses the streaming ffmpeg splitter and falls back to in-memory PyDub
+        splitting if ffmpeg fails. With a video_id, chunk sets are kept in the
+        audio cache keyed by the split input and overlap.
+        Returns list of AudioChunks with exact start/end offsets.
+        """
+        cache = self._audio_cache if video_id else None
+        kind = f"chunks-{audio_path.name}-{os.path.getsize(audio_path)}-{overlap_ms}"
+        if cache is not None:
+            cached = cache.get_chunks(video_id, kind)
+            if cached is not None:
+                return cached
+
+        try:
+            chunks = await self._split_audio_streaming(audio_path, overlap_ms)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Streaming split failed ({e}); falling back to in-memory PyDub splitting")
+            chunks = await self._split_audio_in_memory(audio_path, overlap_ms)
+
+        if cache is not None:
+            chunks = await asyncio.to_thread(cache.put_chunks, video_id, kind, chunks)
+        return chunks
+
+    async def _split_audio_in_memory(self, audio_path: Path, overlap_ms: int = 0) -> List[AudioChunk]:
         """
         Split audio intelligently using PyDub to avoid cutting mid-sentence.
-        Returns list of chunk Paths.
+        Decodes the whole file into memory; used as a fallback.
+        Returns list of AudioChunks with exact start/end offsets.
         """
         import tempfile
         from pydub import AudioSegment
@@ -605,8 +1269,8 @@ class WhisperTranscriber(BaseTranscriber):
         
         logger.info(f"Loading audio file for intelligent splitting: {audio_path}")
         
-        # Load audio file
-        audio = AudioSegment.from_file(str(audio_path))
+        # Load audio file (PyDub decodes via ffmpeg and blocks, so keep it off the event loop)
+        audio = await asyncio.to_thread(AudioSegment.from_file, str(audio_path))
         duration_ms = len(audio)
         file_size = os.path.getsize(audio_path)
         
@@ -624,16 +1288,17 @@ class WhisperTranscriber(BaseTranscriber):
         
         logger.info(f"Detecting silence in audio to find natural break points")
         # Get non-silent sections
-        nonsilent_sections = detect_nonsilent(
-            audio, 
-            min_silence_len=min_silence_len, 
+        nonsilent_sections = await asyncio.to_thread(
+            detect_nonsilent,
+            audio,
+            min_silence_len=min_silence_len,
             silence_thresh=silence_thresh
         )
         
         # If no silent sections found, fall back to equal chunks
         if not nonsilent_sections:
             logger.warning("No silence detected for intelligent splitting, falling back to equal chunks")
-            return await self._split_audio_equally(audio_path, audio, num_chunks)
+            return await self._split_audio_equally(audio_path, audio, num_chunks, overlap_ms)
             
         # Determine split points at silence
         current_duration = 0
@@ -671,66 +1336,52 @@ class WhisperTranscriber(BaseTranscriber):
         if split_points and duration_ms - split_points[-1] < target_chunk_duration_ms * 0.5:
             split_points.pop()  # Remove last split point if it creates a very small final chunk
             
-        # Create chunks
-        tmpdir = tempfile.mkdtemp(prefix="whisper_chunks_")
-        chunk_paths = []
-        
-        # Export first chunk (from start to first split point)
-        if split_points:
-            first_chunk = audio[:split_points[0]]
-            first_chunk_path = os.path.join(tmpdir, f"chunk_000.mp3")
-            first_chunk.export(first_chunk_path, format="mp3")
-            chunk_paths.append(Path(first_chunk_path))
-            
-            # Export middle chunks
-            for i in range(len(split_points) - 1):
-                chunk = audio[split_points[i]:split_points[i+1]]
-                chunk_path = os.path.join(tmpdir, f"chunk_{i+1:03d}.mp3")
-                chunk.export(chunk_path, format="mp3")
-                chunk_paths.append(Path(chunk_path))
+        # Create chunks from exact [start, end) boundaries so callers get precise offsets
+        boundaries = [0] + [int(p) for p in split_points] + [duration_ms]
+        chunks = await asyncio.to_thread(self._export_chunks, audio, boundaries, overlap_ms)
             
-            # Export last chunk (from last split point to end)
-            last_chunk = audio[split_points[-1]:]
-            last_chunk_path = os.path.join(tmpdir, f"chunk_{len(split_points):03d}.mp3")
-            last_chunk.export(last_chunk_path, format="mp3")
-            chunk_paths.append(Path(last_chunk_path))
-        else:
-            # No split points, just export the whole audio
-            chunk_path = os.path.join(tmpdir, "chunk_000.mp3")
-            audio.export(chunk_path, format="mp3")
-            chunk_paths.append(Path(chunk_path))
-            
-        logger.info(f"Split audio into {len(chunk_paths)} chunks at natural break points")
+        logger.info(f"Split audio into {len(chunks)} chunks at natural break points")
         
         # Check if any chunk is still > max_bytes
-        for i, chunk_path in enumerate(chunk_paths):
-            if os.path.getsize(chunk_path) > max_bytes:
+        for i, chunk in enumerate(chunks):
+            if os.path.getsize(chunk.path) > max_bytes:
                 logger.warning(f"Chunk {i} is still larger than {max_bytes} bytes. Further splitting required.")
                 # This could be improved to recursively split problematic chunks
                 
-        return chunk_paths
+        return chunks
     
-    async def _split_audio_equally(self, audio_path: Path, audio: AudioSegment, num_chunks: int) -> List[Path]:
+    async def _split_audio_equally(self, audio_path: Path, audio: AudioSegment, num_chunks: int, overlap_ms: int = 0) -> List[AudioChunk]:
         """Split audio into equal chunks as a fallback method."""
-        import tempfile
-        
-        tmpdir = tempfile.mkdtemp(prefix="whisper_chunks_")
-        chunk_paths = []
-        
         duration_ms = len(audio)
         chunk_duration_ms = duration_ms // num_chunks
+        boundaries = [i * chunk_duration_ms for i in range(num_chunks)] + [duration_ms]
         
-        for i in range(num_chunks):
-            start_ms = i * chunk_duration_ms
-            end_ms = start_ms + chunk_duration_ms if i < num_chunks - 1 else duration_ms
-            
-            chunk = audio[start_ms:end_ms]
-            chunk_path = os.path.join(tmpdir, f"chunk_{i:03d}.mp3")
-            chunk.export(chunk_path, format="mp3")
-            chunk_paths.append(Path(chunk_path))
-            
-        logger.info(f"Split audio into {len(chunk_paths)} equal chunks")
-        return chunk_paths
+        chunks = await asyncio.to_thread(self._export_chunks, audio, boundaries, overlap_ms)
+        logger.info(f"Split audio into {len(chunks)} equal chunks")
+        return chunks
+    
+    @staticmethod
+    def _export_chunks(audio: AudioSegment, boundaries: List[int], overlap_ms: int = 0) -> List[AudioChunk]:
+        """
+        Export audio[boundaries[i]:boundaries[i+1]] as MP3 chunks. Every chunk after
+        the first starts overlap_ms early and records its exact position.
+        """
+        import tempfile
+        
+        tmpdir = tempfile.mkdtemp(prefix="whisper_chunks_")
+        chunks = []
+        for i in range(len(boundaries) - 1):
+            start_ms = max(0, boundaries[i] - overlap_ms) if i > 0 else 0
+            end_ms = boundaries[i + 1]
+            chunk_path = Path(tmpdir) / f"chunk_{i:03d}.mp3"
+            audio[start_ms:end_ms].export(str(chunk_path), format="mp3")
+            chunks.append(AudioChunk(
+                path=chunk_path,
+                start_ms=start_ms,
+                end_ms=end_ms,
+                overlap_ms=boundaries[i] - start_ms
+            ))
+        return chunks
     
     async def generate_subtitle_file(
         self,
@@ -758,8 +1409,8 @@ class WhisperTranscriber(BaseTranscriber):
         try:
             # Download audio first
             async with self._download_audio(video_id) as audio_path:
-                mp3_path = await self._convert_to_mp3(audio_path)
-                audio_file = mp3_path or audio_path
+                speech_path = await self._prepare_audio_for_upload(audio_path, video_id=video_id)
+                audio_file = speech_path or audio_path
                 
                 # Directly transcribe and produce SRT here to avoid extra service
                 srt_path = await self._transcribe_audio_to_srt(
@@ -781,18 +1432,8 @@ class WhisperTranscriber(BaseTranscriber):
         Legacy method for splitting audio file into chunks <= max_bytes using ffmpeg.
         This is kept for backwards compatibility, but _split_audio_intelligently is preferred.
         """
-        import tempfile
-        import shutil
-        import subprocess
-        from pathlib import Path
-
         # Get duration of audio file using ffprobe
-        cmd = [
-            'ffprobe', '-v', 'error', '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1', str(audio_path)
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        duration = float(result.stdout.strip())
+        duration = await self._get_audio_duration(audio_path)
         logger.info(f"Audio duration: {duration:.2f} seconds")
 
         # Estimate chunk duration so each chunk is <= max_bytes
@@ -814,7 +1455,9 @@ class WhisperTranscriber(BaseTranscriber):
             'ffmpeg', '-i', str(audio_path), '-f', 'segment', '-segment_time', str(chunk_duration),
             '-c', 'copy', chunk_pattern, '-y'
         ]
-        subprocess.run(cmd, check=True)
+        returncode, _, stderr = await self._run_media_command(cmd)
+        if returncode != 0:
+            raise RuntimeError(f"ffmpeg segmenting failed: {stderr.decode(errors='ignore')[:300]}")
 
         # Collect chunk files
         chunk_files = sorted(Path(tmpdir).glob("chunk_*.mp3"))
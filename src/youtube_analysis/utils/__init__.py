@@ -11,6 +11,7 @@ from .youtube_utils import (
     cache_transcription,
     clean_markdown_fences
 )
+from .single_flight import SingleFlight
 
 __all__ = [
     'setup_logger',
@@ -20,5 +21,6 @@ __all__ = [
     'get_cache_key',
     'get_cached_transcription',
     'cache_transcription',
-    'clean_markdown_fences'
+    'clean_markdown_fences',
+    'SingleFlight'
 ]
\ No newline at end of file
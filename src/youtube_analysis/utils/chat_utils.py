@@ -1,16 +1,21 @@
 """Chat utility functions for YouTube video analysis."""
 
+import json
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import FAISS
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_core.documents import Document
 from langchain_openai import OpenAIEmbeddings
+from langchain_core.embeddings import Embeddings
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.tools import Tool
 from langgraph.prebuilt import create_react_agent
-from langchain.schema import Document
 from langchain_tavily import TavilySearch
 import streamlit as st
 import os
@@ -18,19 +23,59 @@ import asyncio
 
 from dotenv import load_dotenv
 
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    # Windows: builds are still coalesced within the process
+    FCNTL_AVAILABLE = False
+
+try:
+    from openai import RateLimitError
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
 load_dotenv()
 
 from .logging import get_logger
-from ..core import LLMManager, YouTubeClient, CacheManager
+from .embedding_cache import CachedEmbeddings, get_embedding_cache
+from .single_flight import SingleFlight
+from .vectorstore_cache import get_vectorstore_cache
+from ..core import LLMManager, YouTubeClient
 from ..core.config import CHAT_PROMPT_TEMPLATE
 
 # Configure logging
 logger = get_logger("chat_utils")
 
-# Initialize core components
-llm_manager = LLMManager()
-cache_manager = CacheManager()
-youtube_client = YouTubeClient(cache_manager)
+
+def _get_llm_manager() -> LLMManager:
+    """Resolve the process-wide LLM manager from the service factory."""
+    from ..service_factory import get_service_factory
+    return get_service_factory().get_llm_manager()
+
+
+def _get_youtube_client() -> YouTubeClient:
+    """Resolve the process-wide YouTube client from the service factory."""
+    from ..service_factory import get_service_factory
+    return get_service_factory().get_youtube_client()
+
+
+# How long a build lease is honoured before waiters give up on a stuck owner
+VECTORSTORE_BUILD_LEASE_SEC = int(os.environ.get("VECTORSTORE_BUILD_LEASE_SEC", "600"))
+
+# One in-flight index build per video_id within this process
+_vectorstore_builds = SingleFlight("vectorstore")
+
+# Embedding requests per batch and batches in flight when building an index
+EMBEDDING_BATCH_SIZE = 64
+EMBEDDING_MAX_CONCURRENCY = int(os.environ.get("EMBEDDING_MAX_CONCURRENCY", "4"))
 
 # Base directory to persist vector stores (can be overridden via env)
 VECTORSTORE_DIR = os.environ.get(
@@ -38,6 +83,83 @@ VECTORSTORE_DIR = os.environ.get(
     os.path.join(os.getcwd(), "analysis_cache", "vectorstores")
 )
 
+def _get_embeddings() -> Embeddings:
+    """Embeddings for the configured model, backed by the persistent embedding cache when enabled."""
+    model = os.environ.get("EMBEDDING_MODEL", "text-embedding-3-small")
+    embeddings = OpenAIEmbeddings(model=model)
+    cache = get_embedding_cache()
+    if cache is None:
+        return embeddings
+    return CachedEmbeddings(embeddings, model, cache)
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """Check whether an embedding API error is a rate limit (HTTP 429)."""
+    if OPENAI_AVAILABLE and isinstance(error, RateLimitError):
+        return True
+    return getattr(error, "status_code", None) == 429
+
+
+def _embed_texts_concurrently(
+    embeddings: Embeddings,
+    texts: List[str],
+    batch_size: int = EMBEDDING_BATCH_SIZE,
+    max_concurrency: int = EMBEDDING_MAX_CONCURRENCY,
+    max_retries: int = 5,
+) -> List[List[float]]:
+    """
+    Embed texts in batches on a bounded pool and return vectors in input order.
+
+    A semaphore caps the batches in flight. When a batch is rate limited, every
+    worker pauses with exponential backoff and that batch's permit is retired,
+    so the effective concurrency shrinks (down to 1) for the rest of the build.
+    """
+    batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+    if not batches:
+        return []
+    workers = max(1, min(max_concurrency, len(batches)))
+    semaphore = threading.Semaphore(workers)
+    state_lock = threading.Lock()
+    state = {"limit": workers, "resume_at": 0.0, "done": 0}
+
+    def embed_batch(batch: List[str]) -> List[List[float]]:
+        for attempt in range(max_retries + 1):
+            delay = state["resume_at"] - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            semaphore.acquire()
+            release = True
+            try:
+                vectors = embeddings.embed_documents(batch)
+            except Exception as e:
+                if not _is_rate_limit_error(e) or attempt == max_retries:
+                    raise
+                backoff = min(60.0, 2.0 * (2 ** attempt))
+                with state_lock:
+                    state["resume_at"] = max(state["resume_at"], time.monotonic() + backoff)
+                    if state["limit"] > 1:
+                        # Keep this permit so concurrency stays lower for the rest of the build
+                        state["limit"] -= 1
+                        release = False
+                    limit = state["limit"]
+                logger.warning(
+                    f"Embedding batch rate limited; concurrency -> {limit}, retrying in {backoff:.0f}s"
+                )
+                continue
+            finally:
+                if release:
+                    semaphore.release()
+            with state_lock:
+                state["done"] += len(batch)
+                logger.info(f"Embedded {state['done']}/{len(texts)} chunks")
+            return vectors
+        raise RuntimeError("Embedding batch failed after retries")
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="embed") as executor:
+        results = list(executor.map(embed_batch, batches))
+    return [vector for batch_vectors in results for vector in batch_vectors]
+
+
 def create_vectorstore(text: str, transcript_list: Optional[List[Dict[str, Any]]] = None) -> FAISS:
     """
     Create a vector store from the text.
@@ -105,66 +227,23 @@ def create_vectorstore(text: str, transcript_list: Optional[List[Dict[str, Any]]
         if current_chunk:
             chunks.append(current_chunk)
             metadata_list.append(current_chunk_metadata)
-        
-        # Create embeddings (smaller batch size, explicit model configurable via env)
-        embeddings = OpenAIEmbeddings(
-            model=os.environ.get("EMBEDDING_MODEL", "text-embedding-3-small"),
-        )
-
-        # Prepare documents
-        documents = [
-            Document(page_content=chunk, metadata=metadata)
-            for chunk, metadata in zip(chunks, metadata_list)
-        ]
-
-        # Build FAISS index in small batches to respect API token limits
-        def batched(seq, n):
-            for i in range(0, len(seq), n):
-                yield seq[i:i + n]
-
-        vectorstore: Optional[FAISS] = None
-        batch_size = 64
-        total = len(documents)
-        created = 0
-        for idx, batch_docs in enumerate(batched(documents, batch_size), start=1):
-            if vectorstore is None:
-                vectorstore = FAISS.from_documents(batch_docs, embedding=embeddings)
-            else:
-                vectorstore.add_documents(batch_docs)
-            created += len(batch_docs)
-            logger.info(f"Indexed {created}/{total} chunks (with timestamps) into FAISS")
-
-        assert vectorstore is not None
-        logger.info(f"Created FAISS vector store with {total} chunks (with timestamps)")
     else:
         # Process regular transcript without timestamps
         chunks = text_splitter.split_text(text)
-        
-        # Create embeddings (smaller batch size, explicit model configurable via env)
-        embeddings = OpenAIEmbeddings(
-            model=os.environ.get("EMBEDDING_MODEL", "text-embedding-3-small"),
-        )
-
-        # Build FAISS index in small batches to respect API token limits
-        def batched(seq, n):
-            for i in range(0, len(seq), n):
-                yield seq[i:i + n]
-
-        vectorstore: Optional[FAISS] = None
-        batch_size = 64
-        total = len(chunks)
-        created = 0
-        for idx, batch_texts in enumerate(batched(chunks, batch_size), start=1):
-            if vectorstore is None:
-                vectorstore = FAISS.from_texts(texts=batch_texts, embedding=embeddings)
-            else:
-                vectorstore.add_texts(batch_texts)
-            created += len(batch_texts)
-            logger.info(f"Indexed {created}/{total} chunks into FAISS")
-
-        assert vectorstore is not None
-        logger.info(f"Created FAISS vector store with {total} chunks")
-    
+        metadata_list = None
+
+    # Embed all batches concurrently, then build the index with a single add
+    embeddings = _get_embeddings()
+    vectors = _embed_texts_concurrently(embeddings, chunks)
+    vectorstore = FAISS.from_embeddings(
+        text_embeddings=list(zip(chunks, vectors)),
+        embedding=embeddings,
+        metadatas=metadata_list,
+    )
+    logger.info(
+        f"Created FAISS vector store with {len(chunks)} chunks"
+        f"{' (with timestamps)' if metadata_list is not None else ''}"
+    )
     return vectorstore
 
 
@@ -173,20 +252,78 @@ def _get_vectorstore_path(video_id: str) -> str:
     return os.path.join(VECTORSTORE_DIR, video_id)
 
 
+# Persisted layout: index.faiss (native FAISS file, same as save_local writes)
+# plus chunks.json with each vector's docstore id, text and metadata in index
+# order. Older directories hold a pickled docstore in index.pkl instead.
+_INDEX_FILE = "index.faiss"
+_CHUNKS_FILE = "chunks.json"
+
+
+def _mmap_read_flags() -> int:
+    """FAISS read flags that map the index file instead of copying it into memory."""
+    # IO_FLAG_MMAP_IFC (faiss >= 1.9) also maps flat indexes; IO_FLAG_MMAP alone covers IVF lists
+    flags = getattr(faiss, "IO_FLAG_MMAP_IFC", 0) or faiss.IO_FLAG_MMAP
+    return flags | faiss.IO_FLAG_READ_ONLY
+
+
+def _write_chunks_file(path: str, vectorstore: FAISS) -> None:
+    """Write the docstore side file atomically so concurrent readers never see a partial file."""
+    chunks = []
+    for position in range(len(vectorstore.index_to_docstore_id)):
+        doc_id = vectorstore.index_to_docstore_id[position]
+        doc = vectorstore.docstore.search(doc_id)
+        chunks.append({"id": doc_id, "text": doc.page_content, "metadata": doc.metadata})
+    tmp_path = os.path.join(path, f".{_CHUNKS_FILE}.{os.getpid()}")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(chunks, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, os.path.join(path, _CHUNKS_FILE))
+
+
+def _load_mapped_vectorstore(path: str, embeddings: Embeddings) -> FAISS:
+    """Load an index.faiss + chunks.json store, memory-mapping the vectors read-only."""
+    index = faiss.read_index(os.path.join(path, _INDEX_FILE), _mmap_read_flags())
+    with open(os.path.join(path, _CHUNKS_FILE), "r", encoding="utf-8") as f:
+        chunks = json.load(f)
+    if len(chunks) != index.ntotal:
+        raise ValueError(f"{_CHUNKS_FILE} has {len(chunks)} chunks but the index has {index.ntotal} vectors")
+    docstore = InMemoryDocstore({
+        c["id"]: Document(page_content=c["text"], metadata=c.get("metadata") or {}) for c in chunks
+    })
+    index_to_docstore_id = {position: c["id"] for position, c in enumerate(chunks)}
+    return FAISS(embeddings, index, docstore, index_to_docstore_id)
+
+
 def load_vectorstore(video_id: str) -> Optional[FAISS]:
     """
     Load a persisted FAISS vector store for the given video if available.
-    Returns None if not found or load fails.
+    Recently used stores are served from the in-memory cache without
+    touching disk. Returns None if not found or load fails.
     """
+    cache = get_vectorstore_cache()
+    cached = cache.get(video_id)
+    if cached is not None:
+        return cached
     try:
         path = _get_vectorstore_path(video_id)
         if not os.path.isdir(path):
             return None
-        # Embeddings object is required for load
-        embeddings = OpenAIEmbeddings()
-        # allow_dangerous_deserialization needed for newer LC versions loading legacy indexes
-        vs = FAISS.load_local(path, embeddings, allow_dangerous_deserialization=True)
-        logger.info(f"Loaded persisted FAISS index from {path}")
+        # Embeddings object is required for load; queries must use the model the index was built with
+        embeddings = _get_embeddings()
+        if FAISS_AVAILABLE and os.path.isfile(os.path.join(path, _CHUNKS_FILE)):
+            # Page-cache backed: worker processes share the vectors and skip unpickling
+            vs = _load_mapped_vectorstore(path, embeddings)
+            logger.info(f"Memory-mapped FAISS index from {path}")
+        else:
+            # allow_dangerous_deserialization needed for newer LC versions loading legacy indexes
+            vs = FAISS.load_local(path, embeddings, allow_dangerous_deserialization=True)
+            logger.info(f"Loaded persisted FAISS index from {path}")
+            if FAISS_AVAILABLE:
+                try:
+                    _write_chunks_file(path, vs)
+                    logger.info(f"Migrated FAISS docstore for {video_id} to {_CHUNKS_FILE}")
+                except Exception as e:
+                    logger.warning(f"Could not migrate FAISS docstore for {video_id}: {e}")
+        cache.put(video_id, vs)
         return vs
     except Exception as e:
         logger.warning(f"Could not load FAISS index for {video_id}: {e}")
@@ -198,69 +335,150 @@ def save_vectorstore(video_id: str, vectorstore: FAISS) -> None:
     try:
         path = _get_vectorstore_path(video_id)
         os.makedirs(path, exist_ok=True)
-        vectorstore.save_local(path)
-        logger.info(f"Saved FAISS index to {path}")
+        if not FAISS_AVAILABLE:
+            vectorstore.save_local(path)
+            logger.info(f"Saved FAISS index to {path}")
+            return
+        tmp_index = os.path.join(path, f".{_INDEX_FILE}.{os.getpid()}")
+        faiss.write_index(vectorstore.index, tmp_index)
+        os.replace(tmp_index, os.path.join(path, _INDEX_FILE))
+        _write_chunks_file(path, vectorstore)
+        logger.info(f"Saved FAISS index to {path} ({vectorstore.index.ntotal} vectors)")
     except Exception as e:
         logger.warning(f"Failed to save FAISS index for {video_id}: {e}")
 
 
-def get_or_create_vectorstore(
-    video_id: str,
-    text: str,
-    transcript_list: Optional[List[Dict[str, Any]]] = None,
-) -> FAISS:
+class _BuildLease:
     """
-    Retrieve an existing FAISS index for the video or create a new one by
-    chunking the transcript and embedding the chunks.
+    Cross-process vector store build lock.
+
+    An exclusive flock on <video_id>.lock whose contents record the owner's PID
+    and lease expiry. The kernel drops the lock when the owner exits, so a
+    crashed worker never leaves a stale lock; the lease only bounds how long
+    others wait on an owner that is alive but stuck.
     """
-    # Try load first
-    existing = load_vectorstore(video_id)
-    if existing is not None:
-        return existing
 
-    # Ensure base directory exists
-    os.makedirs(VECTORSTORE_DIR, exist_ok=True)
+    _GRACE_SEC = 5
+    _POLL_SEC = 0.25
 
-    # Simple file lock to avoid concurrent builds
-    lock_path = os.path.join(VECTORSTORE_DIR, f"{video_id}.lock")
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: Optional[int] = None
 
-    # If another process is building, wait briefly for it to finish and try load again
-    wait_seconds = 0
-    while os.path.exists(lock_path) and wait_seconds < 300:
-        time.sleep(1)
-        wait_seconds += 1
-        existing = load_vectorstore(video_id)
-        if existing is not None:
-            return existing
+    def _read_owner(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    async def acquire(self) -> bool:
+        """
+        Wait for the lock without blocking the event loop or a worker thread.
+
+        Polls a non-blocking flock on an async timer, so waiting on a stuck
+        owner ties up nothing but this coroutine. Returns False if the current
+        owner overruns its lease.
+        """
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            owner = self._read_owner()
+            # An owner that has not written its lease yet still gets the grace period
+            deadline = max(owner.get("expires_at", 0), time.time()) + self._GRACE_SEC
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    pass
+                current = self._read_owner()
+                if current != owner:
+                    # Lock changed hands; wait on the new owner's lease
+                    owner = current
+                    deadline = max(owner.get("expires_at", 0), time.time()) + self._GRACE_SEC
+                elif time.time() >= deadline:
+                    logger.warning(
+                        f"Vector store build lock {self.path} held past its lease by pid {owner.get('pid')}; "
+                        f"building without it"
+                    )
+                    os.close(fd)
+                    return False
+                await asyncio.sleep(self._POLL_SEC)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+        owner = {
+            "pid": os.getpid(),
+            "acquired_at": time.time(),
+            "expires_at": time.time() + VECTORSTORE_BUILD_LEASE_SEC,
+        }
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, json.dumps(owner).encode("utf-8"), 0)
+        return True
+
+    def release(self) -> None:
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
 
-    # Acquire lock
-    lock_acquired = False
-    try:
-        fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
-        os.close(fd)
-        lock_acquired = True
-    except FileExistsError:
-        # Race condition: someone else just started; wait a bit more and try load
-        for _ in range(30):
-            time.sleep(1)
-            existing = load_vectorstore(video_id)
-            if existing is not None:
-                return existing
-        # Fall through and attempt build anyway as a last resort
 
+async def _build_vectorstore_exclusive(
+    video_id: str,
+    text: str,
+    transcript_list: Optional[List[Dict[str, Any]]] = None,
+) -> FAISS:
+    """Build and persist a video's index while holding the cross-process build lease."""
+    os.makedirs(VECTORSTORE_DIR, exist_ok=True)
+    lease = _BuildLease(os.path.join(VECTORSTORE_DIR, f"{video_id}.lock")) if FCNTL_AVAILABLE else None
+    locked = await lease.acquire() if lease else False
     try:
+        # Another process may have finished the build while we waited
+        existing = await asyncio.to_thread(load_vectorstore, video_id)
+        if existing is not None:
+            return existing
+
         logger.info(
             f"No existing FAISS index for {video_id}. Creating a new index from transcript (len={len(text)})."
         )
-        vs = create_vectorstore(text, transcript_list)
-        save_vectorstore(video_id, vs)
+        vs = await asyncio.to_thread(create_vectorstore, text, transcript_list)
+        await asyncio.to_thread(save_vectorstore, video_id, vs)
+        get_vectorstore_cache().put(video_id, vs)
         return vs
     finally:
-        if lock_acquired and os.path.exists(lock_path):
-            try:
-                os.remove(lock_path)
-            except Exception:
-                pass
+        if locked:
+            lease.release()
+
+
+async def get_or_create_vectorstore_async(
+    video_id: str,
+    text: str,
+    transcript_list: Optional[List[Dict[str, Any]]] = None,
+) -> FAISS:
+    """
+    Retrieve an existing FAISS index for the video or create a new one by
+    chunking the transcript and embedding the chunks.
+
+    Concurrent callers in this process share one build per video_id and are
+    resumed when it completes; other processes wait on the build lease.
+    """
+    existing = await asyncio.to_thread(load_vectorstore, video_id)
+    if existing is not None:
+        return existing
+    return await _vectorstore_builds.do(
+        video_id, lambda: _build_vectorstore_exclusive(video_id, text, transcript_list)
+    )
+
+
+def get_or_create_vectorstore(
+    video_id: str,
+    text: str,
+    transcript_list: Optional[List[Dict[str, Any]]] = None,
+) -> FAISS:
+    """Synchronous variant of get_or_create_vectorstore_async for callers without an event loop."""
+    return asyncio.run(get_or_create_vectorstore_async(video_id, text, transcript_list))
+
 
 def create_agent_graph(vectorstore: FAISS, video_metadata: Dict[str, Any], has_timestamps: bool = False):
     """
@@ -300,7 +518,7 @@ def create_agent_graph(vectorstore: FAISS, video_metadata: Dict[str, Any], has_t
         provider = "groq"
         
     config = LLMConfig(model=model_name, temperature=temperature, provider=provider)
-    llm = llm_manager.get_langchain_llm(config)
+    llm = _get_llm_manager().get_langchain_llm(config)
 
     # Create Tavily search tool
     search_tool = TavilySearch(
@@ -442,7 +660,7 @@ async def setup_chat_for_video_async(youtube_url: str, transcript: str, transcri
     """
     try:
         # Extract video ID
-        video_id = youtube_client.extract_video_id(youtube_url)
+        video_id = _get_youtube_client().extract_video_id(youtube_url)
         if not video_id:
             logger.error(f"Failed to extract video ID from URL: {youtube_url}")
             return None
@@ -469,7 +687,7 @@ async def setup_chat_for_video_async(youtube_url: str, transcript: str, transcri
         # Get video information from the already retrieved data
         try:
             # Use the video_id to get video info
-            video_info_obj = await youtube_client.get_video_info(youtube_url)
+            video_info_obj = await _get_youtube_client().get_video_info(youtube_url)
             
             if not video_info_obj:
                 logger.warning(f"Could not get video info for {video_id}, using default values")
@@ -504,7 +722,7 @@ async def setup_chat_for_video_async(youtube_url: str, transcript: str, transcri
             f"Preparing vector store from transcript (has timestamps: {has_timestamps}). Will load existing index if available."
         )
         try:
-            vectorstore = get_or_create_vectorstore(video_id, transcript, transcript_list)
+            vectorstore = await get_or_create_vectorstore_async(video_id, transcript, transcript_list)
             logger.info(
                 f"Vector store ready for chat (with timestamps: {has_timestamps})."
             )
@@ -0,0 +1,200 @@
+"""Persistent embedding cache keyed by embedding model and chunk text hash."""
+
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+from .logging import get_logger
+
+logger = get_logger("embedding_cache")
+
+EMBEDDING_CACHE_DIR = os.environ.get(
+    "EMBEDDING_CACHE_DIR",
+    os.path.join(os.getcwd(), "analysis_cache", "embeddings")
+)
+EMBEDDING_CACHE_MAX_MB = float(os.environ.get("EMBEDDING_CACHE_MAX_MB", "512"))
+
+# Approximate per-row cost beyond the vector blob (model name, hash, keys, page overhead)
+_ROW_OVERHEAD_BYTES = 128
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed store of (model, sha256(text)) -> float32 vector.
+
+    Vectors are stored as raw float32 blobs (4 bytes per dimension), so a
+    1536-dimension embedding takes about 6 KB. SQLite handles concurrent
+    readers and writers from several processes sharing the directory.
+    Rows record when they were last read or written, and the least recently
+    used ones are pruned once the store grows past max_bytes.
+    """
+
+    def __init__(self, cache_dir: str = EMBEDDING_CACHE_DIR, max_bytes: Optional[int] = None):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.db_path = os.path.join(cache_dir, "embeddings.sqlite3")
+        self.max_bytes = max_bytes if max_bytes is not None else int(EMBEDDING_CACHE_MAX_MB * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "pruned": 0}
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " model TEXT NOT NULL,"
+                " text_hash TEXT NOT NULL,"
+                " vector BLOB NOT NULL,"
+                " last_used REAL NOT NULL DEFAULT 0,"
+                " PRIMARY KEY (model, text_hash))"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(embeddings)")}
+            if "last_used" not in columns:
+                # Stores created before pruning existed
+                conn.execute("ALTER TABLE embeddings ADD COLUMN last_used REAL NOT NULL DEFAULT 0")
+            conn.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+
+    @contextmanager
+    def _connect(self):
+        """Open a short-lived connection that commits on success and always closes."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get_many(self, model: str, hashes: List[str]) -> Dict[str, List[float]]:
+        """Return cached vectors for the given text hashes (missing hashes are omitted)."""
+        found: Dict[str, List[float]] = {}
+        unique = list(dict.fromkeys(hashes))
+        with self._connect() as conn:
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(unique), 500):
+                batch = unique[i:i + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND text_hash IN ({placeholders})",
+                    [model, *batch]
+                )
+                hit_hashes = []
+                for text_hash, blob in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[text_hash] = vector.tolist()
+                    hit_hashes.append(text_hash)
+                if hit_hashes:
+                    conn.execute(
+                        f"UPDATE embeddings SET last_used = ? WHERE model = ? AND text_hash IN ({','.join('?' * len(hit_hashes))})",
+                        [time.time(), model, *hit_hashes]
+                    )
+        with self._lock:
+            self._stats["hits"] += len(found)
+            self._stats["misses"] += len(unique) - len(found)
+        return found
+
+    def put_many(self, model: str, items: Dict[str, List[float]]) -> None:
+        """Store vectors keyed by text hash, then prune least recently used rows over budget."""
+        now = time.time()
+        rows = [(model, text_hash, array("f", vector).tobytes(), now) for text_hash, vector in items.items()]
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, vector, last_used) VALUES (?, ?, ?, ?)", rows
+            )
+            self._prune(conn)
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        count, blob_bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+        ).fetchone()
+        total = blob_bytes + count * _ROW_OVERHEAD_BYTES
+        if total <= self.max_bytes or not count:
+            return
+        row_bytes = total / count
+        excess_rows = math.ceil((total - self.max_bytes) / row_bytes)
+        conn.execute(
+            "DELETE FROM embeddings WHERE rowid IN "
+            "(SELECT rowid FROM embeddings ORDER BY last_used LIMIT ?)",
+            (excess_rows,)
+        )
+        with self._lock:
+            self._stats["pruned"] += excess_rows
+        logger.info(f"Pruned {excess_rows} least recently used embeddings (cache was {total / 1024 / 1024:.1f} MB)")
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get hit/miss/prune counts for this process."""
+        with self._lock:
+            return dict(self._stats)
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that only sends texts missing from the cache upstream.
+
+    Document embeddings are looked up by (model, sha256(text)), so rebuilding an
+    index after a cache clear, under a different VECTORSTORE_DIR, or for a
+    transcript sharing chunks with another one only pays for new chunks.
+    Queries are passed straight through.
+    """
+
+    def __init__(self, underlying: Embeddings, model: str, cache: EmbeddingCache):
+        self.underlying = underlying
+        self.model = model
+        self.cache = cache
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        hashes = [self.cache.text_hash(t) for t in texts]
+        try:
+            vectors = self.cache.get_many(self.model, hashes)
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache read failed, embedding all texts: {e}")
+            vectors = {}
+
+        missing: Dict[str, str] = {}
+        for text, text_hash in zip(texts, hashes):
+            if text_hash not in vectors:
+                missing.setdefault(text_hash, text)
+        if missing:
+            fresh = self.underlying.embed_documents(list(missing.values()))
+            new_vectors = dict(zip(missing.keys(), fresh))
+            vectors.update(new_vectors)
+            try:
+                self.cache.put_many(self.model, new_vectors)
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache write failed: {e}")
+
+        reused = sum(1 for h in hashes if h not in missing)
+        logger.info(f"Embeddings: {reused}/{len(texts)} chunks reused from cache")
+        return [vectors[h] for h in hashes]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.underlying.embed_query(text)
+
+
+_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Get the process-wide embedding cache, or None if disabled or unavailable."""
+    global _cache
+    if os.environ.get("EMBEDDING_CACHE_ENABLED", "true").lower() != "true":
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = EmbeddingCache()
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning(f"Embedding cache disabled: {e}")
+                    return None
+    return _cache
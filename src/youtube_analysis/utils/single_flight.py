@@ -0,0 +1,113 @@
+"""Single-flight request coalescing for concurrent cache misses."""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+from .logging import get_logger
+
+logger = get_logger("single_flight")
+
+T = TypeVar('T')
+
+
+class _LeaderCancelled(Exception):
+    """Set on a shared call whose leader was cancelled, so a follower re-runs the fetch."""
+
+
+class SingleFlight:
+    """
+    Per-key registry of in-flight calls.
+
+    The first caller for a key runs the fetch; callers that arrive while it is
+    still running await the same result instead of starting their own. Results
+    are shared through a thread-safe future so callers on different event loops
+    (e.g. separate Streamlit sessions) are coalesced too.
+
+    Cancelling a follower only affects that follower. Cancelling the leader
+    hands the fetch over to one of the remaining followers instead of failing
+    them all.
+    """
+
+    def __init__(self, name: str = "default"):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+        self._stats = {"executed": 0, "coalesced": 0}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn once per key among concurrent callers and return its result.
+
+        Args:
+            key: Coalescing key (e.g. "cache_type:key" or a video ID)
+            fn: Coroutine function performing the actual fetch
+
+        Returns:
+            The result of fn; exceptions raised by fn propagate to every waiter
+        """
+        joined = False
+        while True:
+            with self._lock:
+                future = self._calls.get(key)
+                leader = future is None
+                if leader:
+                    future = Future()
+                    # A running future cannot be cancelled by any single waiter
+                    future.set_running_or_notify_cancel()
+                    self._calls[key] = future
+                    self._stats["executed"] += 1
+                elif not joined:
+                    self._stats["coalesced"] += 1
+                    joined = True
+
+            if leader:
+                return await self._lead(key, future, fn)
+
+            logger.debug(f"[{self.name}] Joining in-flight call for {key}")
+            try:
+                # shield: cancelling this waiter must not cancel the shared future
+                return await asyncio.shield(asyncio.wrap_future(future))
+            except _LeaderCancelled:
+                logger.debug(f"[{self.name}] Leader for {key} was cancelled, taking over")
+
+    async def _lead(self, key: str, future: Future, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn for key and publish its outcome to the followers."""
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # Unregister first so a released follower starts a fresh call
+            self._forget(key, future)
+            if not future.done():
+                future.set_exception(_LeaderCancelled())
+            raise
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+            raise
+        else:
+            if not future.done():
+                future.set_result(result)
+            return result
+        finally:
+            self._forget(key, future)
+
+    def _forget(self, key: str, future: Future) -> None:
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def in_flight(self, key: str) -> bool:
+        """Check whether a call for key is currently running."""
+        with self._lock:
+            return key in self._calls
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics."""
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "executed": self._stats["executed"],
+                "coalesced": self._stats["coalesced"]
+            }
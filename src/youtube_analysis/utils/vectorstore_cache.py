@@ -0,0 +1,150 @@
+"""In-memory LRU of loaded FAISS vector stores and their chat agents, bounded by index bytes."""
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from .logging import get_logger
+
+logger = get_logger("vectorstore_cache")
+
+# Rough per-document overhead of a Document object and its docstore/id-map entries
+_DOC_OVERHEAD_BYTES = 200
+
+
+@dataclass
+class _LoadedIndex:
+    vectorstore: Any
+    size_bytes: int
+    agent: Any = None
+
+
+class VectorStoreCache:
+    """
+    Process-wide LRU of loaded vector stores keyed by video_id.
+
+    Each entry is sized by its FAISS index (vectors x bytes per code) plus the
+    chunk texts in the docstore, and least recently used entries are dropped
+    once the byte budget is exceeded. A chat agent built on a cached store is
+    kept on the same entry, since it references the store and is evicted with it.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _LoadedIndex]" = OrderedDict()
+        self._bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "agent_hits": 0, "agent_misses": 0, "evictions": 0}
+
+    @staticmethod
+    def estimate_size(vectorstore: Any) -> int:
+        """Estimate the resident size of a LangChain FAISS store in bytes."""
+        size = 0
+        index = getattr(vectorstore, "index", None)
+        if index is not None:
+            code_size = getattr(index, "code_size", None) or getattr(index, "d", 0) * 4
+            size += int(index.ntotal) * int(code_size)
+        docs = getattr(getattr(vectorstore, "docstore", None), "_dict", None) or {}
+        for doc in docs.values():
+            size += len(getattr(doc, "page_content", "")) + _DOC_OVERHEAD_BYTES
+        return size
+
+    def get(self, video_id: str) -> Optional[Any]:
+        """Return the loaded vector store for video_id and mark it recently used."""
+        with self._lock:
+            entry = self._entries.get(video_id)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(video_id)
+            self._stats["hits"] += 1
+            return entry.vectorstore
+
+    def put(self, video_id: str, vectorstore: Any) -> None:
+        """Cache a loaded vector store, evicting least recently used entries to fit."""
+        size = self.estimate_size(vectorstore)
+        if size > self.max_bytes:
+            logger.info(f"Not caching FAISS index for {video_id}: {size} bytes exceeds the {self.max_bytes} byte budget")
+            return
+        with self._lock:
+            previous = self._entries.pop(video_id, None)
+            if previous is not None:
+                self._bytes -= previous.size_bytes
+            self._entries[video_id] = _LoadedIndex(vectorstore=vectorstore, size_bytes=size)
+            self._bytes += size
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                evicted_id, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size_bytes
+                self._stats["evictions"] += 1
+                logger.debug(f"Evicted FAISS index for {evicted_id} ({evicted.size_bytes} bytes)")
+
+    def get_agent(self, video_id: str) -> Optional[Any]:
+        """Return the chat agent built for video_id's cached store, if any."""
+        with self._lock:
+            entry = self._entries.get(video_id)
+            if entry is None or entry.agent is None:
+                self._stats["agent_misses"] += 1
+                return None
+            self._entries.move_to_end(video_id)
+            self._stats["agent_hits"] += 1
+            return entry.agent
+
+    def set_agent(self, video_id: str, agent: Any) -> bool:
+        """
+        Attach a chat agent to video_id's cached store.
+
+        Returns False when the store is not cached (too large or already
+        evicted), in which case the agent is not retained either.
+        """
+        with self._lock:
+            entry = self._entries.get(video_id)
+            if entry is None:
+                return False
+            entry.agent = agent
+            self._entries.move_to_end(video_id)
+            return True
+
+    def discard_agent(self, video_id: str) -> None:
+        """Drop video_id's chat agent but keep its loaded store."""
+        with self._lock:
+            entry = self._entries.get(video_id)
+            if entry is not None:
+                entry.agent = None
+
+    def invalidate(self, video_id: str) -> None:
+        """Drop video_id's store and agent."""
+        with self._lock:
+            entry = self._entries.pop(video_id, None)
+            if entry is not None:
+                self._bytes -= entry.size_bytes
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "agents": sum(1 for e in self._entries.values() if e.agent is not None),
+                "size_mb": self._bytes / (1024 * 1024),
+                "limit_mb": self.max_bytes / (1024 * 1024),
+                "utilization": self._bytes / self.max_bytes if self.max_bytes else 0,
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0
+            }
+
+
+_cache: Optional[VectorStoreCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_vectorstore_cache() -> VectorStoreCache:
+    """Get the process-wide vector store cache, sized by CHAT_INDEX_CACHE_MAX_MB."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                max_mb = float(os.environ.get("CHAT_INDEX_CACHE_MAX_MB", "512"))
+                _cache = VectorStoreCache(int(max_mb * 1024 * 1024))
+    return _cache
@@ -158,12 +158,9 @@ class VideoAnalysisWorkflow:
         except Exception as e:
             logger.warning(f"Could not retrieve transcript using transcript service: {str(e)}")
             
-            # Fallback: try to get video data from cache
+            # Fallback: try to get video data from the shared cache repository
             try:
-                from ..repositories import CacheRepository
-                from ..core import CacheManager
-                cache_manager = CacheManager()
-                cache_repo = CacheRepository(cache_manager)
+                cache_repo = self.transcript_service.cache_repo
                 
                 video_data = await cache_repo.get_video_data(analysis_result.video_id)
                 
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The app runs from src/ (see Dockerfile), so make the package importable the same way
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -0,0 +1,74 @@
+"""Tests for concurrent embedding of vector store chunks."""
+
+import threading
+from typing import List
+
+from langchain_core.embeddings import Embeddings
+
+from youtube_analysis.utils import chat_utils
+
+
+class RateLimitedOnce(Exception):
+    status_code = 429
+
+
+class FakeEmbeddings(Embeddings):
+    """
+    Embeds each text as [index]. The first call waits until every worker is
+    in flight and then fails with a rate limit; afterwards the peak number of
+    concurrent calls is recorded.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.lock = threading.Lock()
+        self.all_in_flight = threading.Event()
+        self.in_flight = 0
+        self.peak_before_limit = 0
+        self.peak_after_limit = 0
+        self.failing = False
+        self.rate_limited = False
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        with self.lock:
+            self.in_flight += 1
+            if self.rate_limited:
+                self.peak_after_limit = max(self.peak_after_limit, self.in_flight)
+            else:
+                self.peak_before_limit = max(self.peak_before_limit, self.in_flight)
+            if self.in_flight == self.workers:
+                self.all_in_flight.set()
+            fail = not self.failing
+            self.failing = True
+        try:
+            if fail:
+                self.all_in_flight.wait(timeout=5)
+                with self.lock:
+                    self.rate_limited = True
+                raise RateLimitedOnce("Too many requests")
+            threading.Event().wait(0.02)
+            return [[float(t)] for t in texts]
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def embed_query(self, text: str) -> List[float]:
+        return [float(text)]
+
+
+def test_rate_limit_error_detection():
+    assert chat_utils._is_rate_limit_error(RateLimitedOnce("Too many requests"))
+    assert not chat_utils._is_rate_limit_error(ValueError("input has 4290 tokens, limit is 8191"))
+
+
+def test_rate_limit_shrinks_concurrency_and_keeps_order(monkeypatch):
+    monkeypatch.setattr(chat_utils.time, "sleep", lambda _seconds: None)
+    texts = [str(i) for i in range(40)]
+    embeddings = FakeEmbeddings(workers=4)
+
+    vectors = chat_utils._embed_texts_concurrently(embeddings, texts, batch_size=2, max_concurrency=4)
+
+    assert vectors == [[float(t)] for t in texts]
+    assert embeddings.peak_before_limit == 4
+    # The rate-limited batch's permit is retired for the rest of the build
+    assert 1 <= embeddings.peak_after_limit <= 3
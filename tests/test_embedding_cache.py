@@ -0,0 +1,67 @@
+"""Tests for the persistent embedding cache."""
+
+from typing import List
+
+from langchain_core.embeddings import Embeddings
+
+from youtube_analysis.utils.embedding_cache import CachedEmbeddings, EmbeddingCache
+
+
+class FakeEmbeddings(Embeddings):
+    """Deterministic embeddings that record which texts were sent upstream."""
+
+    def __init__(self):
+        self.calls: List[List[str]] = []
+
+    def _vector(self, text: str) -> List[float]:
+        return [float(len(text)), 0.5, -1.25]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.calls.append(list(texts))
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._vector(text)
+
+
+def test_vectors_round_trip_through_float32_blobs(tmp_path):
+    cache = EmbeddingCache(str(tmp_path))
+    vector = [0.25, -3.5, 1024.0, 0.1]
+    text_hash = cache.text_hash("hello")
+
+    cache.put_many("model-a", {text_hash: vector})
+    found = cache.get_many("model-a", [text_hash, cache.text_hash("missing")])
+
+    assert list(found) == [text_hash]
+    # Stored as float32: exactly representable values survive, others to ~7 digits
+    assert found[text_hash][:3] == [0.25, -3.5, 1024.0]
+    assert abs(found[text_hash][3] - 0.1) < 1e-7
+    # Vectors are keyed by model as well as text
+    assert cache.get_many("model-b", [text_hash]) == {}
+
+
+def test_partial_hit_only_embeds_missing_texts(tmp_path):
+    underlying = FakeEmbeddings()
+    embeddings = CachedEmbeddings(underlying, "model-a", EmbeddingCache(str(tmp_path)))
+
+    first = embeddings.embed_documents(["alpha", "beta"])
+    second = embeddings.embed_documents(["beta", "gamma", "alpha", "gamma"])
+
+    assert underlying.calls == [["alpha", "beta"], ["gamma"]]
+    assert first == [underlying._vector("alpha"), underlying._vector("beta")]
+    assert second == [underlying._vector(t) for t in ["beta", "gamma", "alpha", "gamma"]]
+
+
+def test_least_recently_used_rows_are_pruned_over_budget(tmp_path):
+    # Each row is a 4-float blob (16 bytes) plus the per-row overhead estimate
+    cache = EmbeddingCache(str(tmp_path), max_bytes=3 * (16 + 128))
+    hashes = [cache.text_hash(str(i)) for i in range(4)]
+
+    cache.put_many("m", {hashes[0]: [0.0] * 4})
+    cache.put_many("m", {hashes[1]: [1.0] * 4})
+    cache.put_many("m", {hashes[2]: [2.0] * 4})
+    cache.get_many("m", [hashes[0]])  # refresh the oldest row
+    cache.put_many("m", {hashes[3]: [3.0] * 4})
+
+    assert set(cache.get_many("m", hashes)) == {hashes[0], hashes[2], hashes[3]}
+    assert cache.get_stats()["pruned"] == 1
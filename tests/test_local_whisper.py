@@ -0,0 +1,99 @@
+"""Offline tests for the faster-whisper provider (no model download, no faster-whisper install)."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from youtube_analysis.transcription import LocalWhisperTranscriber, TranscriberFactory
+
+
+class StubModel:
+    """Mimics WhisperModel.transcribe: a lazy segment generator plus an info object."""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, **options):
+        self.calls.append((audio, options))
+        segments = [
+            SimpleNamespace(text=" Hello there.", start=0.0, end=1.5),
+            SimpleNamespace(text="   ", start=1.5, end=2.0),
+            SimpleNamespace(text=" General Kenobi. ", start=62.25, end=64.0),
+        ]
+        info = SimpleNamespace(language="en", duration=64.0)
+        return (s for s in segments), info
+
+
+@pytest.fixture
+def transcriber(monkeypatch):
+    monkeypatch.setenv("WHISPER_AUDIO_CACHE_ENABLED", "false")
+    transcriber = LocalWhisperTranscriber(model_size="tiny", batch_size=1)
+    model = StubModel()
+    loaded = []
+
+    def load_model(model_size):
+        loaded.append(model_size)
+        return model
+
+    monkeypatch.setattr(transcriber, "_load_model", load_model)
+    transcriber.stub_model = model
+    transcriber.loaded_sizes = loaded
+    yield transcriber
+    transcriber.close()
+
+
+def test_get_returns_model_segments_with_their_offsets(transcriber, monkeypatch, tmp_path):
+    audio = tmp_path / "vid.webm"
+    audio.write_bytes(b"fake audio")
+
+    @asynccontextmanager
+    async def fake_download(video_id):
+        yield audio
+
+    monkeypatch.setattr(transcriber, "_download_audio", fake_download)
+
+    transcript = asyncio.run(transcriber.get(video_id="vid", language="en", model_name="whisper-1"))
+
+    assert transcript.source == "local"
+    assert [(s.text, s.start, s.duration) for s in transcript.segments] == [
+        ("Hello there.", 0.0, 1.5),
+        ("General Kenobi.", 62.25, 1.75),
+    ]
+    # API model names fall back to the configured local model size
+    assert transcriber.loaded_sizes == ["tiny"]
+    path, options = transcriber.stub_model.calls[0]
+    assert path == str(audio)
+    assert options["language"] == "en"
+
+
+def test_transcribe_audio_to_srt_writes_timed_cues(transcriber, tmp_path):
+    audio = tmp_path / "clip.wav"
+    audio.write_bytes(b"fake audio")
+    output = tmp_path / "subs" / "clip.srt"
+
+    srt_path = asyncio.run(transcriber._transcribe_audio_to_srt(
+        audio_file_path=str(audio),
+        output_subtitle_path=str(output),
+        language="en",
+        model_name="small",
+        prompt=None
+    ))
+
+    assert srt_path == str(output)
+    srt = output.read_text(encoding="utf-8")
+    assert "00:00:00,000 --> 00:00:01,500\nHello there." in srt
+    assert "00:01:02,250 --> 00:01:04,000\nGeneral Kenobi." in srt
+    assert transcriber.loaded_sizes == ["small"]
+
+
+@pytest.mark.parametrize("name", ["local", "faster-whisper", "Local"])
+def test_factory_resolves_local_provider(name, monkeypatch):
+    monkeypatch.setenv("WHISPER_AUDIO_CACHE_ENABLED", "false")
+    transcriber = TranscriberFactory.create_transcriber(name, model_name="base")
+    try:
+        assert isinstance(transcriber, LocalWhisperTranscriber)
+        assert transcriber.model_size == "base"
+    finally:
+        transcriber.close()
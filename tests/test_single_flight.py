@@ -0,0 +1,95 @@
+"""Tests for SingleFlight request coalescing."""
+
+import asyncio
+
+import pytest
+
+from youtube_analysis.utils.single_flight import SingleFlight
+
+
+def test_concurrent_callers_share_one_fetch():
+    async def scenario():
+        flight = SingleFlight("test")
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "value"
+
+        results = await asyncio.gather(*(flight.do("k", fetch) for _ in range(3)))
+        return results, calls, flight.get_stats()
+
+    results, calls, stats = asyncio.run(scenario())
+    assert results == ["value"] * 3
+    assert calls == 1
+    assert stats == {"in_flight": 0, "executed": 1, "coalesced": 2}
+
+
+def test_cancelled_follower_does_not_affect_other_waiters():
+    async def scenario():
+        flight = SingleFlight("test")
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "value"
+
+        leader = asyncio.create_task(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        cancelled = asyncio.create_task(flight.do("k", fetch))
+        other = asyncio.create_task(flight.do("k", fetch))
+        await asyncio.sleep(0.01)
+
+        cancelled.cancel()
+        await asyncio.sleep(0.01)
+        release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        return await leader, await other
+
+    assert asyncio.run(scenario()) == ("value", "value")
+
+
+def test_cancelled_leader_hands_fetch_to_follower():
+    async def scenario():
+        flight = SingleFlight("test")
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return calls
+
+        leader = asyncio.create_task(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(flight.do("k", fetch)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        results = await asyncio.gather(*followers)
+        return results, calls
+
+    results, calls = asyncio.run(scenario())
+    # The first fetch was abandoned; one follower re-ran it and shared the result
+    assert results == [2, 2]
+    assert calls == 2
+
+
+def test_exception_propagates_to_every_waiter():
+    async def scenario():
+        flight = SingleFlight("test")
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        return await asyncio.gather(*(flight.do("k", fetch) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, ValueError) for r in results)
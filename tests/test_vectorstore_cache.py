@@ -0,0 +1,76 @@
+"""Tests for the in-memory LRU of loaded vector stores."""
+
+from types import SimpleNamespace
+
+from youtube_analysis.utils.vectorstore_cache import VectorStoreCache
+
+
+def make_store(vectors: int, dim: int = 8):
+    """Stand-in for a LangChain FAISS store: a flat float32 index with no docstore."""
+    return SimpleNamespace(index=SimpleNamespace(ntotal=vectors, d=dim, code_size=dim * 4))
+
+
+STORE_BYTES = 10 * 8 * 4  # make_store(10)
+
+
+def test_put_over_budget_evicts_least_recently_used():
+    cache = VectorStoreCache(max_bytes=2 * STORE_BYTES)
+    first, second, third = make_store(10), make_store(10), make_store(10)
+
+    cache.put("a", first)
+    cache.put("b", second)
+    assert cache.get("a") is first  # "b" is now least recently used
+    cache.put("c", third)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is first
+    assert cache.get("c") is third
+    stats = cache.get_stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["size_mb"] * 1024 * 1024 == 2 * STORE_BYTES
+
+
+def test_reput_same_key_does_not_double_count():
+    cache = VectorStoreCache(max_bytes=2 * STORE_BYTES)
+    cache.put("a", make_store(10))
+    cache.put("a", make_store(10))
+    cache.put("b", make_store(10))
+
+    stats = cache.get_stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 0
+    assert stats["size_mb"] * 1024 * 1024 == 2 * STORE_BYTES
+
+
+def test_store_larger_than_budget_is_not_cached():
+    cache = VectorStoreCache(max_bytes=STORE_BYTES)
+    cache.put("a", make_store(10))
+    cache.put("huge", make_store(100))
+
+    assert cache.get("huge") is None
+    assert cache.get("a") is not None
+
+
+def test_agents_live_and_die_with_their_store():
+    cache = VectorStoreCache(max_bytes=STORE_BYTES)
+    cache.put("a", make_store(10))
+    assert cache.set_agent("a", "agent-a")
+    assert cache.get_agent("a") == "agent-a"
+
+    cache.put("b", make_store(10))  # evicts "a" and its agent
+
+    assert cache.get_agent("a") is None
+    assert cache.set_agent("a", "agent-a") is False
+
+
+def test_invalidate_drops_store_agent_and_bytes():
+    cache = VectorStoreCache(max_bytes=STORE_BYTES)
+    cache.put("a", make_store(10))
+    cache.set_agent("a", "agent-a")
+
+    cache.invalidate("a")
+
+    assert cache.get("a") is None
+    assert cache.get_agent("a") is None
+    assert cache.get_stats()["size_mb"] == 0